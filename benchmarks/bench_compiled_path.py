@@ -0,0 +1,49 @@
+"""
+Compares reading a nested setting by chaining attributes against calling a
+``CompiledPath`` made by ``Configuration.compile_path``.
+
+Run with: ``python benchmarks/bench_compiled_path.py``
+"""
+
+from __future__ import annotations
+
+import collections.abc as tabc
+import timeit
+import typing as typ
+
+from granular_configuration_language.yaml import loads
+
+DOCUMENT = """\
+service:
+  limits:
+    rate: 100
+"""
+NUMBER = 200_000
+
+CONFIG = loads(DOCUMENT)
+MUTABLE_CONFIG = loads(DOCUMENT, mutable=True)
+RATE = CONFIG.compile_path("service.limits.rate")
+MUTABLE_RATE = MUTABLE_CONFIG.compile_path("service.limits.rate")
+
+READS: typ.Final[tabc.Mapping[str, tuple[tabc.Callable[[], typ.Any], tabc.Callable[[], typ.Any]]]] = {
+    "Configuration": (lambda: CONFIG.service.limits.rate, RATE),
+    "MutableConfiguration": (lambda: MUTABLE_CONFIG.service.limits.rate, MUTABLE_RATE),
+}
+
+
+def run() -> dict[str, tuple[float, float]]:
+    """Returns the seconds per read, chaining attributes and calling the compiled path."""
+    results = dict[str, tuple[float, float]]()
+    for label, (chained, compiled) in READS.items():
+        results[label] = (
+            min(timeit.repeat(chained, number=NUMBER, repeat=5)) / NUMBER,
+            min(timeit.repeat(compiled, number=NUMBER, repeat=5)) / NUMBER,
+        )
+    return results
+
+
+if __name__ == "__main__":
+    for label, (chained, compiled) in run().items():
+        print(label)
+        print(f"  config.service.limits.rate: {chained * 1e9:8.1f} ns/read")
+        print(f"  compiled path:              {compiled * 1e9:8.1f} ns/read ({chained / compiled:.2f}x)")
@@ -0,0 +1,80 @@
+"""
+Compares repeated reads from a loaded ``Configuration`` with the fast path (resolved in place, checked by
+type) against resolving the value on every read (the pre-2.6.0 behavior).
+
+Also checks that reads after the first allocate nothing, including reading a shared ``Configuration``
+through alternating paths.
+
+Run with: ``python benchmarks/bench_configuration_reads.py``
+"""
+
+from __future__ import annotations
+
+import collections.abc as tabc
+import timeit
+import tracemalloc
+import typing as typ
+from unittest.mock import patch
+
+from granular_configuration_language import Configuration
+from granular_configuration_language.yaml import loads
+
+DOCUMENT = """\
+service:
+  database:
+    host: localhost
+    port: 5432
+  retries: 3
+alias: !Ref $.service
+"""
+NUMBER = 200_000
+
+CONFIG: Configuration = loads(DOCUMENT)
+
+READS: typ.Final[tabc.Mapping[str, tabc.Callable[[], typ.Any]]] = {
+    "config.service.database.port": lambda: CONFIG.service.database.port,
+    'config["service"]["retries"]': lambda: CONFIG["service"]["retries"],
+    # A shared `Configuration` is renamed for each path it is read through
+    "config.service.database.port, then config.alias.database.port": lambda: (
+        CONFIG.service.database.port,
+        CONFIG.alias.database.port,
+    ),
+}
+
+
+def resolve_every_read(self: Configuration, name: typ.Any) -> typ.Any:
+    return self._Configuration__resolve(name)
+
+
+def allocated(read: tabc.Callable[[], typ.Any]) -> int:
+    read()  # The first read resolves
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(1_000):
+            read()
+        return tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def run() -> dict[str, tuple[float, float, int]]:
+    """Returns the seconds per read, without and with the fast path, and bytes still allocated after 1,000 reads."""
+    results = dict[str, tuple[float, float, int]]()
+    for label, read in READS.items():
+        fast = min(timeit.repeat(read, number=NUMBER, repeat=5)) / NUMBER
+        with (
+            patch.object(Configuration, "__getitem__", resolve_every_read),
+            patch.object(Configuration, "__getattr__", resolve_every_read),
+        ):
+            slow = min(timeit.repeat(read, number=NUMBER, repeat=5)) / NUMBER
+        results[label] = (slow, fast, allocated(read))
+    return results
+
+
+if __name__ == "__main__":
+    for label, (slow, fast, leftover) in run().items():
+        print(label)
+        print(f"  resolved every read: {slow * 1e9:8.1f} ns/read")
+        print(f"  fast path:           {fast * 1e9:8.1f} ns/read ({slow / fast:.2f}x)")
+        print(f"  allocated by 1,000 reads after the first: {leftover} bytes")
@@ -0,0 +1,42 @@
+"""
+Compares loading a small YAML document with the precompiled constructor class
+against rebuilding the constructor class for every load (the pre-2.6.0 behavior).
+
+Run with: ``python benchmarks/bench_constructor_class.py``
+"""
+
+from __future__ import annotations
+
+import timeit
+from unittest.mock import patch
+
+from granular_configuration_language.yaml import loads
+from granular_configuration_language.yaml.load import _load_yaml_string
+from granular_configuration_language.yaml.load._load_yaml_string import make_constructor_class
+
+DOCUMENT = """\
+service:
+  name: !Sub ${SERVICE_NAME:-example}
+  port: 8080
+  tags: [a, b, c]
+  database:
+    host: localhost
+    password: !Mask secret
+"""
+NUMBER = 2_000
+
+
+def run() -> tuple[float, float]:
+    precompiled = min(timeit.repeat(lambda: loads(DOCUMENT), number=NUMBER, repeat=5))
+
+    with patch.object(_load_yaml_string, "make_constructor_class", make_constructor_class.__wrapped__):
+        rebuilt = min(timeit.repeat(lambda: loads(DOCUMENT), number=NUMBER, repeat=5))
+
+    return precompiled, rebuilt
+
+
+if __name__ == "__main__":
+    precompiled, rebuilt = run()
+    print(f"rebuilt per load:  {rebuilt / NUMBER * 1e6:8.1f} µs/file")
+    print(f"precompiled:       {precompiled / NUMBER * 1e6:8.1f} µs/file")
+    print(f"saved per file:    {(rebuilt - precompiled) / NUMBER * 1e6:8.1f} µs ({rebuilt / precompiled:.2f}x)")
@@ -0,0 +1,46 @@
+"""
+Compares reads from a loaded ``Configuration`` against the same configuration
+after ``Configuration.freeze``, with a plain ``dict`` as the floor.
+
+Run with: ``python benchmarks/bench_frozen_configuration.py``
+"""
+
+from __future__ import annotations
+
+import collections.abc as tabc
+import timeit
+import typing as typ
+
+from granular_configuration_language.yaml import loads
+
+DOCUMENT = """\
+base: 100
+service:
+  limits:
+    rate: !Ref /base
+"""
+NUMBER = 200_000
+
+CONFIG = loads(DOCUMENT)
+FROZEN = CONFIG.freeze()
+PLAIN = FROZEN.as_dict()
+
+READS: typ.Final[tabc.Mapping[str, tabc.Callable[[], typ.Any]]] = {
+    "Configuration, attributes": lambda: CONFIG.service.limits.rate,
+    "Configuration, items": lambda: CONFIG["service"]["limits"]["rate"],
+    "FrozenConfiguration, attributes": lambda: FROZEN.service.limits.rate,
+    "FrozenConfiguration, items": lambda: FROZEN["service"]["limits"]["rate"],
+    "dict, items": lambda: PLAIN["service"]["limits"]["rate"],
+}
+
+
+def run() -> dict[str, float]:
+    """Returns the seconds per read."""
+    return {label: min(timeit.repeat(read, number=NUMBER, repeat=5)) / NUMBER for label, read in READS.items()}
+
+
+if __name__ == "__main__":
+    seconds = timeit.timeit(lambda: loads(DOCUMENT).freeze(), number=1_000) / 1_000
+    print(f"{'load and freeze:':34}{seconds * 1e6:8.1f} µs")
+    for label, seconds in run().items():
+        print(f"{label + ':':34}{seconds * 1e9:8.1f} ns/read")
@@ -0,0 +1,69 @@
+"""
+Measures a cold ``import granular_configuration_language``, in a fresh interpreter for every run.
+
+Fails (exit code 1) if the fastest run exceeds the recorded budget or if a deferred
+module (e.g. ``ruamel.yaml``, ``concurrent.futures``, or the bundle loader) is imported.
+
+Run with: ``python benchmarks/bench_import_time.py``
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+# Recorded budget for the fastest cold import. Raise it only with a reason.
+# Measured at about 46 ms (2.5.0: about 82 ms) on the machine that recorded it.
+BUDGET_MS = 60.0
+DEFERRED = (
+    # Third-party
+    "ruamel",
+    "jsonpath",
+    "dateutil",
+    # Standard library, only needed by loading or opt-in caches
+    "concurrent.futures",
+    "hashlib",
+    "mmap",
+    "pickle",
+    "tempfile",
+    # Only needed by loading or by features that are not used by every application
+    "granular_configuration_language._build",
+    "granular_configuration_language._compiled_path",
+    "granular_configuration_language._directory_index",
+    "granular_configuration_language._frozen_configuration",
+    "granular_configuration_language._materialize",
+    "granular_configuration_language.yaml.load._load_bundle",
+    "granular_configuration_language.yaml.load._load_json",
+    "granular_configuration_language.yaml.load._parse_cache",
+)
+REPEAT = 7
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import granular_configuration_language
+elapsed = time.perf_counter() - start
+print(json.dumps({"ms": elapsed * 1000, "modules": sorted(sys.modules)}))
+"""
+
+
+def _within(name: str, module: str) -> bool:
+    return (name == module) or name.startswith(module + ".")
+
+
+def measure() -> tuple[float, list[str]]:
+    """Returns the fastest import, in milliseconds, and the deferred modules that were imported."""
+    command = [sys.executable, "-c", _SCRIPT]
+    runs = [json.loads(subprocess.check_output(command)) for _ in range(REPEAT)]  # noqa: S603  # nosec B603
+    imported = sorted(
+        {name for run in runs for name in run["modules"] if any(_within(name, module) for module in DEFERRED)}
+    )
+    return min(run["ms"] for run in runs), imported
+
+
+if __name__ == "__main__":
+    fastest, imported = measure()
+    print(f"cold import:  {fastest:8.1f} ms (budget: {BUDGET_MS:.1f} ms)")
+    print(f"deferred modules imported: {', '.join(imported) or 'none'}")
+    sys.exit(int((fastest > BUDGET_MS) or bool(imported)))
@@ -0,0 +1,92 @@
+"""
+Compares the bytes per ``LazyEval`` (as made by a Tag), before and after it is
+evaluated, against the pre-2.6.0 protocol of a per-instance ``RLock`` and two
+``cached_property`` results, with a ``dict`` of results as the floor.
+
+Each closure holds its own Tag value, as a Tag's does, so the bytes kept once
+evaluated show whether the closure was released.
+
+Run with: ``python benchmarks/bench_lazy_eval_memory.py``
+"""
+
+from __future__ import annotations
+
+import collections.abc as tabc
+import gc
+import tracemalloc
+import typing as typ
+from functools import cached_property, partial
+from threading import RLock
+
+from granular_configuration_language.yaml.classes import Tag
+from granular_configuration_language.yaml.decorators._lazy_eval import LazyEvalBasic
+
+NUMBER = 10_000
+TAG = Tag("!Bench")
+
+
+class LockedLazyEval:
+    """``LazyEvalBasic``, as it was before 2.6.0"""
+
+    def __init__(self, tag: Tag, value: tabc.Callable[[], typ.Any]) -> None:
+        self.tag = tag
+        self.__lock: RLock | None = RLock()
+        self.__value = value
+
+    @cached_property
+    def __result(self) -> typ.Any:
+        return self.__value()
+
+    def __run(self) -> typ.Any:
+        if self.__lock is None:
+            return self.__result
+        else:
+            with self.__lock:
+                result = self.__result
+                self.__lock = None
+                return result
+
+    @cached_property
+    def result(self) -> typ.Any:
+        return self.__run()
+
+
+def _make(cls: tabc.Callable[[Tag, tabc.Callable[[], typ.Any]], typ.Any]) -> list[typ.Any]:
+    return [cls(TAG, partial(len, f"value {index}")) for index in range(NUMBER)]
+
+
+def _make_dict() -> dict[int, int]:
+    # Made as evaluated (the same `int`), so the bytes are those of the `dict`
+    return dict.fromkeys(range(NUMBER), 7)
+
+
+def _bytes_per_instance(make: tabc.Callable[[], tabc.Collection[typ.Any]]) -> tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        instances = make()
+        created = tracemalloc.get_traced_memory()[0]
+        for instance in instances:
+            _ = getattr(instance, "result", None)
+        gc.collect()
+        evaluated = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # The collection holding the instances is counted in both
+    return (created - start) / NUMBER, (evaluated - start) / NUMBER
+
+
+def run() -> dict[str, tuple[float, float]]:
+    """Returns the bytes per instance, when created and once evaluated."""
+    return {
+        "RLock and cached_property (before)": _bytes_per_instance(partial(_make, LockedLazyEval)),
+        "LazyEvalBasic (after)": _bytes_per_instance(partial(_make, LazyEvalBasic)),
+        "dict of results": _bytes_per_instance(_make_dict),
+    }
+
+
+if __name__ == "__main__":
+    print(f"{'':36}{'created':>10}{'evaluated':>12}")
+    for label, (created, evaluated) in run().items():
+        print(f"{label + ':':36}{created:8.0f} B{evaluated:10.0f} B")
@@ -0,0 +1,61 @@
+"""
+Compares typed attribute reads through ``Configuration.as_typed`` (a cast),
+``LazyLoadConfiguration.as_typed`` (a proxy, with and without ``cache_fields``),
+and ``Configuration.freeze`` against ``Configuration.materialize`` (slots).
+
+Run with: ``python benchmarks/bench_materialize.py``
+"""
+
+from __future__ import annotations
+
+import collections.abc as tabc
+import timeit
+import typing as typ
+
+from granular_configuration_language import Configuration, LazyLoadConfiguration
+from granular_configuration_language.yaml import loads
+
+DOCUMENT = """\
+service:
+  limits:
+    rate: 100
+"""
+NUMBER = 200_000
+
+
+class Limits(Configuration):
+    rate: int
+
+
+class Service(Configuration):
+    limits: Limits
+
+
+class Config(Configuration):
+    service: Service
+
+
+CONFIG = loads(DOCUMENT)
+TYPED = CONFIG.as_typed(Config)
+FROZEN = CONFIG.freeze().as_typed(Config)
+MATERIALIZED = CONFIG.materialize(Config)
+PROXY = LazyLoadConfiguration(inject_after=CONFIG).as_typed(Config)
+VIEW = LazyLoadConfiguration(inject_after=CONFIG).as_typed(Config, cache_fields=True)
+
+READS: typ.Final[tabc.Mapping[str, tabc.Callable[[], typ.Any]]] = {
+    "as_typed": lambda: TYPED.service.limits.rate,
+    "LLC as_typed": lambda: PROXY.service.limits.rate,
+    "LLC as_typed, cache_fields": lambda: VIEW.service.limits.rate,
+    "freeze().as_typed": lambda: FROZEN.service.limits.rate,
+    "materialize": lambda: MATERIALIZED.service.limits.rate,
+}
+
+
+def run() -> dict[str, float]:
+    """Returns the seconds per read of ``service.limits.rate``."""
+    return {label: min(timeit.repeat(read, number=NUMBER, repeat=5)) / NUMBER for label, read in READS.items()}
+
+
+if __name__ == "__main__":
+    for label, seconds in run().items():
+        print(f"{label + ':':30}{seconds * 1e9:8.1f} ns/read")
@@ -0,0 +1,44 @@
+"""
+Compares parsing a large, machine-generated YAML document with each available parser backend.
+
+Run with: ``python benchmarks/bench_yaml_backends.py``
+"""
+
+from __future__ import annotations
+
+import os
+import timeit
+from unittest.mock import patch
+
+from granular_configuration_language.yaml import loads
+from granular_configuration_language.yaml.load._backends import _BACKENDS, YAML_BACKEND_ENV
+
+DOCUMENT = "\n".join(
+    f"""\
+service_{i}:
+  name: service-{i}
+  port: {8000 + i}
+  enabled: true
+  ratio: {i / 7:.4f}
+  tags: [a, b, c, "{i}"]
+  url: !Sub http://${{/service_{i}/name}}:${{/service_{i}/port}}
+"""
+    for i in range(2_000)
+)
+NUMBER = 3
+
+
+def run() -> dict[str, float]:
+    results = dict()
+    for name, backend in _BACKENDS.items():
+        if backend.is_available():
+            with patch.dict(os.environ, values={YAML_BACKEND_ENV: name}):
+                results[name] = min(timeit.repeat(lambda: loads(DOCUMENT), number=NUMBER, repeat=3)) / NUMBER
+    return results
+
+
+if __name__ == "__main__":
+    results = run()
+    baseline = results["ruamel"]
+    for name, seconds in results.items():
+        print(f"{name:12} {seconds * 1e3:8.1f} ms/file ({baseline / seconds:.2f}x)")
@@ -0,0 +1,82 @@
+"""
+Compares time and allocations per parse with pooled ``YAML`` instances against making a new
+instance for every parse (the pre-2.6.0 behavior).
+
+Covers a small document with `!ParseEnvSafe` (a ``YAML(typ="safe")`` load) and a `!ParseEnv`
+(a nested load, constructed by a ``_StatefulYAML``).
+
+Run with: ``python benchmarks/bench_yaml_pool.py``
+"""
+
+from __future__ import annotations
+
+import os
+import timeit
+import tracemalloc
+import typing as typ
+from unittest.mock import patch
+
+from ruamel.yaml import YAML
+
+from granular_configuration_language.yaml import loads
+from granular_configuration_language.yaml.load import _yaml_pool
+
+DOCUMENT = """\
+safe: !ParseEnvSafe BENCH_YAML_POOL
+tagged: !ParseEnv BENCH_YAML_POOL
+"""
+NUMBER = 1_000
+
+
+def parse() -> None:
+    config = loads(DOCUMENT)
+    _ = config.safe, config.tagged
+
+
+def no_pool(mode: str, constructor_class: type, factory: typ.Callable[[], typ.Any]) -> typ.Any:
+    return factory()
+
+
+def measure() -> tuple[float, float, float]:
+    """Returns seconds, peak bytes allocated, and ``YAML`` instances made, per parse."""
+    parse()  # Warm up imports and caches
+    seconds = min(timeit.repeat(parse, number=NUMBER, repeat=5)) / NUMBER
+
+    made = 0
+    yaml_init = YAML.__init__
+
+    def counting_init(self: YAML, *args: typ.Any, **kwargs: typ.Any) -> None:
+        nonlocal made
+        made += 1
+        yaml_init(self, *args, **kwargs)
+
+    peak = 0
+    tracemalloc.start()
+    try:
+        with patch.object(YAML, "__init__", counting_init):
+            for _ in range(100):
+                current = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                parse()
+                peak += tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+
+    return seconds, peak / 100, made / 100
+
+
+def run() -> tuple[tuple[float, float, float], tuple[float, float, float]]:
+    with patch.dict(os.environ, values={"BENCH_YAML_POOL": "{a: 1, b: [1, 2], c: {d: e}}"}):
+        pooled = measure()
+        with patch.object(_yaml_pool, "acquire", no_pool):
+            unpooled = measure()
+    return pooled, unpooled
+
+
+if __name__ == "__main__":
+    pooled, unpooled = run()
+    for name, (seconds, peak, made) in (("new instance per parse", unpooled), ("pooled", pooled)):
+        print(
+            f"{name + ':':24}{seconds * 1e6:8.1f} µs/parse  {peak / 1024:8.1f} KiB peak/parse  {made:4.1f} YAML/parse"
+        )
+    print(f"saved per parse:        {(unpooled[0] - pooled[0]) * 1e6:8.1f} µs ({unpooled[0] / pooled[0]:.2f}x)")
@@ -1,5 +1,7 @@
 # isort:skip_file
 # Order Matters
+import typing as typ
+
 from granular_configuration_language.yaml import Masked, Placeholder
 from granular_configuration_language._configuration import Configuration, MutableConfiguration
 import granular_configuration_language.proxy
@@ -10,3 +12,20 @@ from granular_configuration_language._lazy_load_configuration import (
 from granular_configuration_language._mutable_lazy_load_configuration import MutableLazyLoadConfiguration
 from granular_configuration_language._merge import merge
 from granular_configuration_language._json import json_default
+
+if typ.TYPE_CHECKING:
+    from granular_configuration_language._compiled_path import CompiledPath
+    from granular_configuration_language._frozen_configuration import FrozenConfiguration
+else:
+
+    def __getattr__(name: str) -> typ.Any:
+        # Imported on first use, to keep importing the package fast
+        if name == "CompiledPath":
+            from granular_configuration_language._compiled_path import CompiledPath as value
+        elif name == "FrozenConfiguration":
+            from granular_configuration_language._frozen_configuration import FrozenConfiguration as value
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+        globals()[name] = value
+        return value
@@ -21,3 +21,19 @@ def read_base_path(base_path: str | tabc.Sequence[str] | None) -> BasePath:
         return BasePath(map(BasePathPart, base_path))
     else:
         return BasePath()
+
+
+def common_base_path(base_paths: tabc.Iterable[BasePath]) -> BasePath:
+    """Longest Base Path that every one of ``base_paths`` starts with."""
+    common: BasePath | None = None
+    for base_path in base_paths:
+        if common is None:
+            common = base_path
+        else:
+            length = 0
+            for a, b in zip(common, base_path, strict=False):
+                if a != b:
+                    break
+                length += 1
+            common = BasePath(common[:length])
+    return common or BasePath()
@@ -6,16 +6,26 @@ from functools import partial
 from pathlib import Path
 
 from granular_configuration_language import Configuration
+from granular_configuration_language._base_path import BasePath
 from granular_configuration_language._configuration import C
 from granular_configuration_language._s import setter_secret
 from granular_configuration_language._utils import consume
 from granular_configuration_language.yaml import LazyRoot
+from granular_configuration_language.yaml.decorators._lazy_eval import LazySubtree
 from granular_configuration_language.yaml.file_ops.text import load_text_file
-from granular_configuration_language.yaml.load import load_file, obj_pairs_func
+from granular_configuration_language.yaml.load import ComposedFile, compose_file, obj_pairs_func
+from granular_configuration_language.yaml.load._load_file import BUNDLE_FILE_EXTENSION
+from granular_configuration_language.yaml.load._loads import ComposedDocument
+from granular_configuration_language.yaml.load._parse_cache import ParseCache
+
+MAX_PARALLEL_LOAD_WORKERS: typ.Final = 8
 
 
 def _merge_into_base(configuration_type: type[C], base_dict: C, from_dict: C) -> None:
     for key, value in from_dict._raw_items():  # noqa: SLF001
+        if isinstance(value, LazySubtree) and (key in base_dict):
+            value = value.result  # Read or construct the mapping, so it can merge
+
         if isinstance(value, configuration_type) and (key in base_dict):
             if base_dict.exists(key):
                 new_dict = base_dict[key]
@@ -34,18 +44,87 @@ def _merge(configuration_type: type[C], base_config: C, configs: tabc.Iterable[C
     return base_config
 
 
+def _map_in_parallel(func: tabc.Callable[[Path], typ.Any], locations: tabc.Iterable[Path]) -> tabc.Iterator[typ.Any]:
+    locations = tuple(locations)
+    if len(locations) < 2:
+        yield from map(func, locations)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(min(len(locations), MAX_PARALLEL_LOAD_WORKERS), thread_name_prefix="gcl-load") as executor:
+        # Results are yielded in `locations` order. The first error (in that order) is raised and the rest are cancelled.
+        yield from executor.map(func, locations)
+
+
+def _compose_files(
+    locations: tabc.Iterable[Path],
+    lazy_root: LazyRoot,
+    mutable: bool,
+    parallel_load: bool,
+    base_path: BasePath | None = None,
+) -> tuple[list[ComposedFile], Exception | None]:
+    _compose_file = partial(
+        compose_file, lazy_root=lazy_root, mutable=mutable, parse_cache=ParseCache.from_environment()
+    )
+
+    def read_and_compose(location: Path) -> ComposedFile:
+        if location.suffix == BUNDLE_FILE_EXTENSION:
+            from granular_configuration_language.yaml.load._load_bundle import BundleDocument
+
+            return ComposedFile(
+                location,
+                BundleDocument(location, lazy_root=lazy_root, mutable=mutable, base_path=base_path or BasePath()),
+            )
+        else:
+            return _compose_file(load_text_file(location))
+
+    if parallel_load:
+        composed = _map_in_parallel(read_and_compose, locations)
+    else:
+        composed = map(read_and_compose, locations)
+
+    # An error is held until the files before it are constructed, matching the order of one-at-a-time loading.
+    files = list[ComposedFile]()
+    try:
+        for file in composed:
+            files.append(file)
+    except Exception as e:
+        return files, e
+    else:
+        return files, None
+
+
 def _load_configs_from_locations(
-    configuration_type: type[C], locations: tabc.Iterable[Path], lazy_root: LazyRoot, mutable: bool
+    configuration_type: type[C],
+    locations: tabc.Iterable[Path],
+    lazy_root: LazyRoot,
+    mutable: bool,
+    parallel_load: bool = False,
+    inject_after: Configuration | None = None,
+    base_path: BasePath | None = None,
 ) -> tabc.Iterator[C]:
-    def configuration_only(
-        configs: tabc.Iterable[C | typ.Any],
-    ) -> tabc.Iterator[C]:
-        for config in configs:
-            if isinstance(config, configuration_type):
-                yield config
+    # Phase 1: Parse every file, so the key structure of every layer is known
+    files, error = _compose_files(locations, lazy_root, mutable, parallel_load, base_path)
+
+    # Phase 2: Drop values that a later layer overrides, and what cannot be read from `base_path`.
+    #          Then construct what survives.
+    # JSON documents and bundles are already built, so there is nothing to prune
+    documents = [file.document for file in files if isinstance(file.document, ComposedDocument)]
+    # Both walk parsed nodes, so they are imported once YAML has been parsed
+    from granular_configuration_language._overrides import prune_overridden
+    from granular_configuration_language._scope import scope_to_base_path
+
+    prune_overridden(documents, inject_after=inject_after)
+    scope_to_base_path(documents, base_path)
+
+    for file in files:
+        config = file.construct()
+        if isinstance(config, configuration_type):
+            yield config
 
-    _load_file = partial(load_file, lazy_root=lazy_root, mutable=mutable)
-    return configuration_only(map(_load_file, map(load_text_file, locations)))
+    if error is not None:
+        raise error
 
 
 def _inject_configs(
@@ -69,13 +148,23 @@ def build_configuration(
     *,
     inject_before: Configuration | None,
     inject_after: Configuration | None,
+    parallel_load: bool = False,
+    base_path: BasePath | None = None,
 ) -> Configuration:
     configuration_type = obj_pairs_func(mutable)
     base_config = configuration_type()
     lazy_root = LazyRoot.with_root(base_config)
 
     valid_configs = _inject_configs(
-        _load_configs_from_locations(configuration_type, locations, lazy_root, mutable),
+        _load_configs_from_locations(
+            configuration_type,
+            locations,
+            lazy_root,
+            mutable,
+            parallel_load,
+            inject_after=inject_after,
+            base_path=base_path,
+        ),
         before=inject_before,
         after=inject_after,
     )
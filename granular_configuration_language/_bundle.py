@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import io
+import marshal
+import typing as typ
+from collections import Counter
+from copy import copy
+from datetime import date, datetime, timedelta, timezone
+from functools import cache
+from pathlib import Path
+
+from ruamel.yaml import MappingNode, Node, SafeConstructor, ScalarNode, SequenceNode
+from ruamel.yaml import __version__ as ruamel_version
+
+from granular_configuration_language._base_path import BasePath
+from granular_configuration_language._build import _compose_files
+from granular_configuration_language._configuration import Configuration
+from granular_configuration_language._locations import Locations
+from granular_configuration_language._overrides import prune_overridden
+from granular_configuration_language._scope import scope_to_base_path
+from granular_configuration_language._utils import write_atomically
+from granular_configuration_language.yaml.classes import LazyRoot, Placeholder
+from granular_configuration_language.yaml.load._backends import YAMLVersion, _StatefulYAML
+from granular_configuration_language.yaml.load._constructors import ExtendedSafeConstructor
+from granular_configuration_language.yaml.load._load_bundle import (
+    DATE,
+    DATETIME,
+    DICT,
+    FORMAT_VERSION,
+    LIST,
+    MAPPING_NODE,
+    MARSHAL_VERSION,
+    MERGED,
+    PLACEHOLDER,
+    PLAIN_TYPES,
+    REF,
+    SCALAR_NODE,
+    SEQUENCE_NODE,
+    SET,
+    SUBTREE,
+    TAGGED,
+    TUPLE,
+    BundleHeader,
+    Merged,
+    Subtree,
+    Tagged,
+    dump_bundle,
+)
+from granular_configuration_language.yaml.load._load_file import BUNDLE_FILE_EXTENSION, _wrap_errors
+from granular_configuration_language.yaml.load._load_yaml_string import make_constructor_class
+from granular_configuration_language.yaml.load._loads import ComposedDocument
+
+# Mappings with at least this many values are stored on their own, so they are only read when first accessed
+MIN_SUBTREE_SIZE = 64
+
+_Deferred: typ.TypeAlias = Tagged | Merged
+_Container: typ.Final = (dict, list, tuple, Merged, Tagged)
+
+
+def _describe(constructor: SafeConstructor, node: Node) -> Tagged:
+    return Tagged(-1, node)  # The layer is set once the document is described
+
+
+@cache
+def _describing_constructor_class(mutable: bool) -> type[ExtendedSafeConstructor]:
+    # Same as the loading constructor class, except lazy Tags are kept as their nodes
+    from granular_configuration_language.yaml._tags import handlers
+
+    class DescribingConstructor(ExtendedSafeConstructor):
+        yaml_constructors = copy(make_constructor_class(mutable, handlers).yaml_constructors)
+
+    for handler in handlers:
+        if not handler.attributes.is_not_lazy:
+            DescribingConstructor.add_constructor(handler.tag, _describe)
+
+    return DescribingConstructor
+
+
+def _describe_document(document: ComposedDocument) -> typ.Any:
+    yaml = _StatefulYAML(state=document.state, version=document.version)
+    yaml.Constructor = _describing_constructor_class(document.state.options.mutable)
+    return yaml.construct(document.node)
+
+
+def _as_plain(value: typ.Any, layer: int, memo: dict[int, typ.Any]) -> typ.Any:
+    # `Configuration` becomes `dict` (it is rebuilt when read) and each `Tagged` learns its layer
+    if id(value) in memo:
+        return memo[id(value)]
+    elif isinstance(value, Configuration):
+        memo[id(value)] = mapping = dict()
+        for key, item in value._raw_items():  # noqa: SLF001
+            if isinstance(key, Tagged):
+                raise TypeError("Lazy Tags are not allowed as keys to mappings.")
+            mapping[key] = _as_plain(item, layer, memo)
+        return mapping
+    elif isinstance(value, list):
+        memo[id(value)] = sequence = list[typ.Any]()
+        sequence.extend(_as_plain(item, layer, memo) for item in value)
+        return sequence
+    elif isinstance(value, tuple):
+        memo[id(value)] = frozen = tuple(_as_plain(item, layer, memo) for item in value)
+        return frozen
+    elif isinstance(value, Tagged):
+        value.layer = layer
+        return value
+    else:
+        return value
+
+
+def _merge_into_base(base: dict, later: dict) -> None:
+    # Same rules as building, except Tags are not evaluated.
+    for key, value in later.items():
+        if isinstance(value, dict) and (key in base):
+            earlier = base[key]
+            if isinstance(earlier, _Deferred):
+                # A Tag may evaluate to a mapping to merge with, so merging waits until it is read
+                value = Merged((*earlier.parts, value) if isinstance(earlier, Merged) else (earlier, value))
+            else:
+                new_dict = dict() if isinstance(earlier, Placeholder) else earlier
+                if isinstance(new_dict, dict):
+                    _merge_into_base(new_dict, value)
+                    value = new_dict
+
+        base[key] = value
+
+
+def _count_references(tree: dict) -> Counter[int]:
+    references = Counter[int]()
+    stack: list[typ.Any] = [tree]
+    while stack:
+        value = stack.pop()
+        if not isinstance(value, _Container):
+            continue
+        references[id(value)] += 1
+        if references[id(value)] > 1:
+            continue
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list | tuple):
+            stack.extend(value)
+        elif isinstance(value, Merged):
+            stack.extend(value.parts)
+    return references
+
+
+def _encode(value: typ.Any, refs: dict[int, int]) -> typ.Any:  # noqa: C901
+    # Writes `value` as plain data. See `_load_bundle` for the layout.
+    if type(value) in PLAIN_TYPES:
+        return value
+    elif (ref := refs.get(id(value))) is not None:
+        return (REF, ref)
+    elif isinstance(value, dict):
+        refs[id(value)] = ref = len(refs)
+        return (DICT, ref, tuple((_encode(key, refs), _encode(item, refs)) for key, item in value.items()))
+    elif isinstance(value, list):
+        refs[id(value)] = ref = len(refs)
+        return (LIST, ref, tuple(_encode(item, refs) for item in value))
+    elif isinstance(value, tuple):
+        refs[id(value)] = ref = len(refs)
+        return (TUPLE, ref, tuple(_encode(item, refs) for item in value))
+    elif isinstance(value, set | frozenset):
+        return (SET, tuple(_encode(item, refs) for item in value))
+    elif type(value) is datetime:
+        if value.tzinfo is None:
+            return (DATETIME, value.timetuple()[:6] + (value.microsecond,), None, None)
+        elif isinstance(value.tzinfo, timezone):
+            offset = typ.cast("timedelta", value.utcoffset())
+            return (DATETIME, value.timetuple()[:6] + (value.microsecond,), offset.total_seconds(), value.tzname())
+    elif type(value) is date:
+        return (DATE, value.year, value.month, value.day)
+    elif isinstance(value, Placeholder):
+        return (PLACEHOLDER, value.message)
+    elif isinstance(value, Tagged):
+        refs[id(value)] = ref = len(refs)
+        return (TAGGED, ref, value.layer, _encode_node(value.node, refs))
+    elif isinstance(value, Merged):
+        refs[id(value)] = ref = len(refs)
+        return (MERGED, ref, tuple(_encode(part, refs) for part in value.parts))
+    elif isinstance(value, Subtree):
+        return (SUBTREE, value.offset, value.length)
+
+    raise TypeError(f"`{type(value).__name__}` values cannot be compiled into a bundle")
+
+
+def _encode_node(node: Node, refs: dict[int, int]) -> tuple:
+    # Marks are only used in error messages, so they are not kept
+    if (ref := refs.get(id(node))) is not None:
+        return (REF, ref)
+
+    refs[id(node)] = ref = len(refs)
+    if isinstance(node, ScalarNode):
+        return (SCALAR_NODE, ref, node.tag, node.value, node.style)
+    elif isinstance(node, SequenceNode):
+        return (SEQUENCE_NODE, ref, node.tag, tuple(_encode_node(child, refs) for child in node.value), node.flow_style)
+    elif isinstance(node, MappingNode):
+        pairs = tuple((_encode_node(key, refs), _encode_node(item, refs)) for key, item in node.value)
+        return (MAPPING_NODE, ref, node.tag, pairs, node.flow_style)
+    else:
+        raise TypeError(f"`{type(node).__name__}` nodes cannot be compiled into a bundle")
+
+
+class _Writer:
+    __slots__ = ("body", "references", "seen")
+
+    def __init__(self, tree: dict) -> None:
+        self.body = io.BytesIO()
+        self.references = _count_references(tree)
+        self.seen = dict[int, tuple[int, bool]]()
+
+    def write(self, value: dict) -> Subtree:
+        data = marshal.dumps(_encode(value, dict()), MARSHAL_VERSION)
+        offset = self.body.tell()
+        self.body.write(data)
+        return Subtree(offset, len(data))
+
+    def pack(self, value: typ.Any) -> tuple[int, bool]:
+        """
+        Moves large mappings under ``value`` into their own subtrees.
+
+        :return: Number of values left in ``value`` and whether anything in it is shared through an alias.
+            Anything shared must stay in one subtree, so that it stays shared when read.
+        """
+        if not isinstance(value, _Container):
+            return 1, False
+        elif id(value) in self.seen:
+            return self.seen[id(value)]
+
+        self.seen[id(value)] = (0, True)  # Recursive aliases
+        size = 1
+        shared = self.references[id(value)] > 1
+
+        if isinstance(value, dict):
+            for key, item in value.items():
+                item_size, item_shared = self.pack(item)
+                if isinstance(item, dict) and (not item_shared) and (item_size >= MIN_SUBTREE_SIZE):
+                    value[key] = self.write(item)
+                    item_size = 1
+                size += item_size
+                shared |= item_shared
+        elif isinstance(value, list | tuple | Merged):
+            for item in value.parts if isinstance(value, Merged) else value:
+                item_size, item_shared = self.pack(item)
+                size += item_size
+                shared |= item_shared
+
+        self.seen[id(value)] = (size, shared)
+        return size, shared
+
+
+def compile_bundle(
+    locations: Locations,
+    output: Path,
+    *,
+    base_path: BasePath | None = None,
+    mutable: bool = False,
+) -> int:
+    """
+    Compiles ``locations`` into a bundle that :py:class:`.LazyLoadConfiguration` loads without parsing or merging.
+
+    Files are parsed, pruned, and merged exactly as loading them would. Tags are not run. They are stored
+    as their nodes and constructed when the bundle is read, so their results are never baked in.
+
+    :param Locations locations: Locations to compile, in load order
+    :param ~pathlib.Path output: Bundle to write. Must have the bundle file extension.
+    :param BasePath | None base_path: Only what can be read from this Base Path is kept.
+    :param bool mutable: Compile for :py:class:`.MutableLazyLoadConfiguration`
+    :return: Number of files compiled
+    """
+    if output.suffix != BUNDLE_FILE_EXTENSION:
+        raise ValueError(f"Bundles must use the `{BUNDLE_FILE_EXTENSION}` file extension. Got: `{output.name}`")
+
+    paths = tuple(locations)
+    if any(path.suffix == BUNDLE_FILE_EXTENSION for path in paths):
+        raise ValueError("Bundles cannot be compiled into a bundle")
+
+    files, error = _compose_files(paths, LazyRoot(), mutable, parallel_load=False)
+    if error is not None:
+        raise error
+
+    documents = [file.document for file in files if isinstance(file.document, ComposedDocument)]
+    prune_overridden(documents, inject_after=None)
+    scope_to_base_path(documents, base_path)
+
+    tree: dict = dict()
+    layers = list[tuple[str, YAMLVersion | None]]()
+    for file in files:
+        with _wrap_errors(file.filename):
+            document = file.document
+            if isinstance(document, ComposedDocument):
+                value = _describe_document(document)
+                if isinstance(value, Tagged):
+                    raise TypeError("A Tag at the root of a document cannot be compiled")
+                layer = len(layers)
+                layers.append((str(document.state.options.file_location), document.version))
+            else:
+                value = document.construct()
+                layer = -1
+
+            if isinstance(value, Configuration):
+                _merge_into_base(tree, _as_plain(value, layer, dict()))
+
+    writer = _Writer(tree)
+    writer.pack(tree)
+    root = writer.write(tree)
+
+    header = BundleHeader(
+        format_version=FORMAT_VERSION,
+        ruamel_version=ruamel_version,
+        mutable=mutable,
+        base_path=tuple(map(str, base_path or ())),
+        layers=tuple(layers),
+        root=(root.offset, root.length),
+    )
+    write_atomically(output, dump_bundle(header, writer.body.getvalue()))
+    return len(files)
@@ -7,12 +7,11 @@ import typing as typ
 from collections import deque
 from contextlib import suppress
 from functools import cached_property, reduce
-from threading import Lock
+from threading import Lock, RLock
 from weakref import WeakValueDictionary
 
 from granular_configuration_language import Configuration
-from granular_configuration_language._base_path import BasePath, read_base_path
-from granular_configuration_language._build import build_configuration
+from granular_configuration_language._base_path import BasePath, common_base_path, read_base_path
 from granular_configuration_language._locations import Locations
 
 
@@ -22,11 +21,38 @@ class SharedConfigurationReference:
     _mutable_config: bool
     _inject_before: Configuration | None = None
     _inject_after: Configuration | None = None
+    _parallel_load: bool = False
     __lock: Lock | None = dataclasses.field(repr=False, compare=False, init=False, default_factory=Lock)
     __notes: deque[NoteOfIntentToRead] = dataclasses.field(repr=False, compare=False, init=False, default_factory=deque)
+    # Guards `__notes` and `__scope`. Reentrant, as a note registers itself.
+    __notes_lock: RLock = dataclasses.field(repr=False, compare=False, init=False, default_factory=RLock)
+    __scope: BasePath | None = dataclasses.field(repr=False, compare=False, init=False, default=None)
 
     def register(self, note: NoteOfIntentToRead) -> None:
-        self.__notes.append(note)
+        with self.__notes_lock:
+            self.__notes.append(note)
+
+    @property
+    def is_loading(self) -> bool:
+        # Building has started, but not finished
+        return (self.__lock is not None) and self.__lock.locked()
+
+    def join(self, base_path: BasePath) -> NoteOfIntentToRead | None:
+        # Checked and registered under one lock, so a build cannot be scoped in between.
+        with self.__notes_lock:
+            if self.__can_read(base_path):
+                return NoteOfIntentToRead(_base_path=base_path, _config_ref=self)
+            else:
+                return None
+
+    def __can_read(self, base_path: BasePath) -> bool:
+        # Once loading starts, the build is scoped to the Base Paths registered so far.
+        if self.__scope is None:
+            return True  # Not started, so the build will include `base_path`
+        elif self.__lock is not None:
+            return False  # Loading (or failed to load)
+        else:
+            return base_path[: len(self.__scope)] == self.__scope
 
     def __clear_notes(self, caller: NoteOfIntentToRead) -> None:
         while self.__notes:
@@ -38,6 +64,9 @@ class SharedConfigurationReference:
         # Making cached_property thread-safe
         if self.__lock:
             with self.__lock:
+                with self.__notes_lock:
+                    if self.__scope is None:
+                        self.__scope = common_base_path(note._base_path for note in self.__notes)  # noqa: SLF001
                 self.__config  # noqa: B018
                 self.__lock = None
                 self.__clear_notes(caller)
@@ -46,8 +75,15 @@ class SharedConfigurationReference:
 
     @cached_property
     def __config(self) -> Configuration:
+        from granular_configuration_language._build import build_configuration
+
         return build_configuration(
-            self._locations, self._mutable_config, inject_after=self._inject_after, inject_before=self._inject_before
+            self._locations,
+            self._mutable_config,
+            inject_after=self._inject_after,
+            inject_before=self._inject_before,
+            parallel_load=self._parallel_load,
+            base_path=self.__scope or BasePath(),
         )
 
 
@@ -79,7 +115,11 @@ class NoteOfIntentToRead:
                 del self._config_ref
 
 
-store: typ.Final[WeakValueDictionary[Locations, SharedConfigurationReference]] = WeakValueDictionary()
+# Keyed by `parallel_load` too, so the setting is never dropped by sharing a build
+store: typ.Final[WeakValueDictionary[tuple[Locations, bool], SharedConfigurationReference]] = WeakValueDictionary()
+
+
+_store_lock: typ.Final = Lock()
 
 
 def prepare_to_load_configuration(
@@ -90,18 +130,26 @@ def prepare_to_load_configuration(
     disable_cache: bool,
     inject_before: Configuration | None,
     inject_after: Configuration | None,
+    parallel_load: bool = False,
 ) -> NoteOfIntentToRead:
+    read_path = read_base_path(base_path)
     if disable_cache or mutable_configuration or inject_after or inject_before:
         shared_config_ref = SharedConfigurationReference(
             _locations=locations,
             _mutable_config=mutable_configuration,
             _inject_after=inject_after,
             _inject_before=inject_before,
+            _parallel_load=parallel_load,
         )
-    elif locations not in store:
-        shared_config_ref = SharedConfigurationReference(_locations=locations, _mutable_config=mutable_configuration)
-        store[locations] = shared_config_ref
-    else:
-        shared_config_ref = store[locations]
+        return NoteOfIntentToRead(_base_path=read_path, _config_ref=shared_config_ref)
+
+    key = (locations, parallel_load)
+    with _store_lock:
+        if ((shared := store.get(key)) is not None) and (note := shared.join(read_path)):
+            return note
 
-    return NoteOfIntentToRead(_base_path=read_base_path(base_path), _config_ref=shared_config_ref)
+        shared_config_ref = SharedConfigurationReference(
+            _locations=locations, _mutable_config=mutable_configuration, _parallel_load=parallel_load
+        )
+        store[key] = shared_config_ref
+        return NoteOfIntentToRead(_base_path=read_path, _config_ref=shared_config_ref)
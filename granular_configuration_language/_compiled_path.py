@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import collections.abc as tabc
+import typing as typ
+
+from granular_configuration_language._configuration import Configuration, MutableConfiguration, mutations
+
+_STATIC: typ.Final = -1  # Nothing on the path can change
+
+
+def read_path(path: str | tabc.Sequence[typ.Any]) -> tuple[typ.Any, ...]:
+    if not isinstance(path, str):
+        return tuple(path)
+    elif path.startswith("/"):
+        # JSON Pointer (RFC 6901)
+        return tuple(part.replace("~1", "/").replace("~0", "~") for part in path[1:].split("/"))
+    elif path:
+        return tuple(path.split("."))
+    else:
+        return tuple()
+
+
+def _index(container: typ.Any, key: typ.Any) -> typ.Any:
+    # Path strings only hold `str` keys, so sequences are indexed by digits
+    if isinstance(key, str) and key.isdecimal() and isinstance(container, tabc.Sequence):
+        return int(key)
+    else:
+        return key
+
+
+class CompiledPath:
+    """
+    .. versionadded:: 2.6.0
+
+    A reusable getter for the value at a key path, made by
+    :py:meth:`.Configuration.compile_path` or
+    :py:meth:`.LazyLoadConfiguration.compile_path`.
+
+    The path is read on the first call, just as chaining
+    :py:meth:`~object.__getitem__` would, so errors are raised from the call.
+    Later calls return the value read, without walking the path again.
+
+    .. admonition:: Mutable Configurations
+        :class: note
+        :collapsible: closed
+
+        If the path passes through a :py:class:`.MutableConfiguration`, the path
+        is read again after any :py:class:`.MutableConfiguration` has changed.
+
+        If the path passes through a :py:class:`list` (or any other container
+        that is not a Configuration or :py:class:`tuple`), the path is read on
+        every call, as changes to it cannot be seen.
+
+    :example:
+        .. code-block:: python
+
+            RATE = CONFIG.compile_path("service.limits.rate")
+
+
+            def handle() -> None:
+                limit(RATE())
+    """
+
+    __slots__ = ("__generation", "__load", "__path", "__value")
+
+    def __init__(self, load: tabc.Callable[[], Configuration], path: str | tabc.Sequence[typ.Any]) -> None:
+        self.__load = load
+        self.__path = read_path(path)
+        self.__generation: int | None = None  # `None` until read
+        self.__value: typ.Any = None
+
+    @property
+    def path(self) -> tuple[typ.Any, ...]:
+        """Keys read, in order"""
+        return self.__path
+
+    def __call__(self) -> typ.Any:
+        generation = self.__generation
+        if (generation == _STATIC) or (generation == mutations.count):
+            return self.__value
+        else:
+            return self.__read()
+
+    def __read(self) -> typ.Any:
+        generation: int | None = mutations.count  # Before reading, so changes made while reading are not missed
+        value: typ.Any = self.__load()
+        static = True
+        for key in self.__path:
+            if isinstance(value, MutableConfiguration):
+                static = False
+            elif not isinstance(value, Configuration | tuple):
+                generation = None  # Changes to other containers (e.g. `list`) are not counted
+            value = value[_index(value, key)]
+
+        self.__value = value
+        self.__generation = _STATIC if static and (generation is not None) else generation
+        return value
+
+    def __repr__(self) -> str:
+        return f"<CompiledPath: {self.__path!r}>"
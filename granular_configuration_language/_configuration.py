@@ -13,6 +13,10 @@ from granular_configuration_language._s import setter_secret
 from granular_configuration_language.exceptions import InvalidBasePathException, PlaceholderConfigurationError
 from granular_configuration_language.yaml.classes import KT, RT, VT, LazyEval, P, Placeholder, T
 
+if typ.TYPE_CHECKING:
+    from granular_configuration_language._compiled_path import CompiledPath
+    from granular_configuration_language._frozen_configuration import FrozenConfiguration
+
 if sys.version_info >= (3, 12):
     from typing import override
 elif typ.TYPE_CHECKING:
@@ -158,7 +162,8 @@ class Configuration(typ.Generic[KT, VT], tabc.Mapping[KT, VT]):
         :py:data:`~typing.Any`, instead of :py:class:`str`.)
     """
 
-    __slots__ = ("__data", "__attribute_name")
+    # `__parent` and `__key` are where this was last read from. Its name is derived from them when needed.
+    __slots__ = ("__data", "__key", "__parent", "__weakref__")
 
     @typ.overload
     def __init__(self) -> None: ...
@@ -174,7 +179,8 @@ class Configuration(typ.Generic[KT, VT], tabc.Mapping[KT, VT]):
 
     def __init__(self, *arg: tabc.Mapping[KT, VT] | tabc.Iterable[tuple[KT, VT]], **kwargs: VT) -> None:
         self.__data: dict[typ.Any, typ.Any] = dict(*arg, **kwargs)
-        self.__attribute_name = AttributeName.as_root()
+        self.__key: typ.Any = "$"
+        self.__parent: ReferenceType[Configuration] | None = None
 
     #################################################################
     # Required for Mapping
@@ -190,6 +196,27 @@ class Configuration(typ.Generic[KT, VT], tabc.Mapping[KT, VT]):
 
     @override
     def __getitem__(self, name: KT) -> VT:
+        # `LazyEval` results replace them in `__data`, so reads after the first are a lookup and a type check.
+        try:
+            value = self.__data[name]
+        except KeyError:
+            return self.__resolve(name)
+
+        cls = type(value)
+        if cls in _plain_types:
+            return value
+        elif cls in _configuration_types:
+            parent = ref(self)  # Reuses this instance's weakref
+            if (value.__parent is not parent) or (value.__key is not name):  # noqa: SLF001
+                value.__parent, value.__key = parent, name  # noqa: SLF001  # Read through another path since
+            return value
+        else:
+            return self.__resolve(name)
+
+    def __resolve(self, name: KT) -> VT:
+        # Raises for missing keys and `Placeholder`, evaluates `LazyEval` (keeping the result in its place),
+        # names a `Configuration`, and records the type of the value, so later reads skip this.
+        # Naming only records this instance and `name`.
         try:
             value = self.__data[name]
         except KeyError:
@@ -216,10 +243,21 @@ class Configuration(typ.Generic[KT, VT], tabc.Mapping[KT, VT]):
             )
 
         if isinstance(value, Configuration):
-            value.__attribute_name = self.__attribute_name.append_suffix(name)  # noqa: SLF001
-            return value  # type: ignore  # instead of casting
+            value.__parent, value.__key = ref(self), name  # noqa: SLF001
+            _configuration_types.add(type(value))
         else:
-            return value
+            _plain_types.add(type(value))
+
+        return value
+
+    @property
+    def __attribute_name(self) -> AttributeName:
+        # Only needed for error messages, so it is derived instead of kept
+        parent = self.__parent() if self.__parent else None
+        if parent is None:
+            return AttributeName(self.__key)
+        else:
+            return AttributeName(self.__key, explicit_prev=parent.__attribute_name)  # noqa: SLF001
 
     #################################################################
     # Overridden Mapping methods
@@ -297,14 +335,30 @@ class Configuration(typ.Generic[KT, VT], tabc.Mapping[KT, VT]):
     def _raw_items(self) -> tabc.Iterator[tuple[typ.Any, typ.Any]]:
         return map(lambda key: (key, self.__data[key]), self)
 
+    @classmethod
+    def _from_dict(cls, data: dict[typ.Any, typ.Any], secret: object) -> Configuration:
+        # Takes ownership of `data` without copying it. Used by the loader, which builds `data` itself.
+        if secret is not setter_secret:
+            raise TypeError("`_from_dict` is private and not for external use")
+
+        config = cls.__new__(cls)
+        config.__data = data  # noqa: SLF001
+        config.__key = "$"  # noqa: SLF001
+        config.__parent = None  # noqa: SLF001
+        return config
+
     #################################################################
     # Public interface methods
     #################################################################
 
     def __setstate__(self, state: tuple[None, dict[str, typ.Any]]) -> None:
         # custom __getattr__ requires custom __setstate__
+        # Not in states pickled before 2.6.0
+        self.__key = "$"
+        self.__parent = None
         for attr, value in state[1].items():
-            object.__setattr__(self, attr, value)
+            if attr != "_Configuration__attribute_name":  # Only in states pickled before 2.6.0
+                object.__setattr__(self, attr, value)
 
     def __getattr__(self, name: str) -> VT:
         """
@@ -326,10 +380,24 @@ class Configuration(typ.Generic[KT, VT], tabc.Mapping[KT, VT]):
         :rtype:  VT
         :raises AttributeError: When an attribute is not present.
         """
-        if name not in self:
-            raise AttributeError(f"Request attribute `{self.__attribute_name.with_suffix(name)}` does not exist")
+        # Same as `__getitem__`
+        try:
+            value = self.__data[name]
+        except KeyError:
+            raise AttributeError(
+                f"Request attribute `{self.__attribute_name.with_suffix(name)}` does not exist"
+            ) from None
 
-        return self[name]  # type: ignore  # instead of casting
+        cls = type(value)
+        if cls in _plain_types:
+            return value
+        elif cls in _configuration_types:
+            parent = ref(self)
+            if (value.__parent is not parent) or (value.__key is not name):  # noqa: SLF001
+                value.__parent, value.__key = parent, name  # noqa: SLF001
+            return value
+        else:
+            return self.__resolve(name)  # type: ignore[arg-type]
 
     def exists(self, key: typ.Any) -> bool:
         """
@@ -435,6 +503,122 @@ class Configuration(typ.Generic[KT, VT], tabc.Mapping[KT, VT]):
         else:
             raise TypeError(f"Incorrect type. Got: `{repr(value)}`. Wanted: `{repr(type)}`")
 
+    def freeze(self) -> FrozenConfiguration[KT, VT]:
+        """
+        .. versionadded:: 2.6.0
+
+        Evaluates everything and returns a sealed copy that reads like a plain
+        :py:class:`dict` or object.
+
+        Every Tag is run and every :py:class:`.Placeholder` raises now, instead
+        of when read. Use it to pay all evaluation costs at start-up, so reads
+        have flat latency afterwards.
+
+        .. admonition:: Sequences
+            :class: note
+            :collapsible: closed
+
+            Tags and :py:class:`.Configuration` instances in sequences are also
+            evaluated and frozen. Sequences keep their type, so a
+            :py:class:`list` from a :py:class:`.MutableConfiguration` stays a
+            (new) :py:class:`list`, which makes the result unhashable.
+
+        :return: Frozen copy (this instance, if already frozen)
+        :rtype: FrozenConfiguration[KT, VT]
+        :raises PlaceholderConfigurationError: If any :py:class:`.Placeholder` was not overwritten
+        """
+        from granular_configuration_language._frozen_configuration import freeze
+
+        return freeze(self)
+
+    def materialize(self, typed_base: type[C]) -> C:
+        """
+        .. versionadded:: 2.6.0
+
+        Creates an instance of ``typed_base`` with each annotated attribute
+        stored in a slot, so typed attributes are read like those of a slotted
+        :py:func:`dataclass <dataclasses.dataclass>`.
+
+        The configuration is frozen first (see :py:meth:`freeze`), then nested
+        sections annotated with a :py:class:`Configuration` subclass are also
+        materialized. Generated classes are cached per ``typed_base``.
+
+        .. admonition:: Example
+            :class: hint
+            :collapsible: closed
+
+            .. code-block:: python
+
+                class SubConfig(Configuration):
+                    c: str
+
+
+                class Config(Configuration):
+                    a: int
+                    b: SubConfig
+                    d: int = 0  # Used when the key is missing
+
+
+                typed = config.materialize(Config)
+
+                assert typed.b.c == "test me"
+                assert isinstance(typed, Config)
+
+        .. admonition:: No runtime type checking
+            :class: note
+            :collapsible: closed
+
+            Only keys are checked. Values are not checked against their
+            annotations, just as with :py:meth:`as_typed`.
+
+            Annotated names that :py:class:`Configuration` already uses
+            (e.g. ``items``) are not slots. Read them as items.
+
+        :param type[C] typed_base: Subclass of :py:class:`Configuration` to create
+        :return: Materialized instance, which is an instance of ``typed_base``
+        :rtype: C
+        :raises TypedConfigurationMismatch:
+            Listing every missing key (without a default) and every key not in
+            the annotations, for all sections at once
+        :raises PlaceholderConfigurationError: If any :py:class:`.Placeholder` was not overwritten
+        :raises TypeError:
+            If ``typed_base``, or the annotation of a nested section, is a
+            :py:class:`MutableConfiguration` subclass
+        """
+        from granular_configuration_language._materialize import materialize
+
+        return typ.cast("C", materialize(self, typed_base))
+
+    def compile_path(self, path: str | tabc.Sequence[typ.Any]) -> CompiledPath:
+        """
+        .. versionadded:: 2.6.0
+
+        Creates a reusable getter for the value at ``path``.
+
+        The path is read on the first call. Later calls return the value read,
+        which makes them nearly free for code that reads the same setting
+        repeatedly.
+
+        :example:
+            .. code-block:: python
+
+                rate = CONFIG.compile_path("service.limits.rate")
+                rate = CONFIG.compile_path("/service/limits/rate")
+                rate = CONFIG.compile_path(("service", "limits", "rate"))
+
+                assert rate() == CONFIG.service.limits.rate
+
+        :param str | ~collections.abc.Sequence[~typing.Any] path:
+            Keys as a dotted string (``"a.b.c"``), a JSON Pointer (``"/a/b/c"``),
+            or a sequence of keys (required for keys that are not :py:class:`str`).
+            In strings, digits index sequences (``"a.0.b"``).
+        :return: Getter for the value
+        :rtype: CompiledPath
+        """
+        from granular_configuration_language._compiled_path import CompiledPath
+
+        return CompiledPath(lambda: self, path)
+
     def as_typed(self, typed_base: type[C]) -> C:
         """
         Cast this :py:class:`Configuration` instance into subclass of :py:class:`Configuration` with typed annotated attributes
@@ -464,6 +648,21 @@ class Configuration(typ.Generic[KT, VT], tabc.Mapping[KT, VT]):
         return typ.cast("C", self)
 
 
+# Types of resolved values, so reads can check `type(value)` instead of `isinstance` with ABCs (which is slower)
+_plain_types: typ.Final = set[type]()  # Returned as they are
+_configuration_types: typ.Final = set[type]()  # Named when read
+
+
+class _Mutations:
+    # Counts changes to every `MutableConfiguration`, so a `CompiledPath` can tell when to read its path again
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        self.count = 0
+
+
+mutations: typ.Final = _Mutations()
+
 _private_data_getter: tabc.Callable[[Configuration], dict[typ.Any, typ.Any]] = op.attrgetter("_Configuration__data")
 
 
@@ -532,10 +731,12 @@ class MutableConfiguration(typ.Generic[KT, VT], tabc.MutableMapping[KT, VT], Con
     @override
     def __delitem__(self, key: typ.Any) -> None:
         del _private_data_getter(self)[key]
+        mutations.count += 1  # After changing, so a read cannot cache the previous value as current
 
     @override
     def __setitem__(self, key: KT, value: VT) -> None:
         _private_data_getter(self)[key] = value
+        mutations.count += 1
 
     @override
     def __deepcopy__(self, memo: dict[int, typ.Any]) -> MutableConfiguration:
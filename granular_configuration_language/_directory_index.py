@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import collections.abc as tabc
+import os
+import time
+import typing as typ
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+
+from granular_configuration_language._locations import LOCATION_CACHE_SIZE
+
+# A directory listing is only cached once the directory's mtime is older than this.
+# Otherwise, a file created within the filesystem's timestamp granularity could be missed.
+_RACY_WINDOW_NS: typ.Final = 2_000_000_000
+
+
+class _Listing(typ.NamedTuple):
+    mtime_ns: int
+    files: frozenset[str]
+    folded: frozenset[str]
+    links: frozenset[str]
+
+    def is_file(self, path: Path) -> bool:
+        name = path.name
+        if name in self.links:  # A link's target can change without changing the directory
+            return path.is_file()
+        elif name in self.files:
+            return True
+        elif name.casefold() in self.folded:  # Only a case-insensitive filesystem can match
+            return path.is_file()
+        else:
+            return False
+
+
+_MISSING: typ.Final = _Listing(0, frozenset(), frozenset(), frozenset())
+
+
+class DirectoryIndex:
+    """
+    Answers "is this a file?" from one :py:func:`os.scandir` per directory.
+
+    Listings are reused until the directory's mtime changes, so each check costs at most one
+    :py:func:`os.stat` of the directory. Directories modified too recently to trust their mtime are not cached.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize: typ.Final = maxsize
+        self.__listings = OrderedDict[Path, _Listing]()
+        self.__lock = Lock()
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__listings.clear()
+
+    def __scan(self, directory: Path, mtime_ns: int) -> _Listing | None:
+        files = list[str]()
+        links = list[str]()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_symlink():
+                        links.append(entry.name)
+                    elif entry.is_file():
+                        files.append(entry.name)
+        except OSError:  # E.g. a directory that can be traversed, but not listed
+            return None
+
+        return _Listing(mtime_ns, frozenset(files), frozenset(name.casefold() for name in files), frozenset(links))
+
+    def __listing(self, directory: Path) -> _Listing | None:
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except OSError:
+            return _MISSING
+
+        with self.__lock:
+            listing = self.__listings.get(directory)
+            if (listing is not None) and (listing.mtime_ns == mtime_ns):
+                self.__listings.move_to_end(directory)
+                return listing
+
+        if (self.maxsize == 0) or (time.time_ns() - mtime_ns < _RACY_WINDOW_NS):
+            return None
+
+        listing = self.__scan(directory, mtime_ns)
+        if listing is not None:
+            with self.__lock:
+                self.__listings[directory] = listing
+                self.__listings.move_to_end(directory)
+                while len(self.__listings) > self.maxsize:
+                    self.__listings.popitem(last=False)
+        return listing
+
+    def checker(self) -> tabc.Callable[[Path], bool]:
+        """
+        Returns an ``is_file`` check that validates each directory once.
+
+        Use one checker per pass over a set of paths, so that paths sharing a directory share one :py:func:`os.stat`.
+        """
+        listings = dict[Path, _Listing | None]()
+
+        def is_file(path: Path) -> bool:
+            directory = path.parent
+            if directory in listings:
+                listing = listings[directory]
+            else:
+                listing = listings[directory] = self.__listing(directory)
+
+            if listing is None:
+                return path.is_file()
+            else:
+                return listing.is_file(path)
+
+        return is_file
+
+    def is_file(self, path: Path) -> bool:
+        return self.checker()(path)
+
+
+directory_index: typ.Final = DirectoryIndex(LOCATION_CACHE_SIZE)
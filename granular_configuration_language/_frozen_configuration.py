@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import collections.abc as tabc
+import copy
+import sys
+import typing as typ
+from contextlib import suppress
+from types import MemberDescriptorType
+
+from granular_configuration_language._configuration import Configuration
+from granular_configuration_language._s import setter_secret
+from granular_configuration_language.exceptions import PlaceholderConfigurationError
+from granular_configuration_language.yaml.classes import KT, VT, LazyEval, Placeholder
+
+if sys.version_info >= (3, 12):
+    from typing import override
+elif typ.TYPE_CHECKING:
+    from typing_extensions import override
+else:
+
+    def override(func: tabc.Callable) -> tabc.Callable:
+        return func
+
+
+class FrozenConfiguration(Configuration[KT, VT]):
+    """
+    .. versionadded:: 2.6.0
+
+    A fully evaluated, sealed :py:class:`.Configuration`, made by
+    :py:meth:`.Configuration.freeze` or :py:meth:`.LazyLoadConfiguration.frozen`.
+
+    - Every Tag has been run and every :py:class:`.Placeholder` checked, so
+      reads are a single lookup, with no laziness checks or bookkeeping.
+      Attributes are read like those of any object.
+    - Nested :py:class:`.Configuration` instances are also frozen.
+      Sequences keep their type (:py:class:`tuple`, or :py:class:`list` from a
+      :py:class:`.MutableConfiguration`), with their items frozen.
+    - Attributes cannot be set, and copies return the same instance.
+    - Hashable (if all values are, so not with a :py:class:`list`), with the hash computed when frozen.
+      Equality checks compare the hashes first.
+    """
+
+    # `__dict__` is the same `dict` as `__values`, unless some keys cannot be attributes (see `_seal`).
+    __slots__ = ("__dict__", "__hash", "__path", "__values")
+
+    @classmethod
+    def _from_values(cls, values: dict[typ.Any, typ.Any], path: str, secret: object) -> FrozenConfiguration:
+        # Takes ownership of `values`. Call `_seal` once they are filled.
+        if secret is not setter_secret:
+            raise TypeError("`_from_values` is private and not for external use")
+
+        frozen = typ.cast("FrozenConfiguration", cls._from_dict(values, setter_secret))
+        frozen.__setup(values, path)  # noqa: SLF001
+        return frozen
+
+    def __setup(self, values: dict[typ.Any, typ.Any], path: str) -> None:
+        self.__values = values
+        self.__path = path
+        self.__hash: int | None = None
+
+    def _seal(self, secret: object) -> None:
+        if secret is not setter_secret:
+            raise TypeError("`_seal` is private and not for external use")
+
+        values = self.__values
+        # Keys that are not strings, or that would hide a method (e.g. `items`), are only read as items
+        if all((type(key) is str) and not hasattr(FrozenConfiguration, key) for key in values):
+            object.__setattr__(self, "__dict__", values)
+        else:
+            object.__setattr__(
+                self,
+                "__dict__",
+                {
+                    key: value
+                    for key, value in values.items()
+                    if (type(key) is str) and not hasattr(FrozenConfiguration, key)
+                },
+            )
+
+        # Unhashable values (or an alias of itself, which is still being sealed) leave it unhashable
+        with suppress(TypeError):
+            self.__hash = hash(frozenset(values.items()))
+
+    @override
+    def __getitem__(self, name: KT) -> VT:
+        try:
+            return self.__values[name]
+        except KeyError:
+            raise KeyError(repr(name)) from None
+
+    @override
+    def __getattr__(self, name: str) -> VT:
+        # Only called for keys that are not in `__dict__`
+        try:
+            return self.__values[name]
+        except KeyError:
+            raise AttributeError(f"Request attribute `{self.__path}.{name}` does not exist") from None
+
+    @override
+    def __setattr__(self, name: str, value: typ.Any) -> None:
+        # Slots are only set while freezing (or unpickling)
+        if isinstance(getattr(FrozenConfiguration, name, None), MemberDescriptorType):
+            object.__setattr__(self, name, value)
+        else:
+            raise AttributeError(f"Cannot set `{name}`. `FrozenConfiguration` is sealed.")  # noqa: TRY004
+
+    @override
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Cannot delete `{name}`. `FrozenConfiguration` is sealed.")
+
+    @override
+    def __hash__(self) -> int:
+        if self.__hash is None:
+            raise TypeError(f"`FrozenConfiguration` at `{self.__path}` has an unhashable value")
+        return self.__hash
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        elif isinstance(other, FrozenConfiguration):
+            if (self.__hash is not None) and (other.__hash is not None) and (self.__hash != other.__hash):
+                return False
+            return self.__values == other.__values
+        else:
+            return super().__eq__(other)
+
+    @override
+    def __reduce__(self) -> tuple[typ.Any, ...]:
+        return (_unpickle, (self.__values, self.__path))
+
+    @override
+    def __copy__(self) -> FrozenConfiguration[KT, VT]:
+        return self
+
+    copy = __copy__
+    """
+    Returns this instance, as it is sealed. (Matches :py:meth:`dict.copy` interface.)
+    """
+
+    @override
+    def __deepcopy__(self, memo: dict[int, typ.Any]) -> FrozenConfiguration[KT, VT]:
+        values = dict[typ.Any, typ.Any]()
+        other = FrozenConfiguration._from_values(values, self.__path, setter_secret)
+        memo[id(self)] = other
+        values.update(copy.deepcopy(self.__values, memo=memo))
+        other._seal(setter_secret)  # noqa: SLF001
+        return other
+
+    @override
+    def freeze(self) -> FrozenConfiguration[KT, VT]:
+        return self
+
+
+def _unpickle(values: dict[typ.Any, typ.Any], path: str) -> FrozenConfiguration:
+    frozen = FrozenConfiguration._from_values(values, path, setter_secret)  # noqa: SLF001
+    frozen._seal(setter_secret)  # noqa: SLF001
+    return frozen
+
+
+class _Freezer:
+    __slots__ = ("memo",)
+
+    def __init__(self) -> None:
+        self.memo = dict[int, FrozenConfiguration]()  # Keeps aliases shared
+
+    def config(self, config: Configuration, path: str) -> FrozenConfiguration:
+        if isinstance(config, FrozenConfiguration):
+            return config
+        elif id(config) in self.memo:
+            return self.memo[id(config)]
+
+        values = dict[typ.Any, typ.Any]()
+        frozen = FrozenConfiguration._from_values(values, path, setter_secret)  # noqa: SLF001
+        self.memo[id(config)] = frozen
+        for key in config:
+            # Reading evaluates `LazyEval` and raises on `Placeholder`
+            values[key] = self.value(config[key], f"{path}.{key if isinstance(key, str) else f'`{key!r}`'}")
+        frozen._seal(setter_secret)  # noqa: SLF001
+        return frozen
+
+    def value(self, value: typ.Any, path: str) -> typ.Any:
+        # Sequences are not evaluated when read, so their items are checked here
+        if isinstance(value, LazyEval):
+            value = value.result
+
+        if isinstance(value, Configuration):
+            return self.config(value, path)
+        elif isinstance(value, Placeholder):
+            raise PlaceholderConfigurationError(f'!Placeholder at `{path}` was not overwritten. Message: "{value}"')
+        elif type(value) in (tuple, list):
+            # Keeps the type, so a frozen `MutableConfiguration` still compares equal to its `list`s
+            return type(value)(self.value(item, f"{path}[{index}]") for index, item in enumerate(value))
+        else:
+            return value
+
+
+def freeze(config: Configuration[KT, VT]) -> FrozenConfiguration[KT, VT]:
+    return _Freezer().config(config, "$")
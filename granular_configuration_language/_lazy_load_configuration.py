@@ -14,6 +14,11 @@ from granular_configuration_language._configuration import C
 from granular_configuration_language._locations import Locations, PathOrStr
 from granular_configuration_language.exceptions import ErrorWhileLoadingConfig
 from granular_configuration_language.proxy import EagerIOConfigurationProxy, SafeConfigurationProxy
+from granular_configuration_language.proxy._proxy import typed_view
+
+if typ.TYPE_CHECKING:
+    from granular_configuration_language._compiled_path import CompiledPath
+    from granular_configuration_language._frozen_configuration import FrozenConfiguration
 
 if sys.version_info >= (3, 12):
     from typing import override
@@ -117,8 +122,14 @@ class LazyLoadConfiguration(Mapping):
 
     :param ~pathlib.Path | str | os.PathLike \*load_order_location:
             File path to configuration file
+
+            .. versionchanged:: 2.6.0
+                Accepts a compiled bundle (``.gclbundle``). See :ref:`Compiling a Bundle <compile>`.
     :param str | ~collections.abc.Sequence[str], optional base_path:
         Defines the subsection of the configuration file to use. See Examples for usage options.
+
+        .. versionchanged:: 2.6.0
+            Sections outside ``base_path`` are not constructed, unless referenced by ``!Ref`` or ``!Sub``.
     :param bool, optional use_env_location:
         - Enabled to use the default environment variable location.
         - Setting to :py:data:`True` is only required if you don't change
@@ -137,6 +148,13 @@ class LazyLoadConfiguration(Mapping):
         Inject a runtime :py:class:`.Configuration` instance, as if it were the last loaded file.
     :param bool, optional disable_caching:
         When :py:data:`True`, this instance will not participate in the caching of "identical immutable configurations".
+    :param bool, optional parallel_load:
+        - When :py:data:`True`, all files are read and parsed concurrently on a bounded thread pool,
+          then merged in load order. The result is identical to loading them one at a time.
+        - Useful when file reads are slow, such as on network filesystems.
+        - Only instances with the same setting share a load.
+
+        .. versionadded:: 2.6.0
     :param ~typing.Any \*\*kwargs: There are no public-facing supported extra parameters.
 
     :examples:
@@ -168,6 +186,7 @@ class LazyLoadConfiguration(Mapping):
         inject_before: Configuration | None = None,
         inject_after: Configuration | None = None,
         disable_caching: bool = False,
+        parallel_load: bool = False,
         **kwargs: typ.Any,
     ) -> None:
         self.__receipt: NoteOfIntentToRead | None = prepare_to_load_configuration(
@@ -177,19 +196,20 @@ class LazyLoadConfiguration(Mapping):
             inject_before=inject_before,
             inject_after=inject_after,
             disable_cache=disable_caching,
+            parallel_load=parallel_load,
         )
 
     if sys.version_info >= (3, 11):
 
         @override
         def __getstate__(self) -> typ.Any:
-            self.config  # noqa: B018  # Run to get rid of the RLock and before ruining this instance with pickling_error_occur
+            self.config  # noqa: B018  # Load, so the configuration is pickled
             return super().__getstate__()
 
     else:
 
         def __getstate__(self) -> typ.Any:
-            self.config  # noqa: B018  # Run to get rid of the RLock and before ruining this instance with pickling_error_occur
+            self.config  # noqa: B018  # Load, so the configuration is pickled
             return self.__dict__
 
     def __setstate__(self, state: dict[str, typ.Any]) -> None:
@@ -251,7 +271,43 @@ class LazyLoadConfiguration(Mapping):
     def __len__(self) -> int:
         return len(self.config)
 
-    def as_typed(self, typed_base: type[C]) -> C:
+    def frozen(self) -> FrozenConfiguration:
+        """
+        .. versionadded:: 2.6.0
+
+        Loads (if not loaded) and returns the configuration, fully evaluated
+        and sealed. See :py:meth:`.Configuration.freeze`.
+
+        Each call makes a new :py:class:`.FrozenConfiguration`, so call this
+        once (e.g. at start-up) and keep the result.
+
+        :return: Frozen copy of the configuration
+        :rtype: FrozenConfiguration
+        :raises PlaceholderConfigurationError: If any :py:class:`.Placeholder` was not overwritten
+        """
+        return self.config.freeze()
+
+    def compile_path(self, path: str | tabc.Sequence[typ.Any]) -> CompiledPath:
+        """
+        .. versionadded:: 2.6.0
+
+        Creates a reusable getter for the value at ``path``, without loading.
+
+        Behaves like :py:meth:`.Configuration.compile_path`, but the
+        configuration is loaded on the first call, so getters can be made at
+        import time.
+
+        :param str | ~collections.abc.Sequence[~typing.Any] path:
+            Keys as a dotted string (``"a.b.c"``), a JSON Pointer (``"/a/b/c"``),
+            or a sequence of keys.
+        :return: Getter for the value
+        :rtype: CompiledPath
+        """
+        from granular_configuration_language._compiled_path import CompiledPath
+
+        return CompiledPath(lambda: self.config, path)
+
+    def as_typed(self, typed_base: type[C], *, cache_fields: bool = False) -> C:
         """
         Create a proxy that is cast to provide :py:class:`Configuration`
         subclass with typed annotated attributes.
@@ -295,14 +351,35 @@ class LazyLoadConfiguration(Mapping):
             Use ``Pydantic``, or some like it, if you require runtime type
             checking.
 
+        .. admonition:: Cached fields
+            :class: tip
+            :collapsible: closed
+
+            With ``cache_fields=True``, a :py:class:`.TypedConfigurationView`
+            is returned instead. Each annotated attribute is read on first
+            access, then cached, so later reads skip the proxy, the load check,
+            and :py:meth:`.Configuration.__getattr__`. Attributes that are
+            never read are never evaluated.
+
+            Class values on ``typed_base`` are used for missing keys, as with
+            :py:meth:`.Configuration.materialize`.
+
+            .. versionadded:: 2.6.0
+
         :param type[C] typed_base:
             Subclass of :py:class:`Configuration` to assume
+        :param bool cache_fields:
+            Return a :py:class:`.TypedConfigurationView` that caches each
+            annotated attribute. Defaults to :py:data:`False`.
         :return:
             :py:class:`.SafeConfigurationProxy` instance that has been cast to
             the provided type.
         :rtype: C
         """
-        return typ.cast("C", SafeConfigurationProxy(self))
+        if cache_fields:
+            return typ.cast("C", typed_view(typed_base)(self))
+        else:
+            return typ.cast("C", SafeConfigurationProxy(self))
 
     def eager_load(self, typed_base: type[C]) -> C:
         """
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import abc
 import collections.abc as tabc
-import operator as op
 import os
 import sys
 import typing as typ
+import warnings
 from functools import cached_property, lru_cache
 from itertools import chain, islice
 from pathlib import Path
@@ -23,8 +24,37 @@ else:
 
 PathOrStr = Path | str | os.PathLike
 
+LOCATION_CACHE_SIZE_ENV: typ.Final = "G_CONFIG_LOCATION_CACHE_SIZE"
+DEFAULT_LOCATION_CACHE_SIZE: typ.Final = 1024
 
-@lru_cache(maxsize=32)
+
+def read_location_cache_size() -> int:
+    # Read at import, so an invalid value warns and uses the default, instead of failing the import
+    value = os.environ.get(LOCATION_CACHE_SIZE_ENV, "").strip()
+    if not value:
+        return DEFAULT_LOCATION_CACHE_SIZE
+
+    try:
+        size = int(value)
+    except ValueError:
+        size = -1
+
+    if size < 0:
+        warnings.warn(
+            f"`{LOCATION_CACHE_SIZE_ENV}` must be a non-negative integer. Got: {value!r}. "
+            f"Using {DEFAULT_LOCATION_CACHE_SIZE}.",
+            RuntimeWarning,
+            stacklevel=1,
+        )
+        return DEFAULT_LOCATION_CACHE_SIZE
+    return size
+
+
+# Bounds the path caches here, and the directory listings in `_directory_index`
+LOCATION_CACHE_SIZE: typ.Final = read_location_cache_size()
+
+
+@lru_cache(maxsize=LOCATION_CACHE_SIZE)
 def _resolve_path(path: Path) -> Path:
     return path.expanduser().resolve()
 
@@ -40,8 +70,17 @@ def path_repr(path: Path) -> str:  # pragma: no cover
     return str(path.relative_to(Path.cwd()))
 
 
-class BaseLocation(tabc.Iterable[Path], typ.Hashable):
-    pass
+class BaseLocation(abc.ABC, tabc.Iterable[Path], typ.Hashable):
+    @abc.abstractmethod
+    def existing(self, is_file: tabc.Callable[[Path], bool]) -> tabc.Iterator[Path]:
+        """Paths that exist (according to ``is_file``), in load order."""
+        ...
+
+    @override
+    def __iter__(self) -> tabc.Iterator[Path]:
+        from granular_configuration_language._directory_index import directory_index
+
+        return self.existing(directory_index.checker())
 
 
 class PrioritizedLocations(BaseLocation):
@@ -51,8 +90,8 @@ class PrioritizedLocations(BaseLocation):
         self.paths: typ.Final = paths
 
     @override
-    def __iter__(self) -> tabc.Iterator[Path]:
-        return islice(filter(op.methodcaller("is_file"), self.paths), 1)
+    def existing(self, is_file: tabc.Callable[[Path], bool]) -> tabc.Iterator[Path]:
+        return islice(filter(is_file, self.paths), 1)
 
     @override
     def __eq__(self, value: object) -> bool:
@@ -78,8 +117,8 @@ class Location(BaseLocation):
         self.path: typ.Final = path
 
     @override
-    def __iter__(self) -> tabc.Iterator[Path]:
-        if self.path.is_file():
+    def existing(self, is_file: tabc.Callable[[Path], bool]) -> tabc.Iterator[Path]:
+        if is_file(self.path):
             yield self.path
 
     @override
@@ -106,7 +145,7 @@ SUFFIX_CONFIG: typ.Final[dict[str, tabc.Sequence[str]]] = {
 }
 
 
-@lru_cache(maxsize=32)
+@lru_cache(maxsize=LOCATION_CACHE_SIZE)
 def _convert_to_location(path: Path) -> BaseLocation:
     if path.suffix in SUFFIX_CONFIG:
         return PrioritizedLocations(tuple(map(path.with_suffix, SUFFIX_CONFIG[path.suffix])))
@@ -121,8 +160,8 @@ class Locations(BaseLocation):
         )
 
     @override
-    def __iter__(self) -> tabc.Iterator[Path]:
-        return iter(OrderedSet(chain.from_iterable(self.locations)))
+    def existing(self, is_file: tabc.Callable[[Path], bool]) -> tabc.Iterator[Path]:
+        return iter(OrderedSet(chain.from_iterable(location.existing(is_file) for location in self.locations)))
 
     def __bool__(self) -> bool:
         return bool(self.locations)
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import types
+import typing as typ
+from functools import cache
+
+from granular_configuration_language._configuration import Configuration, MutableConfiguration
+from granular_configuration_language._frozen_configuration import FrozenConfiguration
+from granular_configuration_language._s import setter_secret
+from granular_configuration_language.exceptions import TypedConfigurationMismatch
+
+_UNTYPED: typ.Final = frozenset((Configuration, MutableConfiguration, FrozenConfiguration))
+MISSING: typ.Final = object()
+
+
+class TypedField(typ.NamedTuple):
+    name: str
+    typed: type[Configuration] | None  # Typed section
+    default: typ.Any  # `MISSING`, if required
+
+
+class _Field(typ.NamedTuple):
+    name: str
+    typed: type[Configuration] | None
+    default: typ.Any
+    slot: typ.Any  # `MemberDescriptorType`, or `None` for names used by `Configuration` (e.g. `items`)
+
+
+class _Plan(typ.NamedTuple):
+    typed_base: type[Configuration]
+    cls: type[Configuration]
+    fields: tuple[_Field, ...]
+    names: frozenset[str]
+
+
+def _typed_section(hint: typ.Any) -> type[Configuration] | None:
+    # `SubConfig` or `SubConfig | None`
+    if typ.get_origin(hint) in (typ.Union, types.UnionType):
+        args = [arg for arg in typ.get_args(hint) if arg is not type(None)]
+        hint = args[0] if len(args) == 1 else None
+    if isinstance(hint, type) and issubclass(hint, Configuration) and (hint not in _UNTYPED):
+        return hint
+    else:
+        return None
+
+
+@cache
+def typed_fields(typed_base: type[Configuration]) -> tuple[TypedField, ...]:
+    """
+    Annotated keys of ``typed_base`` and its typed bases. Class values are defaults.
+    ``ClassVar`` annotations are not keys.
+    """
+    names = list[str]()
+    defaults = dict[str, typ.Any]()
+    for klass in reversed(typed_base.__mro__):
+        if (klass not in _UNTYPED) and issubclass(klass, Configuration):
+            for name in vars(klass).get("__annotations__", {}):
+                if name not in names:
+                    names.append(name)
+                if name in vars(klass):
+                    defaults[name] = vars(klass)[name]
+
+    hints = typ.get_type_hints(typed_base)
+    return tuple(
+        TypedField(name, _typed_section(hints[name]), defaults.get(name, MISSING))
+        for name in names
+        if typ.get_origin(hints[name]) is not typ.ClassVar
+    )
+
+
+@cache
+def _plan(typed_base: type[Configuration]) -> _Plan:
+    if issubclass(typed_base, MutableConfiguration):
+        # Setting an item would not update its slot
+        raise TypeError(
+            f"{typed_base.__qualname__} is a MutableConfiguration, which cannot be materialized."
+            " Subclass Configuration instead."
+        )
+
+    fields = typed_fields(typed_base)
+    slots = tuple(field.name for field in fields if not hasattr(Configuration, field.name))
+
+    cls = type(
+        typed_base.__name__,
+        (typed_base,),
+        {
+            "__slots__": slots,
+            "__module__": typed_base.__module__,
+            "__qualname__": typed_base.__qualname__,
+            "__doc__": typed_base.__doc__,
+            "__reduce__": lambda self: (_unpickle, (typed_base, dict(self._raw_items()))),
+        },
+    )
+
+    return _Plan(
+        typed_base,
+        cls,
+        tuple(_Field(*field, vars(cls)[field.name] if field.name in slots else None) for field in fields),
+        frozenset(field.name for field in fields),
+    )
+
+
+def _set_slots(plan: _Plan, instance: Configuration, values: dict[typ.Any, typ.Any]) -> None:
+    for field in plan.fields:
+        if field.slot and (field.name in values):
+            field.slot.__set__(instance, values[field.name])
+
+
+def _from_values(plan: _Plan, values: dict[typ.Any, typ.Any]) -> Configuration:
+    instance = plan.cls._from_dict(values, setter_secret)  # noqa: SLF001
+    _set_slots(plan, instance, values)
+    return instance
+
+
+def _unpickle(typed_base: type[Configuration], values: dict[typ.Any, typ.Any]) -> Configuration:
+    return _from_values(_plan(typed_base), values)
+
+
+class _Materializer:
+    __slots__ = ("memo", "problems")
+
+    def __init__(self) -> None:
+        self.memo = dict[tuple[int, type], Configuration]()  # Keeps aliases shared
+        self.problems = list[str]()
+
+    def config(self, frozen: FrozenConfiguration, typed_base: type[Configuration], path: str) -> Configuration:
+        if (id(frozen), typed_base) in self.memo:
+            return self.memo[(id(frozen), typed_base)]
+
+        plan = _plan(typed_base)
+        values = dict(frozen.items())
+        # Registered before its sections are, so aliases of itself (e.g. `!Ref $`) are shared, not recursed into
+        instance = plan.cls._from_dict(values, setter_secret)  # noqa: SLF001
+        self.memo[(id(frozen), typed_base)] = instance
+
+        self.problems.extend(
+            f"`{path}.{key if isinstance(key, str) else f'`{key!r}`'}` is not in {typed_base.__qualname__}"
+            for key in values
+            if key not in plan.names
+        )
+        for field in plan.fields:
+            field_path = f"{path}.{field.name}"
+            if field.name not in values:
+                if field.default is MISSING:
+                    self.problems.append(f"`{field_path}` is missing, but required by {typed_base.__qualname__}")
+                else:
+                    values[field.name] = field.default
+            elif field.typed:
+                value = values[field.name]
+                if isinstance(value, FrozenConfiguration):
+                    values[field.name] = self.config(value, field.typed, field_path)
+                elif value is not None:
+                    self.problems.append(f"`{field_path}` is not a mapping for {field.typed.__qualname__}")
+
+        _set_slots(plan, instance, values)  # `values` is shared with `instance`, so it is already filled
+        return instance
+
+
+def materialize(config: Configuration, typed_base: type[Configuration]) -> Configuration:
+    materializer = _Materializer()
+    instance = materializer.config(config.freeze(), typed_base, "$")
+    if materializer.problems:
+        raise TypedConfigurationMismatch(
+            f"Configuration does not match {typed_base.__qualname__}:\n"
+            + "\n".join(f"- {problem}" for problem in materializer.problems)
+        )
+    return instance
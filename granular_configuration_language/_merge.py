@@ -5,7 +5,6 @@ import typing as typ
 from os import PathLike
 
 from granular_configuration_language import Configuration, LazyLoadConfiguration, MutableLazyLoadConfiguration
-from granular_configuration_language._build import _merge
 from granular_configuration_language.yaml import LazyEval
 from granular_configuration_language.yaml.load import obj_pairs_func
 
@@ -73,6 +72,8 @@ def merge(
                 case _:
                     continue
 
+    from granular_configuration_language._build import _merge
+
     configuration_type = obj_pairs_func(mutable)
     base_config = configuration_type()
     return _merge(configuration_type, base_config, configuration_only(configs))
@@ -45,9 +45,15 @@ class MutableLazyLoadConfiguration(LazyLoadConfiguration, MutableMapping):
 
     :param ~pathlib.Path | str | os.PathLike \*load_order_location:
             File path to configuration file
+
+            .. versionchanged:: 2.6.0
+                Accepts a compiled bundle (``.gclbundle``). See :ref:`Compiling a Bundle <compile>`.
     :param str | ~collections.abc.Sequence[str], optional base_path:
         Defines the subsection of the configuration file to use.
         See Examples for usage options.
+
+        .. versionchanged:: 2.6.0
+            Sections outside ``base_path`` are not constructed, unless referenced by ``!Ref`` or ``!Sub``.
     :param bool, optional use_env_location:
         - Enabled to use the default environment variable location.
         - Setting to :py:data:`True` is only required if you don't change
@@ -62,6 +68,12 @@ class MutableLazyLoadConfiguration(LazyLoadConfiguration, MutableMapping):
 
           - Setting ``use_env_location=True`` is required to use the default
             value.
+    :param bool, optional parallel_load:
+        - When :py:data:`True`, all files are read and parsed concurrently on
+          a bounded thread pool, then merged in load order. The result is
+          identical to loading them one at a time.
+
+        .. versionadded:: 2.6.0
 
     :examples:
         .. code-block:: python
@@ -86,6 +98,7 @@ class MutableLazyLoadConfiguration(LazyLoadConfiguration, MutableMapping):
         base_path: str | tabc.Sequence[str] | None = None,
         use_env_location: bool = False,
         env_location_var_name: str = "G_CONFIG_LOCATION",
+        parallel_load: bool = False,
     ) -> None:
         super().__init__(
             *load_order_location,
@@ -95,6 +108,7 @@ class MutableLazyLoadConfiguration(LazyLoadConfiguration, MutableMapping):
             inject_before=None,
             inject_after=None,
             disable_caching=True,
+            parallel_load=parallel_load,
             _mutable_configuration=True,
         )
 
@@ -124,7 +138,7 @@ class MutableLazyLoadConfiguration(LazyLoadConfiguration, MutableMapping):
         self.config[key] = value
 
     @override
-    def as_typed(self, typed_base: type[C]) -> typ.NoReturn:
+    def as_typed(self, typed_base: type[C], *, cache_fields: bool = False) -> typ.NoReturn:
         """
         Not supported for :py:class:`MutableLazyLoadConfiguration`.
         Use :py:class:`LazyLoadConfiguration`.
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import collections.abc as tabc
+import typing as typ
+from collections import Counter
+
+from ruamel.yaml import MappingNode, Node, ScalarNode, SequenceNode
+from ruamel.yaml.resolver import BaseResolver
+
+from granular_configuration_language._configuration import Configuration
+from granular_configuration_language.yaml.decorators._lazy_eval import LazySubtree
+from granular_configuration_language.yaml.load._loads import ComposedDocument
+
+# Shadow of the later layers: either every later layer that has the key is a mapping (and merges),
+# or at least one replaces the value.
+_Replaced = typ.NewType("_Replaced", object)
+REPLACED: typ.Final = _Replaced(object())
+Shadow: typ.TypeAlias = "dict[typ.Any, Shadow | _Replaced]"
+
+YAML_TAG_PREFIX: typ.Final = "tag:yaml.org,2002:"
+_MERGE_TAG: typ.Final = "tag:yaml.org,2002:merge"
+_NULL_TAG: typ.Final = "tag:yaml.org,2002:null"
+
+
+def is_merged_mapping(node: Node) -> typ.TypeGuard[MappingNode]:
+    # Only untagged mappings become `Configuration` and merge. Tagged values always replace.
+    return isinstance(node, MappingNode) and (node.tag == BaseResolver.DEFAULT_MAPPING_TAG)
+
+
+def _is_plain(node: Node) -> bool:
+    # Untagged, but never a `Configuration`, so a later mapping replaces it instead of merging.
+    return (node.tag or "").startswith(YAML_TAG_PREFIX) and not is_merged_mapping(node)
+
+
+def count_references(node: Node | None) -> Counter[int]:
+    """Counts how many times each node is reached, so nodes shared through aliases can be left alone."""
+    references = Counter[int]()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        references[id(node)] += 1
+        if references[id(node)] > 1:
+            continue
+        if isinstance(node, MappingNode):
+            for key_node, value_node in node.value:
+                stack.append(key_node)
+                stack.append(value_node)
+        elif isinstance(node, SequenceNode):
+            stack.extend(node.value)
+    return references
+
+
+def plain_keys(document: ComposedDocument, node: MappingNode) -> tabc.Iterator[tuple[int, typ.Any, Node]]:
+    """Yields ``(index, key, value_node)`` for every plain scalar key of ``node``."""
+    for index, (key_node, value_node) in enumerate(node.value):
+        # Only plain scalar keys are understood. Anything else is left alone.
+        # `<<` merge keys are skipped, so merged-in values are never pruned, only the explicit ones.
+        tag = key_node.tag or ""
+        if isinstance(key_node, ScalarNode) and tag.startswith(YAML_TAG_PREFIX) and (tag != _MERGE_TAG):
+            yield index, document.construct_key(key_node), value_node
+
+
+class _Layer:
+    __slots__ = ("document", "references")
+
+    def __init__(self, document: ComposedDocument) -> None:
+        self.document = document
+        self.references = count_references(document.node)
+
+    def keys(self, node: MappingNode) -> tabc.Iterator[tuple[int, typ.Any, Node]]:
+        return plain_keys(self.document, node)
+
+    def prune(self, node: MappingNode, shadow: Shadow) -> int:
+        pruned = 0
+        for index, key, value_node in self.keys(node):
+            if key not in shadow:
+                continue
+
+            later = shadow[key]
+            if (later is REPLACED) or _is_plain(value_node):
+                # Replaced by a later layer, so it is replaced by an equivalent `null` that constructs nothing
+                if value_node.tag != _NULL_TAG:
+                    node.value[index] = (node.value[index][0], ScalarNode(_NULL_TAG, "null"))
+                    pruned += 1
+            elif isinstance(later, dict) and is_merged_mapping(value_node) and (self.references[id(value_node)] == 1):
+                pruned += self.prune(value_node, later)
+            # Otherwise, a Tag that may become a `Configuration` and merge with a later mapping.
+
+        if pruned:
+            self.document.mark_edited(node)
+        return pruned
+
+    def shadow(self, node: MappingNode, shadow: Shadow) -> None:
+        for _, key, value_node in self.keys(node):
+            if shadow.get(key) is REPLACED:
+                continue
+            elif is_merged_mapping(value_node):
+                later = shadow.setdefault(key, dict())
+                if isinstance(later, dict):
+                    self.shadow(value_node, later)
+            else:
+                shadow[key] = REPLACED
+
+
+def _shadow_configuration(config: Configuration, shadow: Shadow) -> None:
+    for key, value in config._raw_items():  # noqa: SLF001
+        if shadow.get(key) is REPLACED:
+            continue
+
+        if isinstance(value, LazySubtree):
+            value = value.result  # Merges as the mapping it stands for
+
+        if isinstance(value, Configuration):
+            later = shadow.setdefault(key, dict())
+            if isinstance(later, dict):
+                _shadow_configuration(value, later)
+        else:
+            shadow[key] = REPLACED
+
+
+def prune_overridden(documents: tabc.Sequence[ComposedDocument], *, inject_after: Configuration | None) -> int:
+    """
+    Replaces values that are overridden by a later layer with ``null``, before anything is constructed.
+
+    This keeps overridden Tags from being constructed (i.e. from allocating a :py:class:`.LazyEval`
+    or starting EagerIO). Keys keep their place, so the merged result is unchanged.
+
+    :param ~collections.abc.Sequence[ComposedDocument] documents: Documents in merge order. Modified in place.
+    :param Configuration | None inject_after: Merged after all documents.
+    :return: Number of values pruned
+    """
+    shadow: Shadow = dict()
+    if isinstance(inject_after, Configuration):
+        _shadow_configuration(inject_after, shadow)
+
+    pruned = 0
+    for document in reversed(documents):
+        node = document.node
+        if (node is not None) and is_merged_mapping(node):
+            layer = _Layer(document)
+            pruned += layer.prune(node, shadow)
+            layer.shadow(node, shadow)
+    return pruned
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import collections.abc as tabc
+import re
+import typing as typ
+
+from ruamel.yaml import MappingNode, Node, ScalarNode, SequenceNode
+
+from granular_configuration_language._base_path import BasePath
+from granular_configuration_language._overrides import YAML_TAG_PREFIX, count_references, is_merged_mapping, plain_keys
+from granular_configuration_language._utils import consume
+from granular_configuration_language.yaml.load._loads import ComposedDocument
+
+if typ.TYPE_CHECKING:
+    from granular_configuration_language.yaml.decorators._tag_set import TagSet
+
+# Key paths that are kept: either the whole subtree is kept, or only the listed keys are.
+_Whole = typ.NewType("_Whole", object)
+WHOLE: typ.Final = _Whole(object())
+Scope: typ.TypeAlias = "dict[str, Scope | _Whole]"
+
+ReferencePath: typ.TypeAlias = tuple[str, ...]
+
+_REF_TAG: typ.Final = "!Ref"
+_SUB_TAG: typ.Final = "!Sub"
+_SUB_PATTERN: typ.Final = re.compile(r"\$\{(?P<contents>.*?)\}")
+_JSON_PATH_NAME: typ.Final = re.compile(r"\.([A-Za-z_][A-Za-z0-9_]*)(?=$|[.\[])")
+
+
+def _json_path_prefix(query: str) -> ReferencePath:
+    # Only the leading `.name` segments are understood. Everything below the first other segment is kept.
+    parts = list[str]()
+    position = 1
+    while match := _JSON_PATH_NAME.match(query, position):
+        parts.append(match[1])
+        position = match.end()
+    return tuple(parts)
+
+
+def reference_path(query: str) -> ReferencePath | None:
+    """
+    Returns the key path a JSON Pointer or JSON Path query reads from.
+
+    :return: :py:data:`None`, if the query could read from anywhere in the Root.
+    """
+    if "${" in query:  # Interpolated queries are only known at fetch time
+        return None
+    elif query.startswith("/"):
+        return tuple(part.replace("~1", "/").replace("~0", "~") for part in query[1:].split("/"))
+    elif query.startswith("$"):
+        return _json_path_prefix(query) or None
+    else:
+        return None
+
+
+def _sub_queries(value: str) -> tabc.Iterator[str]:
+    for match in _SUB_PATTERN.finditer(value):
+        contents: str = match["contents"]
+        if ":+" in contents:  # `${ENV:+...}` interpolates its alternate value with the same rules
+            contents = contents.partition(":+")[2]
+        if (contents.startswith("$") and (contents != "$")) or contents.startswith("/"):
+            yield contents
+
+
+def _add(scope: Scope, path: ReferencePath) -> bool:
+    *parents, last = path
+    for part in parents:
+        child = scope.setdefault(part, dict())
+        if not isinstance(child, dict):
+            return False
+        scope = child
+
+    if scope.get(last) is WHOLE:
+        return False
+    else:
+        scope[last] = WHOLE
+        return True
+
+
+class _ReferenceFinder:
+    __slots__ = ("handlers", "seen")
+
+    def __init__(self) -> None:
+        from granular_configuration_language.yaml._tags import handlers
+
+        self.handlers: TagSet = handlers
+        self.seen = set[int]()
+
+    def __tag_references(self, node: Node, tag: str) -> tabc.Iterable[str] | None:
+        if tag in (_REF_TAG, _SUB_TAG):
+            if not isinstance(node, ScalarNode):
+                return None
+            elif tag == _REF_TAG:
+                return (node.value,)
+            else:
+                return tuple(_sub_queries(node.value))
+
+        handler = self.handlers.get(tag)  # Only Tags that are used are imported
+        if (handler is None) or handler.attributes.is_with_root or handler.attributes.is_with_ref:
+            # Unknown Tags and Tags that read the Root in ways that cannot be seen (e.g. `!ParseFile`)
+            return None
+        else:
+            return ()
+
+    def find(self, node: Node) -> list[ReferencePath] | None:
+        """
+        Returns every key path referenced from inside ``node``.
+
+        :return: :py:data:`None`, if any reference cannot be narrowed to a key path.
+        """
+        found = list[ReferencePath]()
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if id(node) in self.seen:
+                continue
+            self.seen.add(id(node))
+
+            tag = node.tag or ""
+            if not tag.startswith(YAML_TAG_PREFIX):
+                queries = self.__tag_references(node, tag)
+                if queries is None:
+                    return None
+                for query in queries:
+                    path = reference_path(query)
+                    if path is None:
+                        return None
+                    found.append(path)
+
+            if isinstance(node, MappingNode):
+                for key_node, value_node in node.value:
+                    stack.append(key_node)
+                    stack.append(value_node)
+            elif isinstance(node, SequenceNode):
+                stack.extend(node.value)
+        return found
+
+
+class _Layer:
+    __slots__ = ("document", "references")
+
+    def __init__(self, document: ComposedDocument) -> None:
+        self.document = document
+        self.references = count_references(document.node)
+
+    def __walk(self, node: MappingNode, scope: Scope, prune: bool) -> tabc.Generator[Node, None, bool]:
+        # Yields every node that is kept whole. If `prune`, the pairs outside `scope` are removed.
+        # Returns whether anything was (or would be) removed from `node` or below it.
+        plain = {index: key for index, key, _ in plain_keys(self.document, node)}
+        kept = list[tuple[Node, Node]]()
+        edited = False
+
+        for index, (key_node, value_node) in enumerate(node.value):
+            key = plain.get(index)
+            if not isinstance(key, str):
+                # Merge keys, Tagged keys, and non-string keys are never removed
+                kept.append((key_node, value_node))
+                yield key_node
+                yield value_node
+            elif key in scope:
+                kept.append((key_node, value_node))
+                sub_scope = scope[key]
+                if (
+                    isinstance(sub_scope, dict)
+                    and is_merged_mapping(value_node)
+                    and (self.references[id(value_node)] == 1)
+                ):
+                    edited |= yield from self.__walk(value_node, sub_scope, prune)
+                else:
+                    yield value_node
+
+        edited |= len(kept) != len(node.value)
+        if prune and edited:
+            node.value[:] = kept
+            self.document.mark_edited(node)
+        return edited
+
+    def kept(self, scope: Scope, *, prune: bool = False) -> tabc.Iterator[Node]:
+        node = self.document.node
+        if node is None:
+            return
+        elif is_merged_mapping(node):
+            yield from self.__walk(node, scope, prune)
+        else:
+            yield node
+
+
+def scope_to_base_path(documents: tabc.Sequence[ComposedDocument], base_path: BasePath | None) -> bool:
+    """
+    Removes everything outside ``base_path`` that cannot be referenced, before anything is constructed.
+
+    Subtrees outside ``base_path`` are kept whole if a ``!Ref`` or ``!Sub`` inside the kept nodes reads from them.
+    Nothing is removed if any reference cannot be narrowed to a key path (e.g. a JSON Path starting
+    with ``$..``, or a Tag like ``!ParseFile`` that can load references from elsewhere).
+
+    :param ~collections.abc.Sequence[ComposedDocument] documents: Documents in merge order. Modified in place.
+    :param BasePath | None base_path: Key path being read
+    :return: :py:data:`True`, if the documents were scoped.
+    """
+    if not base_path:
+        return False
+
+    scope: Scope = dict()
+    _add(scope, base_path)
+    layers = [_Layer(document) for document in documents]
+    finder = _ReferenceFinder()
+
+    # Widen the scope until every reference from inside it is inside it
+    widened = True
+    while widened:
+        widened = False
+        for layer in layers:
+            for node in layer.kept(scope):
+                found = finder.find(node)
+                if found is None or not all(found):  # `()` is the Root itself
+                    return False
+                for path in found:
+                    widened |= _add(scope, path)
+
+    for layer in layers:
+        consume(layer.kept(scope, prune=True))
+    return True
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import collections.abc as tabc
 import typing as typ
-from concurrent.futures import ThreadPoolExecutor
 
 from granular_configuration_language.yaml.classes import RT, P
 
@@ -11,6 +10,8 @@ class SimpleFuture(typ.Generic[P, RT]):
     __slots__ = ("_executor", "_future", "_func", "__weakref__")
 
     def __init__(self, func: tabc.Callable[P, RT], /, *args: P.args, **kwargs: P.kwargs) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
         self._executor = ThreadPoolExecutor(1)
         self._future = self._executor.submit(func, *args, **kwargs)
         self._func = func
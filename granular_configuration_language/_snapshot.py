@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import collections.abc as tabc
+import datetime as dt
+import decimal
+import keyword
+import math
+import typing as typ
+import uuid
+
+from granular_configuration_language._configuration import Configuration, MutableConfiguration
+from granular_configuration_language.exceptions import PlaceholderConfigurationError
+from granular_configuration_language.yaml.classes import LazyEval, Placeholder
+
+_INDENT: typ.Final = "    "
+_LITERALS: typ.Final = (str, bytes, int, bool, type(None))
+_CONTAINERS: typ.Final = (Configuration, MutableConfiguration, dict, list, tuple, set, frozenset)
+# Values that are not literals, but are rebuilt from their `repr` with just these imports
+_STANDARD_VALUES: typ.Final[tabc.Mapping[type, str]] = {
+    dt.date: "datetime",
+    dt.datetime: "datetime",
+    dt.time: "datetime",
+    dt.timedelta: "datetime",
+    decimal.Decimal: "decimal",
+    uuid.UUID: "uuid",
+}
+
+
+class _Renderer:
+    __slots__ = ("imports", "path", "unsupported")
+
+    def __init__(self) -> None:
+        self.imports = set[str]()
+        self.path = list[str]()
+        self.unsupported = list[str]()
+
+    def __refuse(self, kind: str) -> str:
+        self.unsupported.append(f"{''.join(self.path)}: {kind}")
+        return "None"
+
+    def __unsupported(self, value: typ.Any) -> str:
+        if isinstance(value, LazyEval):
+            return self.__refuse(value.tag)
+        elif isinstance(value, Placeholder):
+            return self.__refuse("!Placeholder")
+        else:
+            return self.__refuse(type(value).__name__)
+
+    def __render_key(self, key: typ.Any) -> str:
+        if isinstance(key, tuple):
+            return "(" + "".join(self.__render_key(item) + ", " for item in key) + ")"
+        elif type(key) in _LITERALS:
+            return repr(key)
+        else:
+            return self.__unsupported(key)
+
+    def __items(self, items: tabc.Iterable[str], depth: int) -> str:
+        inner = _INDENT * (depth + 1)
+        return "".join(f"\n{inner}{item}," for item in items) + "\n" + _INDENT * depth
+
+    def render(self, value: typ.Any, depth: int = 0, seen: frozenset[int] = frozenset()) -> str:
+        if type(value) not in _CONTAINERS:
+            return self.__render_scalar(value)
+        elif id(value) in seen:
+            return self.__unsupported(value)  # Recursive aliases
+        else:
+            return self.__render_container(value, depth, seen | {id(value)})
+
+    def __render_scalar(self, value: typ.Any) -> str:
+        value_type = type(value)
+        if value_type in _LITERALS:
+            return repr(value)
+        elif value_type is float:
+            return repr(value) if math.isfinite(value) else f'float("{value}")'
+        elif (value_type in _STANDARD_VALUES) and isinstance(getattr(value, "tzinfo", None), dt.timezone | None):
+            module = _STANDARD_VALUES[value_type]
+            self.imports.add(module)
+            if module == "datetime":
+                return repr(value)
+            else:
+                return f"{module}.{value_type.__name__}({str(value)!r})"
+        else:
+            return self.__unsupported(value)
+
+    def __render_container(self, value: typ.Any, depth: int, seen: frozenset[int]) -> str:
+        value_type = type(value)
+        if value_type in (Configuration, MutableConfiguration):
+            self.imports.add(value_type.__name__)
+            return f"{value_type.__name__}({{{self.__mapping(value, depth, seen)}}})"
+        elif value_type is dict:
+            return f"{{{self.__mapping(value, depth, seen)}}}"
+        elif value_type in (list, tuple):
+            items = self.__items(self.__sequence(value, depth, seen), depth) if value else ""
+            return f"[{items}]" if value_type is list else f"({items})"
+        else:
+            items = ", ".join(sorted(map(self.__render_key, value)))
+            if not items:
+                return f"{value_type.__name__}()"
+            else:
+                return f"{{{items}}}" if value_type is set else f"frozenset({{{items}}})"
+
+    def __mapping(self, mapping: tabc.Mapping, depth: int, seen: frozenset[int]) -> str:
+        if not mapping:
+            return ""
+
+        def items() -> tabc.Iterator[str]:
+            for key in mapping:
+                self.path.append(f".{key}" if isinstance(key, str) else f"[{key!r}]")
+                try:
+                    value = mapping[key]  # Evaluates every Tag
+                except PlaceholderConfigurationError:
+                    # Listed with the other values, instead of stopping at the first
+                    rendered = self.__refuse("!Placeholder")
+                else:
+                    rendered = self.render(value, depth + 1, seen)
+                yield f"{self.__render_key(key)}: {rendered}"
+                self.path.pop()
+
+        return self.__items(items(), depth)
+
+    def __sequence(self, sequence: tabc.Sequence, depth: int, seen: frozenset[int]) -> tabc.Iterator[str]:
+        for index, value in enumerate(sequence):
+            self.path.append(f"[{index}]")
+            yield self.render(value, depth + 1, seen)
+            self.path.pop()
+
+
+def check_name(name: str) -> None:
+    """
+    :raises ValueError: If ``name`` cannot be a module attribute
+    """
+    if (not name.isidentifier()) or keyword.iskeyword(name):
+        raise ValueError(f"`{name}` is not a valid Python identifier")
+
+
+def generate_snapshot(config: Configuration, *, name: str = "CONFIG") -> str:
+    """
+    Generates the source of a Python module that rebuilds ``config`` from literal constants.
+
+    Every Tag is evaluated. Importing the module is then just running (cached) bytecode.
+
+    :param Configuration config: Configuration to snapshot
+    :param str name: Name of the module attribute holding the configuration
+    :return: Python source
+    :raises ValueError: If ``name`` is not a valid Python identifier, or if any value cannot be rebuilt from
+        literals (e.g. ``!Func``, ``!Class``, ``!Mask``, or a ``!Placeholder``). Every offending path is listed.
+    """
+    check_name(name)
+
+    renderer = _Renderer()
+    renderer.path.append("$")
+    body = renderer.render(config)
+
+    if renderer.unsupported:
+        raise ValueError(
+            "Configuration has values that cannot be written as literals:\n"
+            + "\n".join(f"  - {path}" for path in renderer.unsupported)
+        )
+
+    configuration_imports = sorted(renderer.imports & {"Configuration", "MutableConfiguration"})
+    module_imports = sorted(renderer.imports - {"Configuration", "MutableConfiguration"})
+
+    lines = [
+        "# Generated by `python -m granular_configuration_language.snapshot`. Do not edit.",
+        *(f"import {module}" for module in module_imports),
+        f"from granular_configuration_language import {', '.join(configuration_imports)}",
+        "",
+        f"{name} = {body}",
+        "",
+    ]
+    return "\n".join(lines)
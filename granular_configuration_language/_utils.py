@@ -5,7 +5,9 @@ import os
 import sys
 import typing as typ
 from collections import OrderedDict, deque
+from contextlib import suppress
 from functools import partial
+from pathlib import Path
 
 from granular_configuration_language.exceptions import EnvironmentVaribleNotFound
 
@@ -65,3 +67,22 @@ def get_environment_variable(name: str, default: str | tabc.Callable[[], str] |
         return default()
     else:
         return default
+
+
+def write_atomically(path: Path, data: bytes) -> None:
+    """
+    Writes ``data`` to a temporary file beside ``path``, then renames it over ``path``,
+    so readers only ever see a complete file.
+    """
+    import tempfile
+
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=path.stem, suffix=".tmp")
+    temp = Path(temp_name)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        temp.replace(path)
+    except BaseException:
+        with suppress(OSError):
+            temp.unlink()
+        raise
@@ -4,7 +4,7 @@ if __name__ == "__main__":
     import operator as op
     import os
 
-    from granular_configuration_language.yaml._tags import handlers
+    from granular_configuration_language.yaml._tags import handlers, plugin_discovery
     from granular_configuration_language.yaml.decorators._viewer import AvailablePlugins, can_table
 
     choices = ["csv", "json"]
@@ -29,6 +29,15 @@ if __name__ == "__main__":
             help='In "table" mode, use long names. "Shortenings" lookup will not print.',
         )
 
+    parser.add_argument(
+        "--discovery",
+        action="store_true",
+        help="Only print whether plugins were read from the plugin cache",
+    )
+
     args = parser.parse_args()
 
-    print(op.methodcaller(args.type, shorten=args.long)(AvailablePlugins(handlers)))
+    if args.discovery:
+        print(plugin_discovery.describe())
+    else:
+        print(op.methodcaller(args.type, shorten=args.long)(AvailablePlugins(handlers)))
@@ -0,0 +1,37 @@
+# isort:skip_file
+if __name__ == "__main__":
+    import argparse
+    from pathlib import Path
+
+    from granular_configuration_language._base_path import read_base_path
+    from granular_configuration_language._bundle import compile_bundle
+    from granular_configuration_language._lazy_load_configuration import _read_locations
+    from granular_configuration_language.yaml.load._load_file import BUNDLE_FILE_EXTENSION
+
+    parser = argparse.ArgumentParser(
+        prog="python -m granular_configuration_language.compile",
+        description=(
+            "Compiles configuration files into a bundle that `LazyLoadConfiguration` loads without parsing or merging."
+            f" Pass the bundle (`{BUNDLE_FILE_EXTENSION}`) as a location."
+        ),
+    )
+    parser.add_argument("locations", nargs="*", help="Configuration file paths, in load order")
+    parser.add_argument("-o", "--output", type=Path, required=True, help=f"Bundle to write ({BUNDLE_FILE_EXTENSION})")
+    parser.add_argument("--base-path", default=None, help="Single key or JSON Pointer of the section to keep")
+    parser.add_argument("--use-env-location", action="store_true", help="Append locations from `G_CONFIG_LOCATION`")
+    parser.add_argument(
+        "--env-location-var-name",
+        default="G_CONFIG_LOCATION",
+        help="Environment variable to append locations from, default={G_CONFIG_LOCATION}",
+    )
+    parser.add_argument("--mutable", action="store_true", help="Compile for `MutableLazyLoadConfiguration` instead")
+
+    args = parser.parse_args()
+
+    count = compile_bundle(
+        _read_locations(args.locations, args.use_env_location, args.env_location_var_name),
+        args.output,
+        base_path=read_base_path(args.base_path),
+        mutable=args.mutable,
+    )
+    print(f"Compiled {count} file(s) into {args.output}")
@@ -96,3 +96,11 @@ class TagHadUnsupportArgument(ValueError):
     """
 
     pass
+
+
+class TypedConfigurationMismatch(ValueError):
+    """
+    .. versionadded:: 2.6.0
+    """
+
+    pass
@@ -6,7 +6,7 @@ import sys
 import typing as typ
 from collections.abc import Mapping
 from contextlib import suppress
-from functools import cached_property
+from functools import cache, cached_property
 
 import granular_configuration_language  # Avoid circular imports in type signatures
 from granular_configuration_language import Configuration
@@ -22,6 +22,14 @@ else:
         return func
 
 
+class _ConfigurationSource(typ.Protocol):
+    # What the proxies use of a `LazyLoadConfiguration`
+    @property
+    def config(self) -> Configuration: ...
+
+    def compile_path(self, path: str | tabc.Sequence[typ.Any]) -> granular_configuration_language.CompiledPath: ...
+
+
 @Configuration.register  # pyright: ignore
 class SafeConfigurationProxy(Mapping):
     """
@@ -48,12 +56,19 @@ class SafeConfigurationProxy(Mapping):
 
     __slots__ = ("__llc",)
 
-    def __init__(self, llc: granular_configuration_language.LazyLoadConfiguration) -> None:
+    def __init__(self, llc: _ConfigurationSource) -> None:
         self.__llc = llc
 
+    @property
+    def _source(self) -> _ConfigurationSource:
+        return self.__llc
+
     def __getattr__(self, name: str) -> typ.Any:
         return getattr(self.__llc.config, name)
 
+    def compile_path(self, path: str | tabc.Sequence[typ.Any]) -> granular_configuration_language.CompiledPath:
+        return self.__llc.compile_path(path)  # Does not load
+
     @override
     def __getitem__(self, key: typ.Any) -> typ.Any:
         return self.__llc.config[key]
@@ -83,6 +98,84 @@ class SafeConfigurationProxy(Mapping):
         return repr(self.__llc.config)
 
 
+class TypedConfigurationView(SafeConfigurationProxy):
+    """
+    .. versionadded:: 2.6.0
+
+    Base class of the views made by
+    :py:meth:`LazyLoadConfiguration.as_typed(..., cache_fields=True) <.LazyLoadConfiguration.as_typed>`.
+
+    Each view class is generated (and cached) for a :py:class:`.Configuration`
+    subclass, with a descriptor for each annotated attribute. On first read,
+    the descriptor reads the key (loading, if not loaded) and caches the value
+    on the instance, so later reads are plain attribute reads. Attributes that
+    are never read are never evaluated.
+
+    Sections annotated with a :py:class:`.Configuration` subclass are also
+    returned as views. Everything else is proxied like
+    :py:class:`.SafeConfigurationProxy`.
+
+    :param LazyLoadConfiguration llc:
+        :py:class:`.LazyLoadConfiguration` instance to be wrapped
+    """
+
+    __slots__ = ("__dict__",)
+
+    def _read_field(self, field: _CachedField) -> typ.Any:
+        from granular_configuration_language._materialize import MISSING
+
+        config = self._source.config
+        if (field.default is not MISSING) and (field.name not in config):
+            value = field.default
+        else:
+            value = getattr(config, field.name)
+
+        if (field.typed is not None) and isinstance(value, Configuration):
+            value = typed_view(field.typed)(_Section(value))
+        self.__dict__[field.name] = value  # Found before `_CachedField`, as it is a non-data descriptor
+        return value
+
+
+class _Section:
+    # Stands in for a `LazyLoadConfiguration`, so nested sections are viewed like the root
+    __slots__ = ("config",)
+
+    def __init__(self, config: Configuration) -> None:
+        self.config = config
+
+    def compile_path(self, path: str | tabc.Sequence[typ.Any]) -> granular_configuration_language.CompiledPath:
+        return granular_configuration_language.CompiledPath(lambda: self.config, path)
+
+
+class _CachedField:
+    __slots__ = ("default", "name", "typed")
+
+    def __init__(self, name: str, typed: type[Configuration] | None, default: typ.Any) -> None:
+        self.name = name
+        self.typed = typed
+        self.default = default
+
+    def __get__(self, instance: TypedConfigurationView | None, owner: type) -> typ.Any:
+        if instance is None:
+            return self
+        else:
+            return instance._read_field(self)  # noqa: SLF001
+
+
+@cache
+def typed_view(typed_base: type[Configuration]) -> type[TypedConfigurationView]:
+    from granular_configuration_language._materialize import typed_fields
+
+    namespace: dict[str, typ.Any] = {
+        field.name: _CachedField(*field)
+        for field in typed_fields(typed_base)
+        if not hasattr(TypedConfigurationView, field.name)  # e.g. `items`
+    }
+    namespace["__slots__"] = ()
+    namespace["__module__"] = typed_base.__module__
+    return type(f"{typed_base.__name__}View", (TypedConfigurationView,), namespace)
+
+
 def _eagerio_load(llc: granular_configuration_language.LazyLoadConfiguration) -> Configuration:
     return llc.config
 
@@ -0,0 +1,50 @@
+# isort:skip_file
+if __name__ == "__main__":
+    import argparse
+    import sys
+    from pathlib import Path
+
+    from granular_configuration_language import LazyLoadConfiguration, MutableLazyLoadConfiguration
+    from granular_configuration_language._snapshot import check_name, generate_snapshot
+
+    parser = argparse.ArgumentParser(
+        prog="python -m granular_configuration_language.snapshot",
+        description=(
+            "Evaluates a configuration and writes a Python module that rebuilds it from literal constants."
+            " Fails, listing their paths, if any value cannot be written as a literal."
+        ),
+    )
+    parser.add_argument("locations", nargs="*", help="Configuration file paths, in load order")
+    parser.add_argument("-o", "--output", type=Path, required=True, help="Python module to write (.py)")
+    parser.add_argument("--base-path", default=None, help="Single key or JSON Pointer of the section to snapshot")
+    parser.add_argument("--use-env-location", action="store_true", help="Append locations from `G_CONFIG_LOCATION`")
+    parser.add_argument(
+        "--env-location-var-name",
+        default="G_CONFIG_LOCATION",
+        help="Environment variable to append locations from, default={G_CONFIG_LOCATION}",
+    )
+    parser.add_argument("--name", default="CONFIG", help="Name of the module attribute, default={CONFIG}")
+    parser.add_argument("--mutable", action="store_true", help="Snapshot as a `MutableConfiguration` instead")
+
+    args = parser.parse_args()
+
+    try:
+        check_name(args.name)  # Before loading
+    except ValueError as e:
+        parser.error(str(e))
+
+    options = dict(
+        base_path=args.base_path,
+        use_env_location=args.use_env_location,
+        env_location_var_name=args.env_location_var_name,
+    )
+    loader = MutableLazyLoadConfiguration if args.mutable else LazyLoadConfiguration
+    config = loader(*args.locations, **options).config
+
+    try:
+        source = generate_snapshot(config, name=args.name)
+    except ValueError as e:
+        sys.exit(str(e))
+
+    args.output.write_text(source, encoding="utf-8")
+    print(f"Wrote {args.output}")
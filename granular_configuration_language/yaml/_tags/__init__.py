@@ -1,7 +1,35 @@
 from __future__ import annotations
 
+import collections.abc as tabc
 import typing as typ
 
+from granular_configuration_language.yaml.decorators._plugin_cache import discover_plugins
 from granular_configuration_language.yaml.decorators._tag_loader import load_tags
 
-handlers: typ.Final = load_tags()
+# Built-in Tags, by the module (relative to this package) that defines them.
+# Modules are only imported when one of their Tags is first used.
+BUILT_IN_TAGS: typ.Final[tabc.Mapping[str, str]] = {
+    "!Date": "._date",
+    "!DateTime": "._date",
+    "!Decimal": "._decimal",
+    "!Del": "._del",
+    "!Dict": "._dict",
+    "!EagerOptionalParseFile": "._eager_parse_file",
+    "!EagerParseFile": "._eager_parse_file",
+    "!Env": "._env",
+    "!EagerLoadBinary": "._load_binary",
+    "!LoadBinary": "._load_binary",
+    "!Mask": "._mask",
+    "!Merge": "._merge",
+    "!ParseEnv": "._parse_env",
+    "!ParseEnvSafe": "._parse_env",
+    "!OptionalParseFile": "._parse_file",
+    "!ParseFile": "._parse_file",
+    "!Placeholder": "._placeholder",
+    "!Ref": "._ref",
+    "!Sub": "._sub",
+    "!UUID": "._uuid",
+}
+
+plugin_discovery: typ.Final = discover_plugins()
+handlers: typ.Final = load_tags(discovery=plugin_discovery)
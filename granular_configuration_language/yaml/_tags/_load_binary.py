@@ -9,23 +9,23 @@ from granular_configuration_language.yaml.decorators import (
     with_tag,
 )
 from granular_configuration_language.yaml.decorators.eager_io import (
-    EagerIOBinaryFile,
+    EagerIOBinaryView,
     as_eager_io,
-    eager_io_binary_loader_interpolates,
+    eager_io_binary_view_loader_interpolates,
 )
 from granular_configuration_language.yaml.file_ops import as_file_path
-from granular_configuration_language.yaml.file_ops.binary import read_binary_data
+from granular_configuration_language.yaml.file_ops.binary import read_binary_view
 
 
 @string_tag(Tag("!LoadBinary"), "Undoc-ed")
 @as_lazy_with_load_options
 @interpolate_value_without_ref
 @with_tag
-def tag(tag: Tag, value: str, options: LoadOptions) -> bytes:
-    return read_binary_data(as_file_path(tag, value, options))
+def tag(tag: Tag, value: str, options: LoadOptions) -> bytes | memoryview:
+    return read_binary_view(as_file_path(tag, value, options))
 
 
 @string_tag(Tag("!EagerLoadBinary"), "Undoc-ed")
-@as_eager_io(eager_io_binary_loader_interpolates)
-def eager_(file: EagerIOBinaryFile) -> bytes:
-    return read_binary_data(file)
+@as_eager_io(eager_io_binary_view_loader_interpolates)
+def eager_(file: EagerIOBinaryView) -> bytes | memoryview:
+    return read_binary_view(file)
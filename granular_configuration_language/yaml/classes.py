@@ -5,9 +5,8 @@ import collections.abc as tabc
 import sys
 import typing as typ
 from dataclasses import dataclass
-from functools import cached_property
 from pathlib import Path
-from threading import RLock
+from threading import Event, Lock, get_ident
 from typing import Final  # autodoc didn't like typ.Final on a class attribute, so import Final
 
 if sys.version_info >= (3, 12):
@@ -133,11 +132,36 @@ class LazyRoot:
         return lazy_root
 
 
+_PENDING: typ.Final = object()
+"""
+State of a :py:class:`LazyEval` that has not been run
+"""
+
+_state_lock: typ.Final = Lock()
+"""
+Guards every :py:class:`LazyEval` state change. Never held while a Tag is running.
+"""
+
+
+class _Running:
+    """
+    State of a :py:class:`LazyEval` while a thread is running it.
+    """
+
+    __slots__ = ("done", "thread")
+
+    def __init__(self, thread: int) -> None:
+        self.thread: typ.Final = thread
+        self.done: Event | None = None  # Only made if another thread has to wait
+
+
 class LazyEval(abc.ABC, typ.Generic[RT]):
     """
     Base class for handling the output of a Tag that needs to be run just-in-time.
     """
 
+    __slots__ = ("__state", "tag")
+
     tag: Final[Tag]
     """
     Tag that created this instance
@@ -145,7 +169,7 @@ class LazyEval(abc.ABC, typ.Generic[RT]):
 
     def __init__(self, tag: Tag) -> None:
         self.tag = tag
-        self.__lock: RLock | None = RLock()
+        self.__state: typ.Any = _PENDING  # `_PENDING`, `_Running`, or the result
 
     @abc.abstractmethod
     def _run(self) -> RT:
@@ -163,28 +187,67 @@ class LazyEval(abc.ABC, typ.Generic[RT]):
         """
         ...
 
-    @cached_property
-    def __result(self) -> RT:
-        return self._run()
+    def _release(self) -> None:
+        """
+        Drop anything only needed by :py:meth:`_run` (e.g. the Tag's value, options, and Root).
 
-    def __run(self) -> RT:
-        if self.__lock is None:
-            return self.__result
-        else:
-            with self.__lock:
-                result = self.__result
-                self.__lock = None
-                return result
+        Called once, after the result is cached. Does nothing by default.
+
+        .. versionadded:: 2.6.0
+        """
+
+    def __run(self) -> RT | typ.Any:
+        thread = get_ident()
+        while True:
+            with _state_lock:
+                state = self.__state
+                if state is _PENDING:
+                    self.__state = running = _Running(thread)
+                    break
+                elif type(state) is not _Running:
+                    return state
+                elif state.thread == thread:
+                    # Re-entered while running (e.g. a reference loop), so run again, as a re-entrant lock would
+                    running = None
+                    break
+                elif state.done is None:
+                    state.done = Event()
+                done = state.done
+            # Another thread is running it. Wait, then take its result (or run it, if that thread raised).
+            done.wait()
+
+        try:
+            result = self._run()
+            while isinstance(result, LazyEval):
+                result = result.result
+        except BaseException:
+            if running:
+                self.__finish(running, _PENDING)
+            raise
+
+        if running:
+            self.__finish(running, result)
+            self._release()
+        return result
+
+    def __finish(self, running: _Running, state: typ.Any) -> None:
+        with _state_lock:
+            self.__state = state
+        if running.done:
+            running.done.set()
 
-    @cached_property
+    @property
     def result(self) -> RT | typ.Any:
         """
         Result of the lazy evaluation, completing any chains. (Cached)
+
+        Run once, even when read from multiple threads at the same time.
         """
-        result = self.__run()
-        while isinstance(result, LazyEval):
-            result = result.__run()  # noqa: SLF001
-        return result
+        state = self.__state
+        if (state is _PENDING) or (type(state) is _Running):
+            return self.__run()
+        else:
+            return state
 
     @override
     def __repr__(self) -> str:
@@ -201,15 +264,28 @@ class LazyEval(abc.ABC, typ.Generic[RT]):
     if sys.version_info >= (3, 11):
 
         @override
-        def __getstate__(self) -> typ.Any:
-            self.result  # noqa: B018  # Run to get rid of the RLock
-            return super().__getstate__()
+        def __getstate__(self) -> dict[str, typ.Any]:
+            result = self.result  # Run, so only the result is pickled
+            return getattr(self, "__dict__", {}) | {"tag": self.tag, "_LazyEval__state": result}
 
     else:
 
-        def __getstate__(self) -> typ.Any:
-            self.result  # noqa: B018  # Run to get rid of the RLock
-            return self.__dict__
+        def __getstate__(self) -> dict[str, typ.Any]:
+            result = self.result  # Run, so only the result is pickled
+            return getattr(self, "__dict__", {}) | {"tag": self.tag, "_LazyEval__state": result}
+
+    def __setstate__(self, state: dict[str, typ.Any]) -> None:
+        if "_LazyEval__state" in state:
+            state = dict(state)
+        else:
+            # Pickled before 2.6.0, with a lock and `cached_property` results
+            state = {key: value for key, value in state.items() if not key.startswith("_LazyEval__")}
+            state["_LazyEval__state"] = state.pop("result")
+        object.__setattr__(self, "tag", state.pop("tag"))  # `Final`
+        self.__state = state.pop("_LazyEval__state")
+        if hasattr(self, "__dict__"):
+            # Subclasses without `__slots__`
+            self.__dict__.update(state)
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
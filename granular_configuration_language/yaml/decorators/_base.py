@@ -6,12 +6,15 @@ import dataclasses
 import sys
 import typing as typ
 
-from ruamel.yaml import MappingNode, Node, SafeConstructor, ScalarNode, SequenceNode
-
+from granular_configuration_language._configuration import Configuration
 from granular_configuration_language.exceptions import ErrorWhileLoadingTags, TagHadUnsupportArgument
 from granular_configuration_language.yaml.classes import RT, StateHolder, T, Tag
 from granular_configuration_language.yaml.decorators._tag_tracker import HandlerAttributes, tracker
-from granular_configuration_language.yaml.load._constructors import construct_mapping, construct_sequence
+
+if typ.TYPE_CHECKING:
+    from ruamel.yaml import Node, SafeConstructor
+
+    from granular_configuration_language.yaml.load._constructors import ExtendedSafeConstructor
 
 if sys.version_info >= (3, 12):
     from typing import override
@@ -40,7 +43,7 @@ class TagConstructor:
     category: Category
     sort_as: SortedAs
     friendly_type: FriendlyType
-    constructor: tabc.Callable[[type[SafeConstructor], StateHolder], None]
+    constructor: tabc.Callable[[type[SafeConstructor]], None]
     plugin: str = dataclasses.field(default="Unknown", init=False)
     attributes: HandlerAttributes = dataclasses.field(init=False)
 
@@ -51,8 +54,8 @@ class TagConstructor:
     def set_plugin(self, plugin: str) -> None:
         object.__setattr__(self, "plugin", plugin)
 
-    def __call__(self, constructor: type[SafeConstructor], state: StateHolder) -> None:
-        return self.constructor(constructor, state)
+    def __call__(self, constructor: type[SafeConstructor]) -> None:
+        return self.constructor(constructor)
 
     @override
     def __repr__(self) -> str:
@@ -245,12 +248,15 @@ class TagDecoratorBase(typ.Generic[T], abc.ABC):
         mapping_node_transformer = self.mapping_node_transformer
 
         @tracker.wraps(handler)
-        def add_handler(
-            constructor: type[SafeConstructor],
-            state: StateHolder,
-        ) -> None:
+        def add_handler(constructor: type[SafeConstructor]) -> None:
+            # Only called once YAML is loaded, so `ruamel.yaml` is not imported with Tags
+            from ruamel.yaml import MappingNode, ScalarNode, SequenceNode
+
+            from granular_configuration_language.yaml.load._constructors import construct_mapping, construct_sequence
+
             @tracker.wraps(handler)
-            def type_handler(constructor: SafeConstructor, node: Node) -> RT:
+            def type_handler(constructor: ExtendedSafeConstructor, node: Node) -> RT:
+                state = constructor.state
                 try:
                     if isinstance(node, ScalarNode):
                         value = constructor.construct_scalar(node)
@@ -261,7 +267,9 @@ class TagDecoratorBase(typ.Generic[T], abc.ABC):
                         if isinstance(value, tabc.Sequence) and sequence_node_type_check(value):
                             return handler(tag, sequence_node_transformers(value), state)
                     elif isinstance(node, MappingNode):
-                        value = construct_mapping(state.options.obj_pairs_func, constructor, node)
+                        value = construct_mapping(
+                            typ.cast("type[Configuration]", state.options.obj_pairs_func), constructor, node
+                        )
                         if isinstance(value, tabc.Mapping) and mapping_node_type_check(value):
                             return handler(tag, mapping_node_transformer(value), state)
                     else:
@@ -127,7 +127,7 @@ def as_lazy_with_root(
         func: tabc.Callable[[T, Root], RT],
         /,
     ) -> tabc.Callable[[Tag, T, StateHolder], LazyEval[RT]]:
-        @tracker.wraps(func, needs_root_condition=needs_root_condition)
+        @tracker.wraps(func, is_with_root=True, needs_root_condition=needs_root_condition)
         def lazy_wrapper(tag: Tag, value: T, state: StateHolder) -> LazyEval[RT]:
             if (needs_root_condition is None) or needs_root_condition(value):
                 return LazyEvalWithRoot(tag, state.lazy_root_obj, lambda root: func(value, root))
@@ -168,7 +168,7 @@ def as_lazy_with_root_and_load_options(
             def tag(value: str, root: Root, options: LoadOptions) -> Any: ...
     """
 
-    @tracker.wraps(func)
+    @tracker.wraps(func, is_with_root=True)
     def lazy_wrapper(tag: Tag, value: T, state: StateHolder) -> LazyEvalWithRoot[RT]:
         options = state.options
         return LazyEvalWithRoot(tag, state.lazy_root_obj, lambda root: func(value, root, options))
@@ -18,12 +18,15 @@ else:
 
 
 def pickling_error_occur(*arg: typ.Any) -> typ.NoReturn:  # pragma: no cover
+    # Referenced by pickles made before 2.6.0. Unpickling them drops it.
     raise ErrorWhileLoadingConfig(
         "An error occurred due to unexpected state left by unpickling. Please report this with replication steps."
     )
 
 
 class LazyEvalBasic(LazyEval[RT]):
+    __slots__ = ("__value",)
+
     def __init__(self, tag: Tag, value: tabc.Callable[[], RT]) -> None:
         super().__init__(tag)
         self.__value = value
@@ -33,13 +36,14 @@ class LazyEvalBasic(LazyEval[RT]):
         return self.__value()
 
     @override
-    def __getstate__(self) -> typ.Any:
-        self.result  # noqa: B018  # Run to get rid of the RLock and before ruining this instance with pickling_error_occur
-        self.__value = pickling_error_occur
-        return super().__getstate__()
+    def _release(self) -> None:
+        # The closure holds the Tag's value and `LoadOptions`
+        del self.__value
 
 
 class LazyEvalWithRoot(LazyEval[RT]):
+    __slots__ = ("__lazy_root", "__value")
+
     def __init__(self, tag: Tag, root: LazyRoot, value: tabc.Callable[[Root], RT]) -> None:
         super().__init__(tag)
         self.__value = value
@@ -50,7 +54,15 @@ class LazyEvalWithRoot(LazyEval[RT]):
         return self.__value(self.__lazy_root.root)
 
     @override
-    def __getstate__(self) -> typ.Any:
-        self.result  # noqa: B018  # Run to get rid of the RLock and before ruining this instance with pickling_error_occur
-        self.__value = pickling_error_occur
-        return super().__getstate__()
+    def _release(self) -> None:
+        del self.__value, self.__lazy_root
+
+
+class LazySubtree(LazyEvalBasic[RT]):
+    """
+    A mapping that is only read or constructed when first accessed.
+
+    Unlike a Tag, it is evaluated when merged with another mapping, so it merges as the mapping it stands for.
+    """
+
+    __slots__ = ()
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import typing as typ
+from contextlib import suppress
+from pathlib import Path
+
+from granular_configuration_language._utils import write_atomically
+
+PLUGIN_CACHE_DIR_ENV = "G_CONFIG_PLUGIN_CACHE_DIR"
+ENTRY_POINT_GROUP = "granular_configuration_language_20_tag"
+
+# Bump when the layout of the manifest changes
+_FORMAT_VERSION = 1
+
+ModuleName = typ.NewType("ModuleName", str)
+PluginName = typ.NewType("PluginName", str)
+
+
+class PluginDiscovery(typ.NamedTuple):
+    """Every installed plugin (disabled or not) and where the list was read from."""
+
+    plugins: tuple[tuple[PluginName, ModuleName], ...]
+    from_cache: bool
+    manifest: Path | None
+
+    def describe(self) -> str:
+        if self.manifest is None:
+            return f"Plugins discovered from entry points. ({PLUGIN_CACHE_DIR_ENV} is not set)"
+        elif self.from_cache:
+            return f"Plugins read from cache: {self.manifest}"
+        else:
+            return f"Plugins discovered from entry points. Cached to: {self.manifest}"
+
+
+def _scan_entry_points() -> tuple[tuple[PluginName, ModuleName], ...]:
+    from importlib.metadata import entry_points
+
+    return tuple(
+        (PluginName(entry_point.name), ModuleName(entry_point.module))
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP)
+    )
+
+
+def _site_packages() -> frozenset[str]:
+    import site
+
+    # `site.getsitepackages` is missing in some virtual environments
+    return frozenset((*getattr(site, "getsitepackages", list)(), site.getusersitepackages()))
+
+
+def _holds_distributions(entry: str) -> bool:
+    try:
+        with os.scandir(entry) as scan:
+            return any(item.name.endswith((".dist-info", ".egg-info")) for item in scan)
+    except OSError:
+        return False
+
+
+def _site_directories() -> list[tuple[str, int | None]]:
+    # Installing or removing a distribution changes the modification time of the directory it is installed into.
+    # Only directories that can hold distributions are checked. The working and script directories are skipped,
+    # since any file being created or deleted there would invalidate the manifest.
+    def mtime_ns(entry: str) -> int | None:
+        try:
+            return os.stat(entry).st_mtime_ns  # noqa: PTH116
+        except OSError:
+            return None
+
+    # `sys.path[0]` is the script's directory (or the working directory for `-c` and `-m`), unless `-P` is used
+    entries = sys.path if getattr(sys.flags, "safe_path", False) else sys.path[1:]
+    skipped = {os.getcwd(), os.path.abspath(sys.path[0]) if sys.path else ""}  # noqa: PTH100, PTH109
+    site_packages = _site_packages()
+
+    return [
+        (entry, mtime_ns(entry))
+        for entry in entries
+        if entry
+        and (os.path.abspath(entry) not in skipped)  # noqa: PTH100
+        and ((entry in site_packages) or _holds_distributions(entry))
+    ]
+
+
+class PluginCache:
+    """
+    Persistent, on-disk manifest of the plugins found through entry points.
+
+    There is one manifest per interpreter and :py:data:`sys.path`. It is only used while the modification
+    time of every :py:data:`sys.path` directory that holds distributions (e.g. ``site-packages``) matches,
+    so installing or removing a distribution invalidates it. The working and script directories are not checked.
+    Manifests are written atomically and unreadable manifests are treated as misses.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    @classmethod
+    def from_environment(cls) -> PluginCache | None:
+        directory = os.environ.get(PLUGIN_CACHE_DIR_ENV, "").strip()
+        if directory:
+            return cls(Path(directory).expanduser())
+        else:
+            return None
+
+    def manifest(self) -> Path:
+        key = json.dumps([sys.executable, sys.version, sys.path])
+        return self.directory / f"plugins-{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def discover(self) -> PluginDiscovery:
+        manifest = self.manifest()
+        header = {"format_version": _FORMAT_VERSION, "site_directories": _site_directories()}
+
+        with suppress(Exception):
+            data = json.loads(manifest.read_bytes())
+            if {key: data[key] for key in header} == json.loads(json.dumps(header)):
+                plugins = tuple((PluginName(name), ModuleName(module)) for name, module in data["plugins"])
+                return PluginDiscovery(plugins, from_cache=True, manifest=manifest)
+
+        plugins = _scan_entry_points()
+        self.__store(manifest, header | {"plugins": plugins})
+        return PluginDiscovery(plugins, from_cache=False, manifest=manifest)
+
+    def __store(self, manifest: Path, data: dict[str, typ.Any]) -> None:
+        # A failure to write only costs the next start a scan
+        with suppress(Exception):
+            self.directory.mkdir(parents=True, exist_ok=True)
+            write_atomically(manifest, json.dumps(data).encode())
+
+
+def discover_plugins() -> PluginDiscovery:
+    """
+    Finds every installed plugin, reading the manifest in ``G_CONFIG_PLUGIN_CACHE_DIR``, if set.
+
+    Plugins are not filtered by ``G_CONFIG_DISABLE_PLUGINS`` here, so the manifest does not depend on it.
+    """
+    cache = PluginCache.from_environment()
+    if cache is None:
+        return PluginDiscovery(_scan_entry_points(), from_cache=False, manifest=None)
+    else:
+        return cache.discover()
@@ -5,17 +5,18 @@ import inspect
 import os
 import typing as typ
 from importlib import import_module
-from importlib.metadata import entry_points
 from importlib.util import resolve_name
-from itertools import chain, filterfalse, starmap
-from operator import attrgetter, itemgetter
-from pathlib import Path
+from itertools import filterfalse
+from operator import itemgetter
 
 from granular_configuration_language.yaml.decorators._base import Tag, TagConstructor
-from granular_configuration_language.yaml.decorators._tag_set import TagSet
-
-ModuleName = typ.NewType("ModuleName", str)
-PluginName = typ.NewType("PluginName", str)
+from granular_configuration_language.yaml.decorators._plugin_cache import (
+    ModuleName,
+    PluginDiscovery,
+    PluginName,
+    discover_plugins,
+)
+from granular_configuration_language.yaml.decorators._tag_set import TagLoader, TagSet
 
 
 def is_TagConstructor(obj: typ.Any) -> typ.TypeGuard[TagConstructor]:
@@ -30,57 +31,59 @@ def get_tags_in_module(module_name: ModuleName, plugin_name: PluginName) -> tabc
     return map(set_plugin, map(itemgetter(1), inspect.getmembers(import_module(module_name), is_TagConstructor)))
 
 
-def get_internal_tag_plugins() -> tabc.Iterator[ModuleName]:
+def get_internal_tag_plugins() -> tabc.Iterator[tuple[str, ModuleName]]:
     import granular_configuration_language.yaml._tags as tags
 
     tags_package = tags.__package__
-    tags_module_path = Path(tags.__file__).parent
-    private_sub_module_pattern = r"_[a-zA-Z]*.py"
-
-    def get_abs_name(module_name: str) -> ModuleName:
-        return ModuleName(resolve_name("." + module_name, package=tags_package))
-
-    return map(
-        get_abs_name,
-        filter(
-            None,
-            map(
-                inspect.getmodulename,
-                tags_module_path.glob(private_sub_module_pattern),
-            ),
-        ),
-    )
-
 
-def get_external_tag_plugins() -> tabc.Iterator[tuple[PluginName, ModuleName]]:
-    return map(attrgetter("name", "module"), entry_points(group="granular_configuration_language_20_tag"))
-
-
-def get_all_tag_plugins(*, disable_plugin: tabc.Set[str]) -> tabc.Iterator[tuple[ModuleName, PluginName]]:
-    builtin = PluginName("<gcl-built-in>")
+    for tag, module_name in tags.BUILT_IN_TAGS.items():
+        yield tag, ModuleName(resolve_name(module_name, package=tags_package))
 
-    for module in get_internal_tag_plugins():
-        yield module, builtin
 
-    for name, module in get_external_tag_plugins():
-        if name not in disable_plugin:
-            yield module, name
+def get_external_tag_plugins(discovery: PluginDiscovery | None = None) -> tabc.Iterator[tuple[PluginName, ModuleName]]:
+    return iter((discovery or discover_plugins()).plugins)
 
 
 def load_tags(
     *,
     disable_plugins: tabc.Set[str] = frozenset(),
     disable_tags: tabc.Set[Tag | str] = frozenset(),
+    discovery: PluginDiscovery | None = None,
 ) -> TagSet:
+    """
+    Registers every available Tag without importing any Tag module.
+
+    Built-in Tags are registered by name, so their module is imported when one of them is first used.
+    Plugin Tags are only known once their module is imported, so plugins are imported when a Tag that
+    is not built-in is first used.
+
+    Plugins are found with ``discovery``, or with :py:func:`discover_plugins`, if not provided.
+    """
     disable_plugins |= frozenset(filter(None, map(str.strip, os.getenv("G_CONFIG_DISABLE_PLUGINS", "").split(","))))
     disable_tags |= frozenset(filter(None, map(str.strip, os.getenv("G_CONFIG_DISABLE_TAGS", "").split(","))))
 
     def is_disable(tc: TagConstructor) -> bool:
         return tc.tag in disable_tags
 
+    def loader(module_name: ModuleName, plugin_name: PluginName) -> TagLoader:
+        return lambda: filterfalse(is_disable, get_tags_in_module(module_name, plugin_name))
+
+    builtin = PluginName("<gcl-built-in>")
+    loaders = dict[ModuleName, TagLoader]()
+    registry = dict[str, TagLoader]()
+
+    for tag, module_name in get_internal_tag_plugins():
+        if tag not in disable_tags:
+            if module_name not in loaders:
+                loaders[module_name] = loader(module_name, builtin)
+            registry[tag] = loaders[module_name]
+
     return TagSet(
-        filterfalse(
-            is_disable,
-            chain.from_iterable(starmap(get_tags_in_module, get_all_tag_plugins(disable_plugin=disable_plugins))),
-        )
+        (),
+        registry=registry,
+        plugins=[
+            loader(module_name, name)
+            for name, module_name in get_external_tag_plugins(discovery)
+            if name not in disable_plugins
+        ],
     )
@@ -4,6 +4,7 @@ import collections.abc as tabc
 import sys
 import typing as typ
 from collections import OrderedDict
+from threading import RLock
 
 from granular_configuration_language.exceptions import ErrorWhileLoadingTags
 from granular_configuration_language.yaml.decorators._base import Tag, TagConstructor
@@ -18,29 +19,97 @@ else:
         return func
 
 
+TagLoader: typ.TypeAlias = tabc.Callable[[], tabc.Iterable[TagConstructor]]
+
+
 class TagSet(tabc.Iterable[TagConstructor], tabc.Container[str]):
-    def __init__(self, tags: tabc.Iterable[TagConstructor]) -> None:
+    """
+    Tags by name.
+
+    Tags in ``registry`` or ``plugins`` are only imported when first needed. ``registry`` maps Tag names to
+    the loader of the module that defines them. ``plugins`` are loaders of modules whose Tags are unknown until
+    imported. They are imported when an unregistered Tag is looked up.
+    """
+
+    def __init__(
+        self,
+        tags: tabc.Iterable[TagConstructor],
+        *,
+        registry: tabc.Mapping[str, TagLoader] | None = None,
+        plugins: tabc.Iterable[TagLoader] = (),
+    ) -> None:
         self.__state: OrderedDict[Tag, TagConstructor] = OrderedDict()
+        self.__pending: dict[str, TagLoader] = dict(registry or {})
+        self.__plugins = list(plugins)
+        self.__lock = RLock()
 
         for tc in tags:
-            tag = tc.tag
-            if tag in self.__state:
-                raise ErrorWhileLoadingTags(
-                    f"Tag is already defined. `{repr(tc)}` attempted to replace `{repr(self.__state[tag])}`"
-                )
-            else:
-                self.__state[tag] = tc
+            self.__add(tc)
+
+    def __add(self, tc: TagConstructor, loader: TagLoader | None = None) -> None:
+        tag = tc.tag
+        pending = self.__pending.get(tag)
+        if (pending is not None) and (pending is not loader):
+            # Defined again before its registered module was imported. Import it, so the error names both.
+            self.__load(pending)
+
+        if tag in self.__state:
+            raise ErrorWhileLoadingTags(
+                f"Tag is already defined. `{repr(tc)}` attempted to replace `{repr(self.__state[tag])}`"
+            )
+        else:
+            self.__state[tag] = tc
+
+    def __load(self, loader: TagLoader) -> None:
+        # Callers hold the lock
+        for tc in loader():
+            self.__add(tc, loader)
+        for tag in [tag for tag, pending in self.__pending.items() if pending is loader]:
+            del self.__pending[tag]
+
+    def __load_plugins(self) -> None:
+        while self.__plugins:
+            self.__load(self.__plugins.pop(0))
+
+    def __load_all(self) -> None:
+        with self.__lock:
+            while self.__pending:
+                self.__load(next(iter(self.__pending.values())))
+            self.__load_plugins()
+
+    def get(self, tag: str) -> TagConstructor | None:
+        """
+        Returns the Tag's :py:class:`.TagConstructor`, importing the module that defines it on first use.
+
+        :return: :py:data:`None`, if the Tag is unknown.
+        """
+        if tag in self.__state:
+            return self.__state[Tag(tag)]
+
+        with self.__lock:
+            if tag in self.__pending:
+                self.__load(self.__pending[tag])
+            elif tag not in self.__state:
+                self.__load_plugins()
+            return self.__state.get(Tag(tag))
+
+    def registered_tags(self) -> tuple[str, ...]:
+        """Returns the Tags known without importing anything. Unregistered plugin Tags are not included."""
+        with self.__lock:
+            return (*self.__state, *self.__pending)
 
     @override
     def __contains__(self, x: typ.Any) -> bool:
-        return x in self.__state
+        return (x in self.__state) or (x in self.__pending) or (self.get(x) is not None)
 
     @override
     def __iter__(self) -> tabc.Iterator[TagConstructor]:
-        return iter(self.__state.values())
+        self.__load_all()
+        return iter(tuple(self.__state.values()))
 
     @override
     def __repr__(self) -> str:
+        self.__load_all()
         return f"TagSet{{{','.join(sorted(self.__state.keys()))}}}"
 
     def has_tags(self, *tags: Tag | str) -> bool:
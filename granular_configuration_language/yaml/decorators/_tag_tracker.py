@@ -17,6 +17,7 @@ class HandlerAttributes:
     is_eager: bool = False
     is_without_ref = False
     is_with_ref = False
+    is_with_root = False
     needs_root_condition: tabc.Callable | None = None
     eager_io: tabc.Callable | None = None
     tag: Tag = Tag("")
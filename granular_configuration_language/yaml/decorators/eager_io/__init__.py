@@ -7,7 +7,9 @@ from granular_configuration_language.yaml.decorators.eager_io._decorators import
 from granular_configuration_language.yaml.decorators.eager_io._funcs import (
     eager_io_binary_loader,
     eager_io_binary_loader_interpolates,
+    eager_io_binary_view_loader,
+    eager_io_binary_view_loader_interpolates,
     eager_io_text_loader,
     eager_io_text_loader_interpolates,
 )
-from granular_configuration_language.yaml.file_ops import EagerIOBinaryFile, EagerIOTextFile
+from granular_configuration_language.yaml.file_ops import EagerIOBinaryFile, EagerIOBinaryView, EagerIOTextFile
@@ -108,7 +108,7 @@ def as_eager_io_with_root_and_load_options(
         func: tabc.Callable[[IT, Root, LoadOptions], RT],
         /,
     ) -> tabc.Callable[[Tag, T, StateHolder], LazyEval[RT]]:
-        @tracker.wraps(func, eager_io=eager_io_preprocessor)
+        @tracker.wraps(func, is_with_root=True, eager_io=eager_io_preprocessor)
         def lazy_wrapper(tag: Tag, value: T, state: StateHolder) -> LazyEvalWithRoot[RT]:
             options = state.options
 
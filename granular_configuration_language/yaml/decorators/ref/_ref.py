@@ -5,8 +5,6 @@ import operator as op
 import re
 import typing as typ
 
-import jsonpath
-
 from granular_configuration_language.exceptions import (
     JSONPathQueryFailed,
     JSONPointerQueryFailed,
@@ -20,6 +18,8 @@ SUB_PATTERN: re.Pattern[str] = re.compile(r"(\$\{(?P<contents>.*?)\})")
 
 
 def _resolve_pointer(query: str, root: tabc.Mapping) -> typ.Any:
+    import jsonpath  # Only imported once a reference is resolved
+
     try:
         not_found = object()
 
@@ -37,6 +37,8 @@ def _resolve_pointer(query: str, root: tabc.Mapping) -> typ.Any:
 
 
 def _resolve_path(query: str, root: tabc.Mapping) -> typ.Any:
+    import jsonpath  # Only imported once a reference is resolved
+
     try:
         result = tuple(map(op.attrgetter("value"), jsonpath.finditer(query, root)))
 
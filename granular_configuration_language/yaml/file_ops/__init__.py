@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from granular_configuration_language.yaml.file_ops._chain import as_file_path
-from granular_configuration_language.yaml.file_ops.binary import EagerIOBinaryFile
+from granular_configuration_language.yaml.file_ops.binary import EagerIOBinaryFile, EagerIOBinaryView
 from granular_configuration_language.yaml.file_ops.environment_variable._environment_variable import (
     as_environment_variable_path,
     create_environment_variable_path,
@@ -1,8 +1,37 @@
 from __future__ import annotations
 
 import dataclasses
+import os
+import typing as typ
 from pathlib import Path
 
+MMAP_THRESHOLD_ENV: typ.Final = "G_CONFIG_MMAP_THRESHOLD"
+
+
+def _read_mmap_threshold() -> int | None:
+    value = os.environ.get(MMAP_THRESHOLD_ENV, "").strip()
+    if not value:
+        return None
+    elif value.isdigit() and (int(value) > 0):
+        return int(value)
+    else:
+        raise ValueError(f"`{MMAP_THRESHOLD_ENV}` must be a positive integer (bytes). Got: {value!r}")
+
+
+def _read_bytes(file: Path) -> bytes | memoryview:
+    threshold = _read_mmap_threshold()
+    if threshold is None:
+        return file.read_bytes()
+
+    with file.open("rb") as stream:
+        if os.fstat(stream.fileno()).st_size >= threshold:
+            import mmap
+
+            # The map outlives `stream`. It is released with the last view of it.
+            return memoryview(mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ))
+        else:
+            return stream.read()
+
 
 @dataclasses.dataclass(frozen=True)
 class EagerIOBinaryFile:
@@ -28,6 +57,33 @@ class EagerIOBinaryFile:
     """
 
 
+@dataclasses.dataclass(frozen=True)
+class EagerIOBinaryView:
+    """
+    Type: frozen :py:func:`dataclass <dataclasses.dataclass>`
+
+    .. versionadded:: 2.6.0
+
+    Same as :py:class:`.EagerIOBinaryFile`, except the contents may be memory-mapped.
+    """
+
+    path: Path
+    """
+    File path
+    """
+    exists: bool
+    """
+    :py:data:`True`, if the file exists, else :py:data:`False`
+    """
+    data: bytes | memoryview = dataclasses.field(repr=False, hash=False)
+    """
+    Contents of the file, if the file exists, else an empty :py:class:`bytes`
+
+    A read-only :py:class:`memoryview` of a memory-mapped file, if the file is at least
+    ``G_CONFIG_MMAP_THRESHOLD`` bytes.
+    """
+
+
 def load_binary_file(file: Path, /) -> EagerIOBinaryFile:
     """
     .. versionadded:: 2.3.0
@@ -45,6 +101,26 @@ def load_binary_file(file: Path, /) -> EagerIOBinaryFile:
         return EagerIOBinaryFile(file, exists, b"")
 
 
+def load_binary_view(file: Path, /) -> EagerIOBinaryView:
+    """
+    .. versionadded:: 2.6.0
+
+    Load the binary file as an :py:class:`.EagerIOBinaryView` instance
+
+    Same as :py:func:`load_binary_file`, except files of at least ``G_CONFIG_MMAP_THRESHOLD`` bytes are
+    memory-mapped. See :py:func:`read_binary_view`.
+
+    :param ~pathlib.Path file: file path
+    :return: Constructed instance
+    :rtype: EagerIOBinaryView
+    """
+    exists = file.exists()
+    if exists:
+        return EagerIOBinaryView(file, exists, _read_bytes(file))
+    else:
+        return EagerIOBinaryView(file, exists, b"")
+
+
 def read_binary_data(filename: Path | EagerIOBinaryFile, /) -> bytes:
     """
     .. versionadded:: 2.3.0
@@ -65,3 +141,32 @@ def read_binary_data(filename: Path | EagerIOBinaryFile, /) -> bytes:
             raise FileNotFoundError(f"[Errno 2] No such file or directory: '{filename.path}'")
     else:
         return filename.read_bytes()
+
+
+def read_binary_view(filename: Path | EagerIOBinaryView, /) -> bytes | memoryview:
+    """
+    .. versionadded:: 2.6.0
+
+    Read file contents.
+
+    Same as :py:func:`read_binary_data`, except files of at least ``G_CONFIG_MMAP_THRESHOLD`` bytes are
+    memory-mapped and returned as a read-only :py:class:`memoryview`, instead of being copied into
+    :py:class:`bytes`. Without ``G_CONFIG_MMAP_THRESHOLD``, this always returns :py:class:`bytes`.
+
+    .. admonition:: A :py:class:`memoryview` cannot be pickled
+        :class: caution
+
+        Pickling a :py:class:`.Configuration` that holds a mapped result raises :py:class:`TypeError`.
+
+    :param ~pathlib.Path | EagerIOBinaryView filename: File path
+    :raises FileNotFoundError: Errors if the file does not exist.
+    :return: File contents.
+    :rtype: bytes | memoryview
+    """
+    if isinstance(filename, EagerIOBinaryView):
+        if filename.exists:
+            return filename.data
+        else:
+            raise FileNotFoundError(f"[Errno 2] No such file or directory: '{filename.path}'")
+    else:
+        return _read_bytes(filename)
@@ -1,8 +1,24 @@
 from __future__ import annotations
 
 import dataclasses
+import os
+import typing as typ
+from contextlib import suppress
 from pathlib import Path
 
+# Files at least this large get a sequential read-ahead hint
+READ_AHEAD_THRESHOLD: typ.Final = 1024 * 1024
+
+
+def _read_text(file: Path) -> str:
+    with file.open() as stream:
+        if hasattr(os, "posix_fadvise"):
+            fd = stream.fileno()
+            if os.fstat(fd).st_size >= READ_AHEAD_THRESHOLD:
+                with suppress(OSError):  # Only a hint
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return stream.read()
+
 
 @dataclasses.dataclass(frozen=True)
 class EagerIOTextFile:
@@ -40,7 +56,7 @@ def load_text_file(file: Path, /) -> EagerIOTextFile:
     """
     exists = file.exists()
     if exists:
-        return EagerIOTextFile(file, exists, file.read_text())
+        return EagerIOTextFile(file, exists, _read_text(file))
     else:
         return EagerIOTextFile(file, exists, "")
 
@@ -65,4 +81,4 @@ def read_text_data(filename: Path | EagerIOTextFile, /) -> str:
         else:
             raise FileNotFoundError(f"[Errno 2] No such file or directory: '{filename.path}'")
     else:
-        return filename.read_text()
+        return _read_text(filename)
@@ -37,6 +37,7 @@ def safe_load_from_file(file: EagerIOTextFile | Path, /) -> typ.Any:
     :rtype: ~typing.Any
     """
 
-    from ruamel.yaml import YAML
+    from granular_configuration_language.yaml.load._yaml_pool import safe_yaml
 
-    return YAML(typ="safe").load(read_text_data(file))
+    with safe_yaml() as yaml:
+        return yaml.load(read_text_data(file))
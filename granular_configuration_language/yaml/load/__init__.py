@@ -1,3 +1,7 @@
 # isort:skip_file
 from granular_configuration_language.yaml.load._loads import loads, obj_pairs_func, sequence_func
-from granular_configuration_language.yaml.load._load_file import load_file  # Depends on `loads`
+from granular_configuration_language.yaml.load._load_file import (
+    ComposedFile,
+    compose_file,
+    load_file,
+)  # Depends on `loads`
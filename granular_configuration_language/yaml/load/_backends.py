@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import abc
+import collections.abc as tabc
+import importlib
+import os
+import re
+import typing as typ
+from functools import cache, cached_property
+
+from ruamel.yaml import YAML, MappingNode, Node, SafeConstructor, ScalarNode, SequenceNode
+from ruamel.yaml.resolver import VersionedResolver
+
+from granular_configuration_language.yaml.classes import StateHolder
+from granular_configuration_language.yaml.load import _yaml_pool as yaml_pool
+
+if typ.TYPE_CHECKING:
+    from granular_configuration_language.yaml.load._lazy_subtrees import Source
+
+YAML_BACKEND_ENV = "G_CONFIG_YAML_BACKEND"
+
+YAMLVersion: typ.TypeAlias = tuple[int, int]
+
+_YAML_DIRECTIVE = re.compile(r"%YAML[ \t]+(\d+)\.(\d+)[ \t]*(?:#.*)?$", re.MULTILINE)
+_SUPPORTED_VERSIONS: tabc.Set[YAMLVersion] = frozenset(((1, 1), (1, 2)))
+
+
+def read_yaml_version(config_str: str) -> YAMLVersion | None:
+    # Only a leading `%YAML` directive is honored. This matches the previous `startswith("%YAML")` check.
+    if config_str.startswith("%YAML") and (match := _YAML_DIRECTIVE.match(config_str)):
+        return int(match[1]), int(match[2])
+    else:
+        return None
+
+
+class _StatefulYAML(YAML):
+    # Only used to construct nodes. Parsing is done by a `Backend`.
+    def __init__(self, *, state: StateHolder, version: YAMLVersion | None) -> None:
+        super().__init__(typ="safe", pure=True)
+        self.reset(state=state, version=version)
+
+    def reset(self, *, state: StateHolder, version: YAMLVersion | None, source: Source | None = None) -> None:
+        # Construction of some scalars depends on the processing version, so it must be set from the document.
+        # `YAML.resolver` is rebuilt when the version changes.
+        self.version = version
+        self.__state: StateHolder | None = state
+        self.__source = source
+
+    def clear(self) -> None:
+        # Idle instances must not keep the last document's Root (or text) alive
+        self.__state = None
+        self.__source = None
+        if (constructor := getattr(self, "_constructor", None)) is not None:
+            constructor.state = None
+            constructor.source = None
+
+    def construct(self, node: Node | None) -> typ.Any:
+        if node is None:
+            return None
+        constructor = self.constructor
+        constructor.state = self.__state
+        constructor.source = self.__source
+        return constructor.construct_document(node)
+
+    def construct_object(self, node: Node) -> typ.Any:
+        # Constructs part of the document ahead of `construct`, which reuses the result
+        constructor = self.constructor
+        constructor.state = self.__state
+        constructor.source = self.__source
+        return constructor.construct_object(node, deep=True)
+
+
+class Backend(abc.ABC):
+    """
+    Parses YAML text into a :py:mod:`ruamel.yaml` node graph.
+
+    Construction, and therefore Tag dispatch, is always done by this library's constructor class,
+    so every backend produces the same result.
+    """
+
+    name: typ.ClassVar[str]
+
+    @staticmethod
+    def is_available() -> bool:
+        return True
+
+    @abc.abstractmethod
+    def compose(self, config_str: str, version: YAMLVersion | None) -> Node | None: ...
+
+
+class RuamelBackend(Backend):
+    """Pure-Python :py:mod:`ruamel.yaml` parser. Always available."""
+
+    name = "ruamel"
+
+    @staticmethod
+    def _new_yaml() -> YAML:
+        return YAML(typ="safe", pure=True)
+
+    def compose(self, config_str: str, version: YAMLVersion | None) -> Node | None:
+        yaml = yaml_pool.acquire("compose", SafeConstructor, self._new_yaml)
+        yaml.version = version
+        node = yaml.compose(config_str)
+        yaml_pool.release("compose", SafeConstructor, yaml)  # Only a document that parsed leaves it clean
+        return node
+
+
+class RuamelClibBackend(Backend):
+    """libyaml-based parser from ``ruamel.yaml.clib``."""
+
+    name = "ruamel-clib"
+
+    @staticmethod
+    def is_available() -> bool:
+        from ruamel.yaml.main import CParser
+
+        return CParser is not None
+
+    @cached_property
+    def composer_class(self) -> type:
+        from ruamel.yaml.main import CParser
+
+        # `YAML.load` builds an equivalent class on every call. This one is built once.
+        class RuamelClibComposer(CParser, VersionedResolver):  # type: ignore[misc]
+            def __init__(self, stream: str, version: YAMLVersion | None) -> None:
+                CParser.__init__(self, stream)
+                VersionedResolver.__init__(self, version=version)
+
+        return RuamelClibComposer
+
+    def compose(self, config_str: str, version: YAMLVersion | None) -> Node | None:
+        composer = self.composer_class(config_str, version)
+        try:
+            return typ.cast("Node | None", composer.get_single_node())
+        finally:
+            composer.dispose()
+
+
+class PyYAMLBackend(Backend):
+    """
+    libyaml-based parser from PyYAML (``CParser``).
+
+    Scalars are resolved with :py:mod:`ruamel.yaml`'s resolver and the nodes are copied into
+    :py:mod:`ruamel.yaml` nodes. Documents that PyYAML's newer libyaml reads differently (plain
+    scalars holding ``:`` inside flow collections), and documents with errors, are parsed again by
+    the ``ruamel.yaml`` parser used before backends were added, so results and error messages do
+    not change.
+    """
+
+    name = "pyyaml"
+
+    @staticmethod
+    def is_available() -> bool:
+        try:
+            return bool(importlib.import_module("yaml").__with_libyaml__)
+        except ImportError:
+            return False
+
+    @cached_property
+    def composer_class(self) -> type:
+        pyyaml = importlib.import_module("yaml")
+        CParser: typ.Any = importlib.import_module("yaml._yaml").CParser
+        kinds = {pyyaml.ScalarNode: ScalarNode, pyyaml.SequenceNode: SequenceNode, pyyaml.MappingNode: MappingNode}
+
+        class PyYAMLComposer(CParser):  # type: ignore[misc]
+            def __init__(self, stream: str, version: YAMLVersion | None) -> None:
+                super().__init__(stream)
+                self.__resolver = VersionedResolver(version=version)
+
+            def resolve(self, kind: type, value: str | None, implicit: tuple[bool, bool]) -> typ.Any:
+                return self.__resolver.resolve(kinds[kind], value, implicit)
+
+            def descend_resolver(self, current_node: typ.Any, current_index: typ.Any) -> None:
+                pass
+
+            def ascend_resolver(self) -> None:
+                pass
+
+        return PyYAMLComposer
+
+    @staticmethod
+    def _copy_node(node: typ.Any, memo: dict[int, Node], in_flow: bool) -> Node:
+        # Anchors come before their aliases, so the first visit of a node is where it was written
+        if (id_ := id(node)) in memo:  # Aliases share nodes
+            return memo[id_]
+
+        new: Node
+        if node.id == "scalar":
+            if in_flow and (not node.style) and (":" in node.value):  # Plain scalars have no style
+                raise _ParseAgain
+            new = memo[id_] = ScalarNode(node.tag, node.value, node.start_mark, node.end_mark, style=node.style)
+        elif node.id == "sequence":
+            in_flow = in_flow or bool(node.flow_style)
+            new = memo[id_] = SequenceNode(node.tag, [], node.start_mark, node.end_mark, flow_style=node.flow_style)
+            new.value.extend(PyYAMLBackend._copy_node(child, memo, in_flow) for child in node.value)
+        else:
+            in_flow = in_flow or bool(node.flow_style)
+            new = memo[id_] = MappingNode(node.tag, [], node.start_mark, node.end_mark, flow_style=node.flow_style)
+            new.value.extend(
+                (PyYAMLBackend._copy_node(key, memo, in_flow), PyYAMLBackend._copy_node(value, memo, in_flow))
+                for key, value in node.value
+            )
+        return new
+
+    def compose(self, config_str: str, version: YAMLVersion | None) -> Node | None:
+        composer = self.composer_class(config_str, version)
+        try:
+            node = composer.get_single_node()
+            if node is None:
+                return None
+            else:
+                return self._copy_node(node, dict(), False)
+        except (importlib.import_module("yaml").YAMLError, _ParseAgain):
+            return _previous_backend().compose(config_str, version)
+        finally:
+            composer.dispose()
+
+
+class _ParseAgain(Exception):
+    # Raised while copying a PyYAML node graph that `ruamel.yaml` would not have parsed the same way
+    pass
+
+
+@cache
+def _previous_backend() -> Backend:
+    # `YAML(typ="safe")`, as used before backends were added, parses with `ruamel.yaml.clib`, when it is installed
+    return next(backend() for backend in (RuamelClibBackend, RuamelBackend) if backend.is_available())
+
+
+_BACKENDS: typ.Final[tabc.Mapping[str, type[Backend]]] = {
+    backend.name: backend for backend in (RuamelClibBackend, PyYAMLBackend, RuamelBackend)
+}
+
+
+@cache
+def get_backend(name: str) -> Backend:
+    """
+    Selects the parser backend.
+
+    ``auto`` uses the first available of ``ruamel-clib``, ``pyyaml``, and ``ruamel``.
+    A selected backend that is not available falls back to ``auto``.
+    """
+    name = name.strip().lower() or "auto"
+    if name == "auto":
+        candidates: tabc.Iterable[type[Backend]] = _BACKENDS.values()
+    elif name in _BACKENDS:
+        candidates = (_BACKENDS[name], *_BACKENDS.values())
+    else:
+        raise ValueError(f"`{YAML_BACKEND_ENV}` must be one of: auto, {', '.join(_BACKENDS)}. Got: {name!r}")
+
+    return next(backend() for backend in candidates if backend.is_available())
+
+
+def select_backend(config_str: str, version: YAMLVersion | None) -> Backend:
+    """Selects the backend that :py:func:`compose` parses ``config_str`` with."""
+    if (version not in _SUPPORTED_VERSIONS) and config_str.startswith("%YAML"):
+        # The C parsers ignore `%YAML` directives, so the unusual ones are left for ruamel to handle
+        return get_backend(RuamelBackend.name)
+    else:
+        return get_backend(os.environ.get(YAML_BACKEND_ENV, "auto"))
+
+
+def compose(config_str: str, version: YAMLVersion | None) -> Node | None:
+    backend = select_backend(config_str, version)
+    if version not in _SUPPORTED_VERSIONS:
+        version = None  # ruamel reads unusual `%YAML` directives itself
+    return backend.compose(config_str, version)
@@ -4,28 +4,71 @@ import collections.abc as tabc
 import typing as typ
 
 from ruamel.yaml import MappingNode, SafeConstructor, SequenceNode
+from ruamel.yaml.constructor import ConstructorError
 
-from granular_configuration_language.yaml.classes import LazyEval
+from granular_configuration_language._configuration import Configuration
+from granular_configuration_language._s import setter_secret
+from granular_configuration_language.yaml.classes import LazyEval, StateHolder
 
+if typ.TYPE_CHECKING:
+    from granular_configuration_language.yaml.load._lazy_subtrees import Source
 
-def construct_mapping(cls: type, constructor: SafeConstructor, node: MappingNode) -> tabc.Mapping[typ.Any, typ.Any]:
-    node.value = [pair for pair in node.value if pair[0].tag != "!Del"]
 
-    value: tabc.Mapping = cls(constructor.construct_mapping(node, deep=False))
+class ExtendedSafeConstructor(SafeConstructor):
+    """
+    Base for the precompiled constructor classes.
+
+    Constructor classes are shared between loads, so the load specific
+    :py:class:`.StateHolder` is injected into each instance as ``state``.
+    With ``G_CONFIG_LAZY_SUBTREES``, the document's text is injected as ``source``.
+    """
+
+    state: StateHolder
+    source: Source | None = None
+
+
+def construct_mapping(
+    cls: type[Configuration], constructor: ExtendedSafeConstructor, node: MappingNode
+) -> tabc.Mapping[typ.Any, typ.Any]:
+    # Single pass replacement of `SafeConstructor.construct_mapping` that:
+    #  - drops `!Del` entries
+    #  - rejects `LazyEval` keys
+    #  - builds the backing `dict` for `cls`, so the mapping is allocated once
+    #  - with a `source`, leaves nested mappings to be constructed when first read
+    source = constructor.source
+    constructor.flatten_mapping(node)
+    check_duplicates = node.merge is None  # Merge keys are allowed to be overridden
+
+    data: dict[typ.Any, typ.Any] = dict()
+    for key_node, value_node in node.value:
+        if key_node.tag == "!Del":
+            continue
+
+        key = constructor.construct_object(key_node, deep=True)
 
-    for key in value:
         if isinstance(key, LazyEval):
             raise TypeError("Lazy Tags are not allowed as keys to mappings.")
+        elif isinstance(key, list):
+            key = tuple(key)
+
+        if not isinstance(key, tabc.Hashable):
+            raise ConstructorError(
+                "while constructing a mapping", node.start_mark, "found unhashable key", key_node.start_mark
+            )
+
+        if (source is not None) and ((subtree := source.defer(value_node)) is not None):
+            value = subtree
+        else:
+            value = constructor.construct_object(value_node, deep=False)
 
-    return cls(constructor.construct_mapping(node, deep=False))
+        if (not check_duplicates) or constructor.check_mapping_key(node, key_node, data, key, value):
+            data[key] = value
+
+    return cls._from_dict(data, setter_secret)  # noqa: SLF001
 
 
 def construct_sequence(
     cls: type[list | tuple], constructor: SafeConstructor, node: SequenceNode
 ) -> tabc.Sequence[typ.Any]:
-    value = constructor.construct_sequence(node, deep=False)
-
-    if isinstance(value, cls):
-        return value
-    else:
-        return cls(value)
+    construct_object = constructor.construct_object
+    return cls(construct_object(child, deep=False) for child in node.value)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+import re
+import typing as typ
+from functools import partial
+
+from ruamel.yaml import Node
+from ruamel.yaml.resolver import BaseResolver
+
+from granular_configuration_language._configuration import Configuration
+from granular_configuration_language._overrides import count_references, is_merged_mapping
+from granular_configuration_language.yaml.classes import StateHolder, Tag
+from granular_configuration_language.yaml.decorators._lazy_eval import LazySubtree
+from granular_configuration_language.yaml.load._backends import _SUPPORTED_VERSIONS, YAMLVersion, compose
+
+LAZY_SUBTREES_ENV: typ.Final = "G_CONFIG_LAZY_SUBTREES"
+
+_MAPPING_TAG: typ.Final = Tag(str(BaseResolver.DEFAULT_MAPPING_TAG))
+_TAG_DIRECTIVE: typ.Final = re.compile(r"^%TAG\b", re.MULTILINE)
+
+
+class MappingSubtree(LazySubtree[Configuration]):
+    """A mapping that is composed and constructed from its span of the document when first accessed."""
+
+    __slots__ = ()
+
+
+class Source:
+    """
+    The text a document was composed from.
+
+    Mappings nested in mappings are held as their span of the text, instead of as nodes, because nodes
+    take several times the memory of the configuration constructed from them. A span is composed again,
+    on its own, when it is first read or merged with.
+    """
+
+    __slots__ = ("edited", "offset", "state", "text", "version")
+
+    def __init__(self, text: str, state: StateHolder, version: YAMLVersion | None, offset: int = 0) -> None:
+        self.text = text
+        self.state = state
+        self.version = version
+        self.offset = offset  # Added to mark indexes, when composed from a span
+        # Mapping nodes changed after composing (see `ComposedDocument.mark_edited`). Their spans are stale.
+        self.edited = set[int]()
+
+    def defer(self, node: Node) -> MappingSubtree | None:
+        """Returns a stand-in for ``node``, if it can be composed again from its span."""
+        start, end = node.start_mark, node.end_mark
+        # Nodes read from a bundle have no marks
+        if (not is_merged_mapping(node)) or (start is None) or (end is None) or (id(node) in self.edited):
+            return None
+        return MappingSubtree(
+            _MAPPING_TAG,
+            partial(self.__construct, start.index + self.offset, end.index + self.offset, start.line, start.column),
+        )
+
+    def __construct(self, start: int, end: int, line: int, column: int) -> Configuration:
+        from granular_configuration_language.yaml.load._load_yaml_string import acquire_yaml, release_yaml
+
+        # Padding places the span at its original line and column, so marks in errors match the file
+        node = compose("\n" * line + " " * column + self.text[start:end], self.version)
+        yaml = acquire_yaml(
+            self.state, self.version, source=Source(self.text, self.state, self.version, start - line - column)
+        )
+        result = yaml.construct(node)
+        release_yaml(yaml)
+        return result
+
+
+def lazy_subtrees_source(
+    config_str: str, state: StateHolder, version: YAMLVersion | None, node: Node | None
+) -> Source | None:
+    """
+    Returns the :py:class:`Source` to defer nested mappings with, if ``G_CONFIG_LAZY_SUBTREES`` is ``TRUE``.
+
+    Mutable configurations are always fully constructed. So are documents that share nodes through
+    aliases, as each span is constructed on its own, and documents whose spans cannot be composed
+    on their own (``%TAG`` directives or an unsupported ``%YAML`` version).
+    """
+    if (
+        (node is None)
+        or state.options.mutable
+        or (os.environ.get(LAZY_SUBTREES_ENV, "FALSE") != "TRUE")
+        or ((version is not None) and (version not in _SUPPORTED_VERSIONS))
+        or _TAG_DIRECTIVE.search(config_str)
+        or any(count > 1 for count in count_references(node).values())  # Shared through aliases
+    ):
+        return None
+    else:
+        return Source(config_str, state, version)
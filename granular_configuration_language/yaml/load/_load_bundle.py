@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import collections.abc as tabc
+import json
+import marshal
+import typing as typ
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
+from pathlib import Path
+from threading import RLock
+
+from granular_configuration_language._configuration import Configuration
+from granular_configuration_language._s import setter_secret
+from granular_configuration_language.yaml.classes import LazyEval, LazyRoot, Placeholder, Tag
+from granular_configuration_language.yaml.decorators._lazy_eval import LazyEvalBasic, LazySubtree
+from granular_configuration_language.yaml.load._loads import make_state, obj_pairs_func
+
+if typ.TYPE_CHECKING:
+    from ruamel.yaml import Node
+
+    from granular_configuration_language.yaml.load._backends import YAMLVersion, _StatefulYAML
+
+BUNDLE_TAG: typ.Final = Tag("!Bundle")
+
+_MAGIC: typ.Final = b"GCL-BUNDLE\n"
+# Bump when the layout of a bundle changes
+FORMAT_VERSION: typ.Final = 2
+# Version of the `marshal` format that subtrees are written with
+MARSHAL_VERSION: typ.Final = 4
+
+# A bundle only holds plain data (a JSON header, then `marshal`-ed subtrees), so reading one cannot run code.
+# In a subtree, `None`, `bool`, `int`, `float`, `str`, and `bytes` are stored as themselves. Every other value
+# is stored as a `tuple` starting with one of these kinds. Containers, Tags, and nodes also have a reference
+# number, so values shared through an alias stay shared.
+REF: typ.Final = 0  # (REF, ref)
+DICT: typ.Final = 1  # (DICT, ref, ((key, value), ...))
+LIST: typ.Final = 2  # (LIST, ref, (item, ...))
+TUPLE: typ.Final = 3  # (TUPLE, ref, (item, ...))
+SET: typ.Final = 4  # (SET, (item, ...))
+DATE: typ.Final = 5  # (DATE, year, month, day)
+DATETIME: typ.Final = 6  # (DATETIME, (year, month, day, hour, minute, second, microsecond), utc_offset, tzname)
+PLACEHOLDER: typ.Final = 7  # (PLACEHOLDER, message)
+TAGGED: typ.Final = 8  # (TAGGED, ref, layer, node)
+MERGED: typ.Final = 9  # (MERGED, ref, (part, ...))
+SUBTREE: typ.Final = 10  # (SUBTREE, offset, length)
+SCALAR_NODE: typ.Final = 11  # (SCALAR_NODE, ref, tag, value, style)
+SEQUENCE_NODE: typ.Final = 12  # (SEQUENCE_NODE, ref, tag, (node, ...), flow_style)
+MAPPING_NODE: typ.Final = 13  # (MAPPING_NODE, ref, tag, ((key_node, value_node), ...), flow_style)
+
+PLAIN_TYPES: typ.Final = frozenset((type(None), bool, int, float, str, bytes))
+
+
+class Tagged:
+    """A Tag, stored as its node. It is constructed when the mapping holding it is read."""
+
+    __slots__ = ("layer", "node")
+
+    def __init__(self, layer: int, node: Node) -> None:
+        self.layer = layer
+        self.node = node
+
+
+class Merged:
+    """Values from several layers. Merging them depends on what the Tag in the first one evaluates to."""
+
+    __slots__ = ("parts",)
+
+    def __init__(self, parts: tuple[typ.Any, ...]) -> None:
+        self.parts = parts
+
+
+class Subtree:
+    """A mapping stored on its own, so it is only read when first accessed."""
+
+    __slots__ = ("length", "offset")
+
+    def __init__(self, offset: int, length: int) -> None:
+        self.offset = offset
+        self.length = length
+
+
+class BundleHeader(typ.NamedTuple):
+    format_version: int
+    ruamel_version: str
+    mutable: bool
+    base_path: tuple[str, ...]
+    layers: tuple[tuple[str, YAMLVersion | None], ...]
+    root: tuple[int, int]
+
+
+def dump_bundle(header: BundleHeader, body: bytes) -> bytes:
+    return _MAGIC + json.dumps(header._asdict()).encode() + b"\n" + body
+
+
+def _load_header(line: bytes) -> BundleHeader:
+    try:
+        fields = json.loads(line)
+        header: BundleHeader | None = BundleHeader(
+            format_version=fields["format_version"],
+            ruamel_version=str(fields["ruamel_version"]),
+            mutable=bool(fields["mutable"]),
+            base_path=tuple(map(str, fields["base_path"])),
+            layers=tuple(
+                (str(path), None if version is None else (int(version[0]), int(version[1])))
+                for path, version in fields["layers"]
+            ),
+            root=(int(fields["root"][0]), int(fields["root"][1])),
+        )
+    except (ValueError, TypeError, KeyError, IndexError):  # E.g. a bundle from before the header was JSON
+        header = None
+
+    if (header is None) or (header.format_version != FORMAT_VERSION):
+        raise ValueError("Bundle was compiled by an incompatible version. It must be recompiled.")
+    return header
+
+
+class BundleSubtree(LazySubtree[Configuration]):
+    """A mapping from a bundle that has not been read yet."""
+
+    __slots__ = ()
+
+
+def _merge_layers(mapping_type: type[Configuration], parts: list[typ.Any]) -> typ.Any:
+    # Merges exactly as building would have, now that the Tag can be evaluated
+    from granular_configuration_language._build import _merge_into_base
+
+    holder = mapping_type()
+    holder._private_set(None, parts[0], setter_secret)  # noqa: SLF001
+    for part in parts[1:]:
+        _merge_into_base(mapping_type, holder, mapping_type._from_dict({None: part}, setter_secret))  # noqa: SLF001
+    return holder[None]
+
+
+class BundleDocument:
+    """
+    A compiled bundle (see ``python -m granular_configuration_language.compile``).
+
+    Every layer is already merged, so there is nothing to parse or merge. Mappings that were stored
+    on their own are only read when first accessed. Tags are stored as nodes and constructed
+    (against the file they came from) when the mapping holding them is read.
+    """
+
+    __slots__ = ("__base_path", "__data", "__header", "__lazy_root", "__lock", "__mutable", "__path", "__yamls")
+
+    def __init__(self, path: Path, *, lazy_root: LazyRoot, mutable: bool, base_path: tabc.Sequence[str]) -> None:
+        self.__path = path
+        self.__lazy_root = lazy_root
+        self.__mutable = mutable
+        self.__base_path = tuple(base_path)
+        self.__lock = RLock()
+        self.__data = memoryview(b"")
+        self.__yamls: list[_StatefulYAML | None] = []
+
+    def __read_header(self) -> BundleHeader:
+        from ruamel.yaml import __version__ as ruamel_version
+
+        data = self.__path.read_bytes()
+        if not data.startswith(_MAGIC):
+            raise ValueError("Not a compiled configuration bundle")
+
+        body_start = data.find(b"\n", len(_MAGIC)) + 1
+        header = _load_header(data[len(_MAGIC) : body_start])
+        if header.ruamel_version != ruamel_version:
+            raise ValueError("Bundle was compiled by an incompatible version. It must be recompiled.")
+        elif header.mutable != self.__mutable:
+            raise ValueError(
+                f"Bundle was compiled for {'mutable' if header.mutable else 'immutable'} configurations. "
+                "It must be recompiled."
+            )
+        elif self.__base_path[: len(header.base_path)] != header.base_path:
+            raise ValueError(
+                f"Bundle only holds Base Path `/{'/'.join(header.base_path)}`, "
+                f"but `/{'/'.join(self.__base_path)}` was requested."
+            )
+
+        self.__data = memoryview(data)[body_start:]
+        self.__header = header
+        self.__yamls = [None] * len(header.layers)
+        return header
+
+    def construct(self) -> Configuration:
+        return self.read(*self.__read_header().root)
+
+    def read(self, offset: int, length: int) -> Configuration:
+        with self.__lock:  # The constructors are shared
+            try:
+                tree = marshal.loads(self.__data[offset : offset + length])  # noqa: S302  # nosec B302
+            except (ValueError, EOFError, TypeError):
+                raise ValueError("Bundle is corrupt. It must be recompiled.") from None
+            return self.__convert(tree, dict())
+
+    def __yaml(self, layer: int) -> _StatefulYAML:
+        yaml = self.__yamls[layer]
+        if yaml is None:
+            from granular_configuration_language.yaml.load._load_yaml_string import make_yaml
+
+            path, version = self.__header.layers[layer]
+            state = make_state(
+                lazy_root=self.__lazy_root, file_path=Path(path), previous_options=None, mutable=self.__mutable
+            )
+            yaml = self.__yamls[layer] = make_yaml(state, version)
+        return yaml
+
+    def __convert(self, value: typ.Any, refs: dict[int, typ.Any]) -> typ.Any:  # noqa: C901
+        # Containers are registered under their reference number before their contents are read,
+        # so values shared through aliases stay shared
+        if type(value) in PLAIN_TYPES:
+            return value
+        elif type(value) is not tuple:
+            raise ValueError("Bundle is corrupt. It must be recompiled.")
+
+        result: typ.Any
+        kind = value[0]
+        if kind == REF:
+            return refs[value[1]]
+        elif kind == DICT:
+            mapping = dict[typ.Any, typ.Any]()
+            refs[value[1]] = result = obj_pairs_func(self.__mutable)._from_dict(mapping, setter_secret)  # noqa: SLF001
+            for key, item in value[2]:
+                mapping[self.__convert(key, refs)] = self.__convert(item, refs)
+            return result
+        elif kind == LIST:
+            refs[value[1]] = result = list[typ.Any]()
+            result.extend(self.__convert(item, refs) for item in value[2])
+            return result
+        elif kind == TUPLE:
+            refs[value[1]] = result = tuple(self.__convert(item, refs) for item in value[2])
+            return result
+        elif kind == SET:
+            return {self.__convert(item, refs) for item in value[1]}
+        elif kind == DATE:
+            return date(*value[1:])
+        elif kind == DATETIME:
+            _, parts, utc_offset, tzname = value
+            tzinfo = None if utc_offset is None else timezone(timedelta(seconds=utc_offset), tzname)
+            return datetime(*parts).replace(tzinfo=tzinfo)
+        elif kind == PLACEHOLDER:
+            return Placeholder(value[1])
+        elif kind == TAGGED:
+            refs[value[1]] = result = self.__yaml(value[2]).construct_object(_load_node(value[3], refs))
+            return result
+        elif kind == MERGED:
+            parts = [self.__convert(part, refs) for part in value[2]]
+            tag = parts[0].tag if isinstance(parts[0], LazyEval) else BUNDLE_TAG
+            refs[value[1]] = result = LazyEvalBasic(tag, partial(_merge_layers, obj_pairs_func(self.__mutable), parts))
+            return result
+        elif kind == SUBTREE:
+            return BundleSubtree(BUNDLE_TAG, partial(self.read, value[1], value[2]))
+        else:
+            raise ValueError("Bundle is corrupt. It must be recompiled.")
+
+
+def _load_node(value: tuple, refs: dict[int, typ.Any]) -> Node:
+    from ruamel.yaml.nodes import MappingNode, ScalarNode, SequenceNode
+
+    kind = value[0]
+    if kind == REF:
+        return typ.cast("Node", refs[value[1]])
+    elif kind == SCALAR_NODE:
+        _, ref, tag, scalar, style = value
+        node: Node = ScalarNode(tag, scalar, style=style)
+        refs[ref] = node
+    elif kind == SEQUENCE_NODE:
+        _, ref, tag, children, flow_style = value
+        refs[ref] = node = SequenceNode(tag, [], flow_style=flow_style)
+        node.value.extend(_load_node(child, refs) for child in children)
+    elif kind == MAPPING_NODE:
+        _, ref, tag, pairs, flow_style = value
+        refs[ref] = node = MappingNode(tag, [], flow_style=flow_style)
+        node.value.extend((_load_node(key, refs), _load_node(item, refs)) for key, item in pairs)
+    else:
+        raise ValueError("Bundle is corrupt. It must be recompiled.")
+    return node
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import collections.abc as tabc
 import typing as typ
+from contextlib import contextmanager
 from pathlib import Path
 
 from granular_configuration_language.exceptions import (
@@ -15,24 +17,23 @@ from granular_configuration_language.yaml.file_ops.environment_variable import (
     _EagerIOEnvariableVariable,
 )
 from granular_configuration_language.yaml.file_ops.text import EagerIOTextFile, read_text_data
-from granular_configuration_language.yaml.load import loads as yaml_loader
+from granular_configuration_language.yaml.load._loads import ComposedDocument
+from granular_configuration_language.yaml.load._loads import compose as yaml_composer
 
+if typ.TYPE_CHECKING:
+    from granular_configuration_language.yaml.load._load_bundle import BundleDocument
+    from granular_configuration_language.yaml.load._load_json import JSONDocument
+    from granular_configuration_language.yaml.load._parse_cache import ParseCache
 
-def _load_file(
-    *,
-    filename: Path | EagerIOTextFile,
-    mutable: bool,
-    lazy_root: LazyRoot | None,
-    previous_options: LoadOptions | None,
-) -> typ.Any:
+# Here, so the loaders for these files are only imported when one is loaded
+JSON_FILE_EXTENSION: typ.Final = ".json"
+BUNDLE_FILE_EXTENSION: typ.Final = ".gclbundle"
+
+
+@contextmanager
+def _wrap_errors(filename: Path | EagerIOTextFile) -> tabc.Iterator[None]:
     try:
-        return yaml_loader(
-            read_text_data(filename),
-            lazy_root=lazy_root,
-            file_path=filename.path if isinstance(filename, EagerIOTextFile) else filename,
-            mutable=mutable,
-            previous_options=previous_options,
-        )
+        yield
     except ParsingTriedToCreateALoop:
         raise
     except FileNotFoundError as e:
@@ -41,22 +42,92 @@ def _load_file(
         raise ErrorWhileLoadingFileOccurred(f'Problem in file "{filename}": ({e.__class__.__name__}) {e}') from None
 
 
-def load_file(
+class ComposedFile:
+    """A parsed file that has not been constructed. Errors from either step are reported against the file."""
+
+    __slots__ = ("document", "filename")
+
+    def __init__(
+        self, filename: Path | EagerIOTextFile, document: ComposedDocument | JSONDocument | BundleDocument
+    ) -> None:
+        self.filename = filename
+        self.document = document
+
+    def construct(self) -> typ.Any:
+        with _wrap_errors(self.filename):
+            return self.document.construct()
+
+
+def _compose_file(
+    *,
+    filename: Path | EagerIOTextFile,
+    suffix: str,
+    mutable: bool,
+    lazy_root: LazyRoot | None,
+    previous_options: LoadOptions | None,
+    parse_cache: ParseCache | None,
+) -> ComposedFile:
+    with _wrap_errors(filename):
+        config_str = read_text_data(filename)
+
+        # JSON cannot have Tags, so it skips YAML entirely, unless YAML could read it differently.
+        if suffix == JSON_FILE_EXTENSION:
+            from granular_configuration_language.yaml.load._load_json import compose_json
+
+            if document := compose_json(config_str, mutable=mutable):
+                return ComposedFile(filename, document)
+
+        return ComposedFile(
+            filename,
+            yaml_composer(
+                config_str,
+                lazy_root=lazy_root,
+                file_path=filename.path if isinstance(filename, EagerIOTextFile) else filename,
+                mutable=mutable,
+                previous_options=previous_options,
+                parse_cache=parse_cache,
+            ),
+        )
+
+
+def compose_file(
     filename: Path | EagerIOTextFile,
     *,
     mutable: bool,
     lazy_root: LazyRoot | None = None,
     previous_options: LoadOptions | None = None,
-) -> typ.Any:
+    parse_cache: ParseCache | None = None,
+) -> ComposedFile:
     suffix = filename.path.suffix if isinstance(filename, EagerIOTextFile) else filename.suffix
     if suffix == ".ini":
         raise IniUnsupportedError("INI support has been removed")
     elif (suffix == ENV_VAR_FILE_EXTENSION) and not isinstance(filename, _EagerIOEnvariableVariable):
         raise ReservedFileExtension(f"`{ENV_VAR_FILE_EXTENSION}` is a reserved internal file extension")
+    elif suffix == BUNDLE_FILE_EXTENSION:
+        raise ReservedFileExtension(f"`{BUNDLE_FILE_EXTENSION}` files can only be loaded as a configuration location")
     else:
-        return _load_file(
+        return _compose_file(
             filename=filename,
+            suffix=suffix,
             mutable=mutable,
             lazy_root=lazy_root,
             previous_options=previous_options,
+            parse_cache=parse_cache,
         )
+
+
+def load_file(
+    filename: Path | EagerIOTextFile,
+    *,
+    mutable: bool,
+    lazy_root: LazyRoot | None = None,
+    previous_options: LoadOptions | None = None,
+    parse_cache: ParseCache | None = None,
+) -> typ.Any:
+    return compose_file(
+        filename,
+        mutable=mutable,
+        lazy_root=lazy_root,
+        previous_options=previous_options,
+        parse_cache=parse_cache,
+    ).construct()
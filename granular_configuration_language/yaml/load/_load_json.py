@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import re
+import typing as typ
+from functools import partial
+
+from granular_configuration_language._configuration import Configuration
+from granular_configuration_language._s import setter_secret
+from granular_configuration_language.yaml.load._loads import obj_pairs_func
+
+# Text that YAML reads differently than JSON (or rejects), so the YAML path must decide:
+#  - Escaped surrogates, which JSON combines into one character
+#  - A line break between a key and its `:`, which YAML does not allow for implicit keys
+#  - Characters that YAML does not allow in a stream, and tabs, which YAML does not always accept as whitespace
+#  - Unicode line breaks (NEL, LS, and PS), which YAML folds inside of strings
+_YAML_DIFFERS: typ.Final = re.compile(
+    r'\\u[dD][89abAB]|" *[\r\n]\s*:|[^\x0A\x0D\x20-\x7E\xA0-\u2027\u202A-\uD7FF\uE000-\uFFFD\U00010000-\U0010FFFF]'
+)
+# YAML only checks this many characters back for an implicit key. Escaping can make a key's text up to 6x longer.
+_MAX_KEY_LENGTH: typ.Final = 1024 // 6
+
+
+class _ReadDifferentlyByYAML(Exception):
+    pass
+
+
+def _reject_constant(name: str) -> typ.NoReturn:
+    # `NaN`, `Infinity`, and `-Infinity` are strings in YAML
+    raise _ReadDifferentlyByYAML(name)
+
+
+def _freeze(value: list) -> tuple:
+    return tuple(_freeze(item) if isinstance(item, list) else item for item in value)
+
+
+def _build_mapping(cls: type[Configuration], freeze: bool, pairs: list[tuple[str, typ.Any]]) -> Configuration:
+    data = dict(pairs)
+    if len(data) != len(pairs):  # Duplicate keys are an error in YAML
+        raise _ReadDifferentlyByYAML("Duplicate keys")
+
+    for key, value in data.items():
+        if len(key) > _MAX_KEY_LENGTH:
+            raise _ReadDifferentlyByYAML("Long key")
+        elif freeze and isinstance(value, list):
+            data[key] = _freeze(value)
+
+    return cls._from_dict(data, setter_secret)  # noqa: SLF001
+
+
+class JSONDocument:
+    """
+    A JSON document, already built.
+
+    JSON cannot have Tags, so there is nothing to construct. There is also no node graph to prune.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: typ.Any) -> None:
+        self.value = value
+
+    def construct(self) -> typ.Any:
+        return self.value
+
+
+def compose_json(config_str: str, *, mutable: bool) -> JSONDocument | None:
+    """
+    Parses ``config_str`` with :py:mod:`json`, building the same result that the YAML path would.
+
+    :return: :py:data:`None`, if the YAML path could read the text differently (including raising an error).
+    """
+    if _YAML_DIFFERS.search(config_str):
+        return None
+
+    try:
+        value = json.loads(
+            config_str,
+            object_pairs_hook=partial(_build_mapping, obj_pairs_func(mutable), not mutable),
+            parse_constant=_reject_constant,
+        )
+    except (ValueError, _ReadDifferentlyByYAML):  # `json.JSONDecodeError` is a `ValueError`
+        return None
+
+    if isinstance(value, list) and not mutable:
+        value = _freeze(value)
+    return JSONDocument(value)
@@ -2,39 +2,113 @@ from __future__ import annotations
 
 import typing as typ
 from copy import copy
-from functools import partial
+from functools import cache, partial
 
-from ruamel.yaml import YAML, SafeConstructor
+from ruamel.yaml import Node, SafeConstructor
 from ruamel.yaml.resolver import BaseResolver
 
 from granular_configuration_language.yaml.classes import StateHolder
-from granular_configuration_language.yaml.load._constructors import construct_mapping, construct_sequence
+from granular_configuration_language.yaml.load import _yaml_pool as yaml_pool
+from granular_configuration_language.yaml.load._backends import (
+    YAMLVersion,
+    _StatefulYAML,
+    compose,
+    read_yaml_version,
+    select_backend,
+)
+from granular_configuration_language.yaml.load._constructors import (
+    ExtendedSafeConstructor,
+    construct_mapping,
+    construct_sequence,
+)
 
+if typ.TYPE_CHECKING:
+    from granular_configuration_language.yaml.decorators._tag_set import TagSet
+    from granular_configuration_language.yaml.load._lazy_subtrees import Source
+    from granular_configuration_language.yaml.load._parse_cache import ParseCache
 
-def make_constructor_class(state: StateHolder) -> type[SafeConstructor]:
-    from granular_configuration_language.yaml._tags import handlers
 
-    class ExtendedSafeConstructor(SafeConstructor):
+def _construct_lazily(tags: TagSet, constructor: ExtendedSafeConstructor, node: Node) -> typ.Any:
+    # Stands in for every Tag until it is first used, so only the modules of used Tags are imported
+    handler = tags.get(node.tag or "")
+    if handler is None:
+        return constructor.construct_undefined(node)
+
+    constructor_class = type(constructor)
+    handler(constructor_class)  # Replaces this stand-in for the rest of the process
+    return constructor_class.yaml_constructors[node.tag](constructor, node)
+
+
+@cache
+def make_constructor_class(mutable: bool, tags: TagSet) -> type[ExtendedSafeConstructor]:
+    """Builds the constructor class once per ``(mutable, tags)`` combination.
+
+    Load specific state is not baked into the class. It is injected into each constructor instance.
+    Each Tag's constructor is only added when the Tag is first used.
+    """
+    from granular_configuration_language.yaml.load._loads import obj_pairs_func, sequence_func
+
+    class PrecompiledConstructor(ExtendedSafeConstructor):
         yaml_constructors = copy(SafeConstructor.yaml_constructors)
 
-    for handler in handlers:
-        handler(ExtendedSafeConstructor, state)
+    construct_lazily = partial(_construct_lazily, tags)
+    for tag in tags.registered_tags():
+        PrecompiledConstructor.add_constructor(tag, construct_lazily)
+    PrecompiledConstructor.add_constructor(None, construct_lazily)  # Tags from plugins that are not imported yet
 
-    ExtendedSafeConstructor.add_constructor(
-        BaseResolver.DEFAULT_MAPPING_TAG, partial(construct_mapping, state.options.obj_pairs_func)
+    PrecompiledConstructor.add_constructor(
+        BaseResolver.DEFAULT_MAPPING_TAG, partial(construct_mapping, obj_pairs_func(mutable))
+    )
+    PrecompiledConstructor.add_constructor(
+        BaseResolver.DEFAULT_SEQUENCE_TAG, partial(construct_sequence, sequence_func(mutable))
     )
-    ExtendedSafeConstructor.add_constructor(
-        BaseResolver.DEFAULT_SEQUENCE_TAG, partial(construct_sequence, state.options.sequence_func)
+
+    return PrecompiledConstructor
+
+
+def make_yaml(state: StateHolder, version: YAMLVersion | None) -> _StatefulYAML:
+    """Makes the :py:class:`_StatefulYAML` that constructs a document loaded with ``state``."""
+    from granular_configuration_language.yaml._tags import handlers
+
+    yaml = _StatefulYAML(state=state, version=version)
+    yaml.Constructor = make_constructor_class(state.options.mutable, handlers)
+    return yaml
+
+
+def acquire_yaml(state: StateHolder, version: YAMLVersion | None, *, source: Source | None = None) -> _StatefulYAML:
+    """
+    Same as :py:func:`make_yaml`, except the instance comes from this thread's pool.
+
+    With a ``source``, nested mappings are constructed when first read.
+
+    Give it back with :py:func:`release_yaml`, once the document is constructed.
+    """
+    from granular_configuration_language.yaml._tags import handlers
+
+    yaml = yaml_pool.acquire(
+        "construct", make_constructor_class(state.options.mutable, handlers), partial(make_yaml, state, version)
     )
+    yaml.reset(state=state, version=version, source=source)
+    return yaml
+
+
+def release_yaml(yaml: _StatefulYAML) -> None:
+    yaml.clear()
+    yaml_pool.release("construct", yaml.Constructor, yaml)
 
-    return ExtendedSafeConstructor
 
+def compose_yaml_string(
+    config_str: str, state: StateHolder, parse_cache: ParseCache | None = None
+) -> tuple[YAMLVersion | None, Node | None]:
+    """Parses ``config_str``, returning the node and the YAML version to construct it with."""
+    version = read_yaml_version(config_str)
 
-def load_yaml_string(config_str: str, state: StateHolder) -> typ.Any:
-    if config_str.startswith("%YAML"):
-        yaml = YAML(typ="rt")
-    else:
-        yaml = YAML(typ="safe")
+    file_location = state.options.file_location
+    if (parse_cache is None) or (file_location is None):
+        return version, compose(config_str, version)
 
-    yaml.Constructor = make_constructor_class(state)
-    return yaml.load(config_str)
+    node, store = parse_cache.get(file_location, config_str, select_backend(config_str, version).name)
+    if node is None:
+        node = compose(config_str, version)
+        store(node)
+    return version, node
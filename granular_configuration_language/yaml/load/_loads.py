@@ -5,19 +5,91 @@ from pathlib import Path
 
 from granular_configuration_language._configuration import Configuration, MutableConfiguration
 from granular_configuration_language.yaml.classes import LazyEval, LazyRoot, LoadOptions, StateHolder
-from granular_configuration_language.yaml.load._load_yaml_string import load_yaml_string
 
+if typ.TYPE_CHECKING:
+    from ruamel.yaml import Node
 
-def loads(
-    config_str: str,
-    *,
-    lazy_root: LazyRoot | None = None,
-    file_path: Path | None = None,
-    previous_options: LoadOptions | None = None,
-    mutable: bool = False,
-) -> typ.Any:
-    state = StateHolder(
-        lazy_root_obj=lazy_root or LazyRoot(),
+    from granular_configuration_language.yaml.load._backends import YAMLVersion, _StatefulYAML
+    from granular_configuration_language.yaml.load._lazy_subtrees import Source
+    from granular_configuration_language.yaml.load._parse_cache import ParseCache
+
+
+class ComposedDocument:
+    """
+    A parsed document that has not been constructed.
+
+    Splitting parsing from construction lets the node graph be inspected (and pruned) before any Tag runs.
+
+    The YAML instance that constructs it is taken from a pool when first needed and given back once the
+    document is constructed.
+
+    With a ``source`` (see ``G_CONFIG_LAZY_SUBTREES``), mappings nested in mappings are constructed when first read.
+    """
+
+    __slots__ = ("__owns_root", "__source", "__state", "__version", "__yaml", "node")
+
+    def __init__(
+        self,
+        node: Node | None,
+        state: StateHolder,
+        version: YAMLVersion | None,
+        owns_root: bool,
+        *,
+        source: Source | None = None,
+    ) -> None:
+        self.node = node
+        self.__state = state
+        self.__version = version
+        self.__owns_root = owns_root
+        self.__source = source
+        self.__yaml: _StatefulYAML | None = None
+
+    @property
+    def state(self) -> StateHolder:
+        return self.__state
+
+    @property
+    def version(self) -> YAMLVersion | None:
+        return self.__version
+
+    def __get_yaml(self) -> _StatefulYAML:
+        from granular_configuration_language.yaml.load._load_yaml_string import acquire_yaml
+
+        if self.__yaml is None:
+            self.__yaml = acquire_yaml(self.__state, self.__version, source=self.__source)
+        return self.__yaml
+
+    def mark_edited(self, node: Node) -> None:
+        """Records that ``node`` (or a node under it) was changed after parsing, so it is always constructed from ``node``."""
+        if self.__source is not None:
+            self.__source.edited.add(id(node))
+
+    def construct_key(self, node: Node) -> typ.Any:
+        return self.__get_yaml().construct_object(node)
+
+    def construct(self) -> typ.Any:
+        from granular_configuration_language.yaml.load._load_yaml_string import release_yaml
+
+        yaml = self.__get_yaml()
+        result = yaml.construct(self.node)
+        # Only a finished document leaves the instance clean enough to reuse
+        self.__yaml = None
+        release_yaml(yaml)
+
+        if self.__owns_root:
+            self.__state.lazy_root_obj._set_root(result)  # noqa: SLF001
+
+        if isinstance(result, LazyEval):
+            return result.result
+        else:
+            return result
+
+
+def make_state(
+    *, lazy_root: LazyRoot, file_path: Path | None, previous_options: LoadOptions | None, mutable: bool
+) -> StateHolder:
+    return StateHolder(
+        lazy_root_obj=lazy_root,
         options=LoadOptions(
             file_location=file_path,
             relative_to_directory=file_path.parent if file_path is not None else Path(),
@@ -28,15 +100,51 @@ def loads(
         ),
     )
 
-    result = load_yaml_string(config_str, state)
 
-    if lazy_root is None:
-        state.lazy_root_obj._set_root(result)  # noqa: SLF001
+def compose(
+    config_str: str,
+    *,
+    lazy_root: LazyRoot | None = None,
+    file_path: Path | None = None,
+    previous_options: LoadOptions | None = None,
+    mutable: bool = False,
+    parse_cache: ParseCache | None = None,
+) -> ComposedDocument:
+    # `ruamel.yaml` is only imported once YAML is parsed
+    from granular_configuration_language.yaml.load._lazy_subtrees import lazy_subtrees_source
+    from granular_configuration_language.yaml.load._load_yaml_string import compose_yaml_string
+
+    state = make_state(
+        lazy_root=lazy_root or LazyRoot(), file_path=file_path, previous_options=previous_options, mutable=mutable
+    )
 
-    if isinstance(result, LazyEval):
-        return result.result
-    else:
-        return result
+    version, node = compose_yaml_string(config_str, state, parse_cache)
+    return ComposedDocument(
+        node,
+        state,
+        version,
+        owns_root=lazy_root is None,
+        source=lazy_subtrees_source(config_str, state, version, node),
+    )
+
+
+def loads(
+    config_str: str,
+    *,
+    lazy_root: LazyRoot | None = None,
+    file_path: Path | None = None,
+    previous_options: LoadOptions | None = None,
+    mutable: bool = False,
+    parse_cache: ParseCache | None = None,
+) -> typ.Any:
+    return compose(
+        config_str,
+        lazy_root=lazy_root,
+        file_path=file_path,
+        previous_options=previous_options,
+        mutable=mutable,
+        parse_cache=parse_cache,
+    ).construct()
 
 
 def obj_pairs_func(mutable: bool) -> type[Configuration] | type[MutableConfiguration]:
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import collections.abc as tabc
+import json
+import os
+import typing as typ
+from contextlib import suppress
+from pathlib import Path
+
+from granular_configuration_language._utils import write_atomically
+
+if typ.TYPE_CHECKING:
+    from ruamel.yaml import Node
+    from ruamel.yaml.error import FileMark
+
+PARSE_CACHE_DIR_ENV = "G_CONFIG_PARSE_CACHE_DIR"
+
+# Bump when the layout of an entry changes
+_FORMAT_VERSION = 3
+
+# Longest header line that is read. Anything longer is not an entry.
+_MAX_HEADER_SIZE = 4096
+
+
+def _no_store(node: typ.Any) -> None:
+    pass
+
+
+class _Header(typ.NamedTuple):
+    format_version: int
+    ruamel_version: str
+    backend: str
+    path: str
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+def _walk_nodes(node: Node) -> tabc.Iterator[Node]:
+    from ruamel.yaml import MappingNode, SequenceNode
+
+    seen: set[int] = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:  # Aliases share nodes
+            continue
+        seen.add(id(node))
+        yield node
+
+        if isinstance(node, MappingNode):
+            for key_node, value_node in node.value:
+                stack.append(key_node)
+                stack.append(value_node)
+        elif isinstance(node, SequenceNode):
+            stack.extend(node.value)
+
+
+def _light_mark(mark: typ.Any) -> FileMark | None:
+    from ruamel.yaml.error import FileMark
+
+    if mark is None:
+        return None
+    return FileMark(mark.name, mark.index, mark.line, mark.column)
+
+
+def _dump_node(node: Node) -> bytes:
+    # The pure-Python marks hold the whole document, so they are swapped for marks that only hold
+    # their position while pickling, and restored afterwards. Errors on a cache hit still name the line.
+    marks = [(node, node.start_mark, node.end_mark) for node in _walk_nodes(node)]
+    try:
+        for node_, start_mark, end_mark in marks:
+            node_.start_mark = _light_mark(start_mark)
+            node_.end_mark = _light_mark(end_mark)
+        import pickle  # nosec B403
+
+        return pickle.dumps(node, protocol=pickle.HIGHEST_PROTOCOL)
+    finally:
+        for node_, start_mark, end_mark in marks:
+            node_.start_mark = start_mark
+            node_.end_mark = end_mark
+
+
+class ParseCache:
+    """
+    Persistent, on-disk cache of composed YAML node graphs.
+
+    Entries are keyed by the resolved file path and the parser backend, and validated against the file's
+    size, modification time, and a hash of the text being loaded, so a stale entry is never used. Only
+    parsing is cached. Tags are constructed fresh on every load.
+
+    Each entry starts with a JSON header line, which is compared before the pickled node is read, so a
+    file that was not written for the file being loaded is never unpickled.
+
+    Entries are written to a temporary file and atomically moved into place, so several processes can
+    populate the same directory at once. Unreadable entries are treated as misses.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    @classmethod
+    def from_environment(cls) -> ParseCache | None:
+        directory = os.environ.get(PARSE_CACHE_DIR_ENV, "").strip()
+        if directory:
+            return cls(Path(directory).expanduser())
+        else:
+            return None
+
+    def __entry(self, path: Path, backend: str) -> Path:
+        import hashlib
+
+        return self.directory / (hashlib.sha256(os.fsencode(path) + b"\0" + backend.encode()).hexdigest() + ".pickle")
+
+    @staticmethod
+    def __header(path: Path, config_str: str, backend: str) -> bytes:
+        import hashlib
+
+        from ruamel.yaml import __version__ as ruamel_version
+
+        stat = path.stat()
+        header = _Header(
+            format_version=_FORMAT_VERSION,
+            ruamel_version=ruamel_version,
+            backend=backend,
+            path=str(path),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            digest=hashlib.sha256(config_str.encode()).hexdigest(),
+        )
+        return json.dumps(header._asdict()).encode() + b"\n"
+
+    def get(self, path: Path, config_str: str, backend: str) -> tuple[Node | None, tabc.Callable[[typ.Any], None]]:
+        """
+        Looks up the composed node for ``path``
+
+        :param ~pathlib.Path path: File that ``config_str`` was read from
+        :param str config_str: Text that was read
+        :param str backend: Name of the parser backend that ``config_str`` is parsed with
+        :return: The cached node (:py:data:`None` on a miss) and a function to store the node on a miss.
+            The function must be called before the node is constructed, because construction mutates it.
+        """
+        path = path.resolve()
+        entry = self.__entry(path, backend)
+
+        try:
+            header = self.__header(path, config_str, backend)
+        except OSError:
+            return None, _no_store
+
+        with suppress(Exception), entry.open("rb") as file:
+            if file.readline(_MAX_HEADER_SIZE) == header:
+                # Only unpickles entries whose plain JSON header matches the file being loaded
+                import pickle  # nosec B403
+
+                return pickle.load(file), _no_store  # noqa: S301  # nosec B301
+
+        def store(node: typ.Any) -> None:
+            from ruamel.yaml import Node
+
+            if isinstance(node, Node):
+                self.__store(entry, header, node)
+
+        return None, store
+
+    def __store(self, entry: Path, header: bytes, node: Node) -> None:
+        # A failure to write only costs the next load a parse
+        with suppress(Exception):
+            self.directory.mkdir(parents=True, exist_ok=True)
+            write_atomically(entry, header + _dump_node(node))
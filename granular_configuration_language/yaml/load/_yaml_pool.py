@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import collections.abc as tabc
+import threading
+import typing as typ
+from contextlib import contextmanager
+
+if typ.TYPE_CHECKING:
+    from ruamel.yaml import YAML
+
+# `construct` instances only construct nodes (see `_StatefulYAML`). `compose` instances only parse
+# (``YAML(typ="safe", pure=True)``). `safe` instances load (``YAML(typ="safe")``).
+Mode: typ.TypeAlias = typ.Literal["compose", "construct", "safe"]
+Y = typ.TypeVar("Y", bound="YAML")
+
+# Idle instances kept per key and thread. Documents are composed before any is constructed,
+# so a build can briefly hold one instance per file.
+MAX_IDLE: typ.Final = 16
+
+
+class _Idle(threading.local):
+    def __init__(self) -> None:
+        self.instances = dict[tuple[Mode, type], list[typ.Any]]()
+
+
+_idle: typ.Final = _Idle()
+
+
+def acquire(mode: Mode, constructor_class: type, factory: tabc.Callable[[], Y]) -> Y:
+    """
+    Takes an idle configured ``YAML`` instance from this thread's pool, making one with ``factory`` if none are idle.
+
+    The instance must be released with :py:func:`release` once the document is done, and never shared.
+    """
+    idle = _idle.instances.get((mode, constructor_class))
+    if idle:
+        return typ.cast("Y", idle.pop())
+    else:
+        return factory()
+
+
+def release(mode: Mode, constructor_class: type, yaml: YAML) -> None:
+    """
+    Returns ``yaml`` to this thread's pool.
+
+    Only release an instance that finished its document, as it is handed to the next one as is.
+    """
+    yaml.doc_infos.clear()  # Grows with every document read
+    idle = _idle.instances.setdefault((mode, constructor_class), [])
+    if len(idle) < MAX_IDLE:
+        idle.append(yaml)
+
+
+def _safe_yaml() -> YAML:
+    from ruamel.yaml import YAML
+
+    return YAML(typ="safe")
+
+
+@contextmanager
+def safe_yaml() -> tabc.Iterator[YAML]:
+    """
+    Lends a ``YAML(typ="safe")`` instance from this thread's pool.
+
+    ``YAML.load`` resets the reader, scanner, parser, and constructor after every document it loads.
+    An instance that raised is not returned to the pool.
+    """
+    from ruamel.yaml import SafeConstructor
+
+    yaml = acquire("safe", SafeConstructor, _safe_yaml)
+    yield yaml
+    release("safe", SafeConstructor, yaml)
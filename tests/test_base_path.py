@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from granular_configuration_language._base_path import read_base_path
+from granular_configuration_language._base_path import common_base_path, read_base_path
 
 
 def test_string_singular() -> None:
@@ -25,3 +25,9 @@ def test_sequence() -> None:
 
 def test_none() -> None:
     assert read_base_path(None) == tuple()
+
+
+def test_common_base_path() -> None:
+    assert common_base_path((read_base_path("/a/b/c"), read_base_path("/a/b/d"), read_base_path("/a/b"))) == ("a", "b")  # type: ignore[comparison-overlap]
+    assert common_base_path((read_base_path("a"), read_base_path("b"))) == tuple()
+    assert common_base_path(()) == tuple()
@@ -2,13 +2,19 @@ from __future__ import annotations
 
 import gc
 import re
+import threading
+import typing as typ
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from granular_configuration_language import Configuration, LazyLoadConfiguration, merge
-from granular_configuration_language.exceptions import PlaceholderConfigurationError
+from granular_configuration_language._build import build_configuration
+from granular_configuration_language._locations import Locations
+from granular_configuration_language.exceptions import ErrorWhileLoadingFileOccurred, PlaceholderConfigurationError
 from granular_configuration_language.yaml import Placeholder
+from granular_configuration_language.yaml.file_ops.text import EagerIOTextFile, load_text_file
 
 ASSET_DIR = (Path(__file__).parent / "assets" / "test_build_configuration").resolve()
 
@@ -123,3 +129,63 @@ def test_injection_with_dict_fails_to_merge(
     )
 
     assert CONFIG.data == expected
+
+
+PARALLEL_FILES = (
+    ASSET_DIR / "placeholder_test1.yaml",
+    ASSET_DIR / "sub_test1.yaml",
+    ASSET_DIR / "placeholder_test2.yaml",
+    ASSET_DIR / "sub_test2.yaml",
+    ASSET_DIR / "does_not_exist.yaml",
+)
+
+
+def raw_structure(config: Configuration) -> list[tuple[typ.Any, typ.Any]]:
+    # Key order, types, and unevaluated values (without object ids)
+    return [
+        (
+            key,
+            raw_structure(value)
+            if isinstance(value, Configuration)
+            else (type(value), getattr(value, "message", repr(value))),
+        )
+        for key, value in config._raw_items()
+    ]
+
+
+@pytest.mark.parametrize("mutable", (False, True), ids=("immutable", "mutable"))
+def test_parallel_load_matches_serial_load(mutable: bool) -> None:
+    serial = build_configuration(Locations(PARALLEL_FILES), mutable, inject_before=None, inject_after=None)
+    parallel = build_configuration(
+        Locations(PARALLEL_FILES), mutable, inject_before=None, inject_after=None, parallel_load=True
+    )
+
+    assert type(parallel) is type(serial)
+    assert raw_structure(parallel) == raw_structure(serial)
+    assert parallel.a == serial.a
+    assert parallel.flags.as_dict() == serial.flags.as_dict()
+
+
+def test_parallel_load_reads_on_worker_threads() -> None:
+    thread_names = set()
+
+    def record_thread(file: Path) -> EagerIOTextFile:
+        thread_names.add(threading.current_thread().name)
+        return load_text_file(file)
+
+    with patch("granular_configuration_language._build.load_text_file", record_thread):
+        LazyLoadConfiguration(*PARALLEL_FILES, parallel_load=True, disable_caching=True).config
+
+    assert thread_names and all(name.startswith("gcl-load") for name in thread_names)
+
+
+def test_parallel_load_keeps_the_error_message() -> None:
+    files = (ASSET_DIR / "sub_test1.yaml", ASSET_DIR.parent / "test_lazy_config" / "bad.txt")
+
+    with pytest.raises(ErrorWhileLoadingFileOccurred) as serial:
+        LazyLoadConfiguration(*files, disable_caching=True).config
+
+    with pytest.raises(ErrorWhileLoadingFileOccurred) as parallel:
+        LazyLoadConfiguration(*files, parallel_load=True, disable_caching=True).config
+
+    assert str(parallel.value) == str(serial.value)
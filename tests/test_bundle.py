@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import json
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from granular_configuration_language import (
+    Configuration,
+    LazyLoadConfiguration,
+    MutableConfiguration,
+    MutableLazyLoadConfiguration,
+)
+from granular_configuration_language import _bundle as bundle_module
+from granular_configuration_language._base_path import read_base_path
+from granular_configuration_language._bundle import compile_bundle
+from granular_configuration_language._locations import Locations
+from granular_configuration_language.exceptions import ErrorWhileLoadingFileOccurred
+from granular_configuration_language.yaml.load import _load_file
+from granular_configuration_language.yaml.load._load_bundle import BundleSubtree
+
+ASSET_DIR = (Path(__file__).parent / "assets" / "test_bundle").resolve()
+FILES = (ASSET_DIR / "base.yaml", ASSET_DIR / "prod.yaml", ASSET_DIR / "extra.json")
+
+
+def compile_to(tmp_path: Path, *files: Path, base_path: str | None = None, mutable: bool = False) -> Path:
+    output = tmp_path / "config.gclbundle"
+    compile_bundle(Locations(files), output, base_path=read_base_path(base_path), mutable=mutable)
+    return output
+
+
+@pytest.fixture(params=(1, bundle_module.MIN_SUBTREE_SIZE), ids=("split", "whole"))
+def bundle(request: pytest.FixtureRequest, tmp_path: Path) -> Path:
+    with patch.object(bundle_module, "MIN_SUBTREE_SIZE", request.param):
+        return compile_to(tmp_path, *FILES)
+
+
+def test_bundle_matches_loading_the_files(bundle: Path) -> None:
+    expected = LazyLoadConfiguration(*FILES, disable_caching=True).config
+    config = LazyLoadConfiguration(bundle, disable_caching=True).config
+
+    assert config.as_dict() == expected.as_dict()
+    assert config.app.greeting == "Hello prod"
+    assert config.app.tagged == {"from_file": True, "extra": "value"}
+    assert config.app.placeholder == {"filled": True}
+    assert config.app.from_json == (1, 2, {"a": "b"})
+    assert config.alias is config.shared  # Aliases stay shared
+
+
+def test_tags_are_constructed_against_their_file(bundle: Path) -> None:
+    config = LazyLoadConfiguration(bundle, disable_caching=True).config
+
+    with patch.object(_load_file, "yaml_composer", wraps=_load_file.yaml_composer) as composer:
+        assert config.app.name == "prod"
+        composer.assert_not_called()  # Nothing is parsed to load a bundle
+
+        assert config.app.parsed == {"from_file": True}
+        composer.assert_called_once()  # `!ParseFile` still reads `nested.yaml`, relative to `base.yaml`
+
+
+def test_mappings_are_read_on_first_access(tmp_path: Path) -> None:
+    with patch.object(bundle_module, "MIN_SUBTREE_SIZE", 1):
+        bundle = compile_to(tmp_path, *FILES)
+
+    config = LazyLoadConfiguration(bundle, disable_caching=True).config
+    raw = dict(config._raw_items())
+
+    assert isinstance(raw["app"], BundleSubtree)
+    assert isinstance(raw["other"], BundleSubtree)
+    assert isinstance(raw["shared"], dict | Configuration)  # Shared through an alias, so it is never split
+
+    assert config.app.name == "prod"
+    assert isinstance(dict(config._raw_items())["app"], Configuration)
+    assert isinstance(dict(config._raw_items())["other"], BundleSubtree)
+
+
+def test_bundle_merges_with_other_layers(bundle: Path, tmp_path: Path) -> None:
+    override = tmp_path / "override.yaml"
+    override.write_text("app:\n  name: override\n")
+    injected = Configuration(app=Configuration(injected=True, name="injected"))
+
+    expected = LazyLoadConfiguration(*FILES, override, inject_before=injected).config
+    config = LazyLoadConfiguration(bundle, override, inject_before=injected).config
+
+    assert config.as_dict() == expected.as_dict()
+    assert config.app.greeting == "Hello override"
+    assert config.app.injected is True
+
+
+def test_base_path_limits_the_bundle(tmp_path: Path) -> None:
+    bundle = compile_to(tmp_path, *FILES, base_path="/app")
+
+    config = LazyLoadConfiguration(bundle, base_path="app").config
+    assert config.shared_value == "prod"  # Referenced, so kept
+    assert config.as_dict() == LazyLoadConfiguration(*FILES, base_path="app").as_dict()
+
+    with pytest.raises(ErrorWhileLoadingFileOccurred, match="Bundle only holds Base Path `/app`"):
+        LazyLoadConfiguration(bundle, disable_caching=True).config
+
+
+def test_mutable_bundle(tmp_path: Path) -> None:
+    bundle = compile_to(tmp_path, *FILES, mutable=True)
+
+    config = MutableLazyLoadConfiguration(bundle).config
+    assert isinstance(config.app, MutableConfiguration)
+    assert config.app.sequence[2] == {"key": "value"}
+    assert isinstance(config.app.sequence, list)
+
+    with pytest.raises(ErrorWhileLoadingFileOccurred, match="compiled for mutable configurations"):
+        LazyLoadConfiguration(bundle, disable_caching=True).config
+
+
+def test_invalid_bundles(tmp_path: Path) -> None:
+    not_a_bundle = tmp_path / "config.gclbundle"
+    not_a_bundle.write_text("a: b")
+
+    with pytest.raises(ErrorWhileLoadingFileOccurred, match="Not a compiled configuration bundle"):
+        LazyLoadConfiguration(not_a_bundle, disable_caching=True).config
+
+    with pytest.raises(ValueError, match="must use the `.gclbundle` file extension"):
+        compile_bundle(Locations(FILES), tmp_path / "config.pickle")
+
+
+def test_plain_values_are_kept(tmp_path: Path) -> None:
+    document = tmp_path / "values.yaml"
+    document.write_text(
+        "date: 2020-01-01\n"
+        "datetime: 2001-12-14t21:59:43.10-05:00\n"
+        "naive: 2001-12-14 21:59:43\n"
+        "binary: !!binary aGVsbG8=\n"
+        "set: !!set {a, b}\n"
+        "numbers: [1, 1.5, .inf, true, null]\n"
+        "1: integer key\n"
+        "tagged: &tagged !Sub ${$.date}\n"
+        "alias: *tagged\n"
+    )
+
+    expected = LazyLoadConfiguration(document, disable_caching=True).config
+    config = LazyLoadConfiguration(compile_to(tmp_path, document), disable_caching=True).config
+
+    assert config.as_dict() == expected.as_dict()
+    assert config.datetime.tzname() == expected.datetime.tzname()
+    assert config[1] == "integer key"
+
+
+def test_bundles_cannot_run_code(tmp_path: Path) -> None:
+    bundle = compile_to(tmp_path, *FILES)
+    marker = tmp_path / "ran"
+    magic, header, _ = bundle.read_bytes().split(b"\n", 2)
+    root = json.loads(header)["root"]
+
+    # A pickle that would create `marker`, if it were ever unpickled
+    payload = pickle.dumps(Path.touch.__get__(marker))
+    bundle.write_bytes(b"\n".join((magic, header, payload.ljust(root[0] + root[1], b"\0"))))
+
+    with pytest.raises(ErrorWhileLoadingFileOccurred, match="Bundle is corrupt"):
+        LazyLoadConfiguration(bundle, disable_caching=True).config
+    assert not marker.exists()
+
+
+def test_bundles_from_an_older_format_must_be_recompiled(tmp_path: Path) -> None:
+    bundle = tmp_path / "config.gclbundle"
+    bundle.write_bytes(b"GCL-BUNDLE\n" + pickle.dumps(("header",)) + b"\n")
+
+    with pytest.raises(ErrorWhileLoadingFileOccurred, match="It must be recompiled"):
+        LazyLoadConfiguration(bundle, disable_caching=True).config
+
+
+def test_compile_entry_point(tmp_path: Path) -> None:
+    output = tmp_path / "config.gclbundle"
+
+    stdout = subprocess.check_output(
+        [sys.executable, "-m", "granular_configuration_language.compile", *map(str, FILES), "--output", str(output)]
+    ).decode()
+
+    assert "Compiled 3 file(s)" in stdout
+    assert LazyLoadConfiguration(output).app.greeting == "Hello prod"
@@ -133,3 +133,13 @@ def test_shared_config_EnvironmentVaribleNotFound_error(store: WeakValueDictiona
         assert len(store) == 1, repr(dict(store))
 
         assert c1.config == {"a": 1}
+
+
+@patch("granular_configuration_language._cache.store", new_callable=WeakValueDictionary)
+def test_parallel_load_is_not_dropped_by_sharing(store: WeakValueDictionary) -> None:
+    serial = LazyLoadConfiguration(ASSET_DIR / "simple.yaml")
+    parallel = LazyLoadConfiguration(ASSET_DIR / "simple.yaml", parallel_load=True)
+
+    assert len(store) == 2, repr(dict(store))
+    assert [shared_ref._parallel_load for shared_ref in store.values()] == [False, True]
+    assert serial.config == parallel.config
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import typing as typ
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from granular_configuration_language import (
+    CompiledPath,
+    Configuration,
+    LazyLoadConfiguration,
+    MutableConfiguration,
+    MutableLazyLoadConfiguration,
+)
+from granular_configuration_language.exceptions import PlaceholderConfigurationError
+from granular_configuration_language.yaml import loads
+
+DOCUMENT = """\
+service:
+  limits:
+    rate: !Sub ${/base}
+  a/b~c: 1
+  keys:
+    1: one
+base: 10
+"""
+
+
+def test_path_formats() -> None:
+    config: Configuration = loads(DOCUMENT)
+
+    assert config.compile_path("service.limits.rate")() == "10"
+    assert config.compile_path("/service/limits/rate")() == "10"
+    assert config.compile_path(("service", "limits", "rate"))() == "10"
+    assert config.compile_path("/service/a~1b~0c")() == 1
+    assert config.compile_path(("service", "keys", 1))() == "one"
+    assert config.compile_path("")() is config
+    assert config.compile_path("service.limits").path == ("service", "limits")
+
+
+def test_later_calls_do_not_read_the_path() -> None:
+    config: Configuration = loads(DOCUMENT)
+    rate = config.compile_path("service.limits.rate")
+    assert rate() == "10"
+
+    with patch.object(Configuration, "__getitem__", side_effect=AssertionError):
+        assert rate() == "10"
+
+
+def test_errors_are_raised_when_called() -> None:
+    config: Configuration = loads("a: !Placeholder message\nb: {}")
+    placeholder = config.compile_path("a")
+    missing = config.compile_path("b.c")
+
+    with pytest.raises(PlaceholderConfigurationError):
+        placeholder()
+    with pytest.raises(KeyError):
+        missing()
+
+
+def test_mutable_changes_are_read() -> None:
+    config: MutableConfiguration[str, typ.Any] = loads("a: {b: {c: 1}}", mutable=True)
+    c = config.compile_path("a.b.c")
+    assert c() == 1
+
+    config.a.b["c"] = 2
+    assert c() == 2
+
+    config["a"] = MutableConfiguration(b=MutableConfiguration(c=3))
+    assert c() == 3
+
+    del config["a"]
+    with pytest.raises(KeyError):
+        c()
+
+
+def test_immutable_ignores_mutable_changes() -> None:
+    config: Configuration = loads("a: {b: 1}")
+    b = config.compile_path("a.b")
+    assert b() == 1
+
+    MutableConfiguration()["c"] = 1
+    with patch.object(Configuration, "__getitem__", side_effect=AssertionError):
+        assert b() == 1
+
+
+def test_lazy_load_configuration_does_not_load(tmp_path: Path) -> None:
+    file = tmp_path / "config.yaml"
+    file.write_text(DOCUMENT)
+
+    llc = LazyLoadConfiguration(file)
+    typed = llc.as_typed(Configuration)
+    rate = llc.compile_path("service.limits.rate")
+    assert isinstance(typed.compile_path("base"), CompiledPath)
+    assert "_LazyLoadConfiguration__config" not in vars(llc)
+
+    assert rate() == "10"
+
+
+def test_mutable_lazy_load_configuration(tmp_path: Path) -> None:
+    file = tmp_path / "config.yaml"
+    file.write_text(DOCUMENT)
+
+    llc = MutableLazyLoadConfiguration(file)
+    base = llc.compile_path("base")
+    assert base() == 10
+
+    llc["base"] = 11
+    assert base() == 11
+
+
+def test_path_strings_index_sequences() -> None:
+    config: Configuration = loads("a: [{y: 1}, {y: 2}]\nb: {1: one}")
+
+    assert config.compile_path("/a/1/y")() == 2
+    assert config.compile_path("a.1.y")() == 2
+    assert config.compile_path(("a", 1, "y"))() == 2
+    with pytest.raises(KeyError):
+        config.compile_path("b.1")()  # Mapping keys are not converted
+
+
+def test_changes_to_lists_are_read() -> None:
+    config: MutableConfiguration[str, typ.Any] = loads("a: [1, {b: 2}]", mutable=True)
+    first = config.compile_path("a.0")
+    b = config.compile_path("/a/1/b")
+    assert first() == 1
+    assert b() == 2
+
+    config.a[0] = 9
+    config.a[1] = {"b": 3}
+    assert first() == 9
+    assert b() == 3
@@ -4,11 +4,14 @@ import copy
 import gc
 import re
 import typing as typ
+import weakref
+from unittest.mock import patch
 
 import pytest
 
 from granular_configuration_language import Configuration, MutableConfiguration
 from granular_configuration_language._s import setter_secret
+from granular_configuration_language.exceptions import PlaceholderConfigurationError
 from granular_configuration_language.yaml import LazyEval, Placeholder, loads
 
 
@@ -246,6 +249,76 @@ e: !Ref $.a
     assert str(new_root._Configuration__attribute_name) == "c"
 
 
+def test_attribute_name_follows_the_latest_read_after_caching() -> None:
+    test: Configuration = loads(
+        """
+a:
+  b:
+    c:
+      d:
+e: !Ref $.a
+          """
+    )
+
+    for _ in range(2):  # The second pass reads from the cache
+        assert str(test.a.b.c._Configuration__attribute_name) == "$.a.b.c"
+        assert str(test.e.b.c._Configuration__attribute_name) == "$.e.b.c"
+        assert str(test["a"]["b"]._Configuration__attribute_name) == "$.a.b"
+
+
+def test_reads_after_the_first_use_the_result_in_place() -> None:
+    test: Configuration = loads("a: !Sub ${/b}\nb: c\nd: {e: f}")
+    assert test.a == "c"
+    assert test["d"].e == "f"
+
+    raw = dict(test._raw_items())
+    assert raw["a"] == "c"  # Replaces the `LazyEval`
+    assert raw["d"]._Configuration__parent is weakref.ref(test)
+    assert not hasattr(test, "_Configuration__resolved")
+
+    with patch.object(LazyEval, "result", side_effect=AssertionError):
+        assert test.a == "c"
+        assert test["a"] == "c"
+
+
+def test_reads_do_not_make_attribute_names() -> None:
+    test: Configuration = loads("a: {b: {c: {d: 1}}}\ne: !Ref $.a")
+
+    with patch("granular_configuration_language._configuration.AttributeName", side_effect=AssertionError):
+        assert test.a.b.c.d == 1
+        assert test.e["b"].c.d == 1
+        assert test.a.b.c.d == 1
+
+    assert str(test.a.b.c._Configuration__attribute_name) == "$.a.b.c"
+
+
+def test_placeholder_is_raised_on_every_read() -> None:
+    test: Configuration = loads("a: !Placeholder message")
+    for _ in range(2):
+        with pytest.raises(PlaceholderConfigurationError):
+            test.a  # noqa: B018
+
+
+def test_mutable_changes_are_read() -> None:
+    config: MutableConfiguration[str, typ.Any] = MutableConfiguration(a=1, b=MutableConfiguration(c=2))
+    assert config.a == 1
+    assert config["b"]["c"] == 2
+
+    config["a"] = 3
+    config["b"] = MutableConfiguration(c=4)
+    assert config.a == 3
+    assert config.b.c == 4
+
+    del config["a"]
+    with pytest.raises(KeyError):
+        config["a"]
+    with pytest.raises(AttributeError):
+        config.a  # noqa: B018
+
+    config.update(a=5)
+    assert config.a == 5
+
+
 def test_evalute_all_run_all_LazyEval() -> None:
     test: Configuration = loads(
         """
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import copy
+import pickle
+from collections.abc import Mapping
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from granular_configuration_language import (
+    Configuration,
+    FrozenConfiguration,
+    LazyLoadConfiguration,
+    MutableConfiguration,
+    MutableLazyLoadConfiguration,
+)
+from granular_configuration_language.exceptions import PlaceholderConfigurationError
+from granular_configuration_language.yaml import LazyEval, loads
+
+DOCUMENT = """\
+base: 10
+rate: !Sub ${/base}
+nested:
+  deeper: {value: !Ref /base}
+sequence:
+  - !Sub ${/base}
+  - key: !Sub ${/base}
+items: 1
+1: one
+"""
+
+
+def test_everything_is_evaluated() -> None:
+    frozen = loads(DOCUMENT).freeze()
+
+    assert isinstance(frozen, FrozenConfiguration)
+    assert isinstance(frozen.nested.deeper, FrozenConfiguration)
+    assert isinstance(frozen.sequence[1], FrozenConfiguration)
+    assert frozen.as_dict() == {
+        "base": 10,
+        "rate": "10",
+        "nested": {"deeper": {"value": 10}},
+        "sequence": ("10", {"key": "10"}),
+        "items": 1,
+        1: "one",
+    }
+
+    with patch.object(LazyEval, "result", side_effect=AssertionError):
+        assert frozen.rate == "10"
+        assert frozen["nested"]["deeper"]["value"] == 10
+
+
+def test_is_a_configuration() -> None:
+    config: Configuration = loads(DOCUMENT)
+    frozen = config.freeze()
+
+    assert isinstance(frozen, Configuration)
+    assert isinstance(frozen, Mapping)
+    assert not isinstance(frozen, MutableConfiguration)
+    assert frozen.freeze() is frozen
+    assert frozen.get("base") == 10
+    assert frozen.exists(1)
+    assert frozen.as_typed(Configuration) is frozen
+
+
+def test_keys_are_attributes() -> None:
+    frozen = loads(DOCUMENT).freeze()
+
+    assert frozen.base == 10
+    assert vars(frozen)["base"] == 10
+    assert frozen["items"] == 1
+    assert callable(frozen.items)  # Methods are not hidden
+    assert frozen[1] == "one"
+
+    with pytest.raises(AttributeError, match=r"Request attribute `\$.nested.missing` does not exist"):
+        frozen.nested.missing  # noqa: B018
+    with pytest.raises(KeyError):
+        frozen["missing"]
+
+
+def test_is_sealed() -> None:
+    frozen = loads(DOCUMENT).freeze()
+
+    with pytest.raises(AttributeError, match="sealed"):
+        frozen.base = 11
+    with pytest.raises(AttributeError, match="sealed"):
+        del frozen.base
+    assert frozen.base == 10
+
+
+def test_placeholders_raise_when_frozen() -> None:
+    with pytest.raises(PlaceholderConfigurationError, match=r"\$.a.b"):
+        loads("a: {b: !Placeholder message}").freeze()
+    with pytest.raises(PlaceholderConfigurationError, match=r"\$.a\[1\]"):
+        loads("a: [1, !Placeholder message]").freeze()
+
+
+def test_mutable_is_frozen() -> None:
+    config: MutableConfiguration = loads(DOCUMENT, mutable=True)
+    frozen = config.freeze()
+
+    assert not isinstance(frozen, MutableConfiguration)
+    assert frozen.sequence == ["10", {"key": "10"}]  # Still a `list`
+    assert isinstance(frozen.sequence[1], FrozenConfiguration)
+    assert frozen.as_dict()["sequence"] == ["10", {"key": "10"}]
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(frozen)
+
+    config["base"] = 11
+    assert frozen.base == 10
+
+
+def test_hash_and_equality() -> None:
+    frozen = loads(DOCUMENT).freeze()
+    same = loads(DOCUMENT).freeze()
+    different = loads(DOCUMENT.replace("10", "11")).freeze()
+
+    assert hash(frozen) == hash(same)
+    assert frozen == same
+    assert frozen != different
+    assert frozen == frozen.as_dict()
+    assert {frozen: True}[same]
+
+    unhashable = Configuration(a={"b": 1}).freeze()  # A `dict` from a Tag, like `!ParseEnvSafe`
+    assert unhashable == Configuration(a={"b": 1}).freeze()
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(unhashable)
+
+
+def test_aliases_stay_shared() -> None:
+    frozen = loads("a: &a {b: 1}\nc: *a\nd: !Ref $").freeze()
+
+    assert frozen.a is frozen.c
+    assert frozen.d is frozen
+
+
+def test_copies() -> None:
+    frozen = loads(DOCUMENT).freeze()
+
+    assert copy.copy(frozen) is frozen
+    assert frozen.copy() is frozen
+    for other in (copy.deepcopy(frozen), pickle.loads(pickle.dumps(frozen))):
+        assert isinstance(other, FrozenConfiguration)
+        assert other is not frozen
+        assert other == frozen
+        assert other.nested.deeper.value == 10
+
+
+def test_lazy_load_configuration(tmp_path: Path) -> None:
+    file = tmp_path / "config.yaml"
+    file.write_text(DOCUMENT)
+
+    assert LazyLoadConfiguration(file).frozen().rate == "10"
+    assert LazyLoadConfiguration(file).as_typed(Configuration).freeze().rate == "10"
+    assert isinstance(MutableLazyLoadConfiguration(file).frozen(), FrozenConfiguration)
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+
+def test_deferred_modules_load_on_first_use() -> None:
+    script = """
+import sys
+import granular_configuration_language
+from granular_configuration_language import Configuration
+from granular_configuration_language.yaml import loads
+
+def imported(name):
+    return name in sys.modules
+
+Configuration(a=1)
+assert not any(map(imported, ("ruamel.yaml", "jsonpath", "dateutil"))), sorted(sys.modules)
+assert not any(map(imported, ("concurrent.futures", "pickle", "hashlib", "tempfile"))), sorted(sys.modules)
+assert not imported("granular_configuration_language._build")
+assert not imported("granular_configuration_language._frozen_configuration")
+assert granular_configuration_language.FrozenConfiguration is Configuration().freeze().__class__
+
+loads("a: b")
+assert imported("ruamel.yaml")
+assert not imported("jsonpath")
+
+assert loads("a: b\\nc: !Ref /a").c == "b"
+assert imported("jsonpath")
+"""
+    subprocess.check_call([sys.executable, "-c", script])
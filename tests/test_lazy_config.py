@@ -10,6 +10,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from granular_configuration_language import Configuration, LazyLoadConfiguration, MutableLazyLoadConfiguration
+from granular_configuration_language._base_path import BasePath
 from granular_configuration_language._lazy_load_configuration import Locations
 from granular_configuration_language.exceptions import (
     EnvironmentVaribleNotFound,
@@ -28,9 +29,9 @@ def as_env_var_list(*file_names: str) -> str:
 
 
 def build_configuration_pach() -> AbstractContextManager[AsyncMock | MagicMock]:
-    from granular_configuration_language._cache import build_configuration
+    from granular_configuration_language._build import build_configuration
 
-    return patch("granular_configuration_language._cache.build_configuration", side_effect=build_configuration)
+    return patch("granular_configuration_language._build.build_configuration", side_effect=build_configuration)
 
 
 @pytest.mark.parametrize(
@@ -56,7 +57,14 @@ def test_laziness(
         assert config.A.key1 == "value2"
         assert config.A.key2 == "MyTestValue"
 
-        bc_mock.assert_called_once_with(Locations(files), mutable, inject_before=None, inject_after=None)
+        bc_mock.assert_called_once_with(
+            Locations(files),
+            mutable,
+            inject_before=None,
+            inject_after=None,
+            parallel_load=False,
+            base_path=BasePath(),
+        )
 
 
 def test_with_base_path() -> None:
@@ -1,10 +1,24 @@
 from __future__ import annotations
 
 import collections.abc as tabc
+import os
+import subprocess
+import sys
+import time
 from itertools import permutations
 from pathlib import Path
+from unittest.mock import patch
 
-from granular_configuration_language._locations import Locations
+import pytest
+
+from granular_configuration_language._directory_index import DirectoryIndex, directory_index
+from granular_configuration_language._locations import (
+    DEFAULT_LOCATION_CACHE_SIZE,
+    LOCATION_CACHE_SIZE_ENV,
+    BaseLocation,
+    Locations,
+    read_location_cache_size,
+)
 
 ASSET_DIR = (Path(__file__).parent / "assets" / "test_locations").resolve()
 
@@ -120,3 +134,126 @@ def test_Locations_is_truthy() -> None:
 
     assert Locations(tuple()) == Locations(tuple())
     assert Locations((ASSET_DIR / "anything",)).locations[0] == Locations((ASSET_DIR / "anything",)).locations[0]
+
+
+def make_old(directory: Path) -> None:
+    # Directory listings are only cached once the mtime is old enough to trust
+    an_hour_ago = time.time() - 3600
+    os.utime(directory, (an_hour_ago, an_hour_ago))
+
+
+@pytest.fixture
+def tenant_dir(tmp_path: Path) -> Path:
+    for tenant in range(10):
+        (tmp_path / f"tenant{tenant}.yaml").write_text("a: 1\n")
+    make_old(tmp_path)
+    directory_index.clear()
+    return tmp_path
+
+
+def test_one_listing_per_directory(tenant_dir: Path) -> None:
+    locations = Locations(tenant_dir / f"tenant{tenant}.*" for tenant in range(20))
+
+    with patch.object(os, "scandir", wraps=os.scandir) as scandir:
+        assert len(tuple(locations)) == 10
+        assert len(tuple(locations)) == 10
+        assert len(tuple(Locations((tenant_dir / "tenant1.yaml",)))) == 1
+
+    scandir.assert_called_once_with(tenant_dir)
+
+
+def test_listing_is_invalidated_by_directory_mtime(tenant_dir: Path) -> None:
+    locations = Locations((tenant_dir / "new.yaml", tenant_dir / "tenant0.yaml"))
+    assert tuple(locations) == (tenant_dir / "tenant0.yaml",)
+
+    (tenant_dir / "new.yaml").write_text("a: 1\n")
+    assert tuple(locations) == (tenant_dir / "new.yaml", tenant_dir / "tenant0.yaml")
+
+    (tenant_dir / "tenant0.yaml").unlink()
+    make_old(tenant_dir)
+    assert tuple(locations) == (tenant_dir / "new.yaml",)
+
+
+def test_recently_modified_directories_are_not_cached(tmp_path: Path) -> None:
+    (tmp_path / "config.yaml").write_text("a: 1\n")
+    index = DirectoryIndex(10)
+
+    with patch.object(os, "scandir", wraps=os.scandir) as scandir:
+        assert index.is_file(tmp_path / "config.yaml")
+        assert not index.is_file(tmp_path / "missing.yaml")
+
+    scandir.assert_not_called()
+
+
+def test_symlinks_are_checked_directly(tenant_dir: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+    target = tmp_path_factory.mktemp("targets") / "target.yaml"
+    target.write_text("a: 1\n")
+    link = tenant_dir / "link.yaml"
+    link.symlink_to(target)
+    make_old(tenant_dir)
+
+    assert directory_index.is_file(link)
+
+    # Removing the target does not change the mtime of the link's directory
+    target.unlink()
+    assert not directory_index.is_file(link)
+
+
+def test_least_recently_used_directories_are_dropped(tmp_path: Path) -> None:
+    directories = [tmp_path / "a", tmp_path / "b"]
+    for directory in directories:
+        directory.mkdir()
+        (directory / "config.yaml").write_text("a: 1\n")
+        make_old(directory)
+
+    index = DirectoryIndex(1)
+    with patch.object(os, "scandir", wraps=os.scandir) as scandir:
+        for directory in directories * 2:
+            assert index.is_file(directory / "config.yaml")
+
+    assert scandir.call_count == 4
+
+
+def test_missing_directory_has_no_files(tmp_path: Path) -> None:
+    assert not directory_index.is_file(tmp_path / "missing" / "config.yaml")
+
+
+def test_location_cache_size_is_configurable() -> None:
+    with patch.dict(os.environ, values={LOCATION_CACHE_SIZE_ENV: "5"}):
+        assert read_location_cache_size() == 5
+
+
+@pytest.mark.parametrize("value", ("-1", "abc"))
+def test_invalid_location_cache_size_warns_and_uses_the_default(value: str) -> None:
+    with patch.dict(os.environ, values={LOCATION_CACHE_SIZE_ENV: value}), pytest.warns(RuntimeWarning, match=value):
+        assert read_location_cache_size() == DEFAULT_LOCATION_CACHE_SIZE
+
+
+def test_invalid_location_cache_size_does_not_fail_the_import() -> None:
+    stderr = subprocess.run(
+        [sys.executable, "-c", "import granular_configuration_language"],
+        env=os.environ | {LOCATION_CACHE_SIZE_ENV: "abc"},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    assert LOCATION_CACHE_SIZE_ENV in stderr
+
+
+def test_zero_disables_the_index(tenant_dir: Path) -> None:
+    index = DirectoryIndex(0)
+
+    with patch.object(os, "scandir", wraps=os.scandir) as scandir:
+        assert index.is_file(tenant_dir / "tenant0.yaml")
+
+    scandir.assert_not_called()
+
+
+def test_locations_must_define_existing() -> None:
+    class Incomplete(BaseLocation):
+        def __hash__(self) -> int:
+            return 0
+
+    with pytest.raises(TypeError, match="existing"):
+        Incomplete()  # type: ignore[abstract]
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import pickle
+import typing as typ
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from granular_configuration_language import (
+    Configuration,
+    FrozenConfiguration,
+    LazyLoadConfiguration,
+    MutableConfiguration,
+)
+from granular_configuration_language.exceptions import PlaceholderConfigurationError, TypedConfigurationMismatch
+from granular_configuration_language.yaml import loads
+
+DOCUMENT = """\
+a: 101
+b:
+  c: !Sub ${/a}
+codes:
+  400: Bad Request
+items: 1
+"""
+
+
+class SubConfig(Configuration):
+    c: str
+
+
+class Config(Configuration):
+    a: int
+    b: SubConfig
+    codes: Configuration[int, str]
+    items: int  # type: ignore[assignment]  # Used by `Configuration`
+    optional: SubConfig | None = None
+    default: int = 5
+    constant: typ.ClassVar[int] = 1
+
+
+class ExtendedConfig(Config):
+    extended: bool
+
+
+def test_attributes_are_slots() -> None:
+    typed = loads(DOCUMENT).materialize(Config)
+
+    assert isinstance(typed, Config)
+    assert isinstance(typed.b, SubConfig)
+    assert isinstance(typed.codes, FrozenConfiguration)
+    assert "a" in type(typed).__slots__
+    assert "c" in type(typed.b).__slots__
+
+    with patch.object(Configuration, "__getattr__", side_effect=AssertionError):
+        assert typed.a == 101
+        assert typed.b.c == "101"
+        assert typed.codes[400] == "Bad Request"
+        assert typed.optional is None
+        assert typed.default == 5
+        assert typed.constant == 1
+
+    assert typed["items"] == 1
+    assert callable(typed.items)
+    assert typed.as_dict() == {
+        "a": 101,
+        "b": {"c": "101"},
+        "codes": {400: "Bad Request"},
+        "items": 1,
+        "optional": None,
+        "default": 5,
+    }
+
+
+def test_classes_are_cached() -> None:
+    first = loads(DOCUMENT).materialize(Config)
+    second = loads(DOCUMENT.replace("101", "102")).materialize(Config)
+
+    assert type(first) is type(second)
+    assert type(first) is not Config
+    assert second.a == 102
+
+
+def test_all_mismatches_are_reported() -> None:
+    with pytest.raises(TypedConfigurationMismatch) as e:
+        loads("b: {d: 1}\nextra: 1\ncodes: {}\nitems: 1\noptional: 1").materialize(ExtendedConfig)
+
+    assert str(e.value).splitlines()[1:] == [
+        "- `$.extra` is not in ExtendedConfig",
+        "- `$.a` is missing, but required by ExtendedConfig",
+        "- `$.b.d` is not in SubConfig",
+        "- `$.b.c` is missing, but required by SubConfig",
+        "- `$.optional` is not a mapping for SubConfig",
+        "- `$.extended` is missing, but required by ExtendedConfig",
+    ]
+
+
+class Node(Configuration):
+    v: int
+    child: Node | None
+
+
+def test_aliases_and_cycles_are_shared() -> None:
+    node = loads("v: 1\nchild: !Ref $").materialize(Node)
+
+    assert node.child is node
+    assert node.child.v == 1
+
+    typed = loads("a: 1\nb: &b {c: '2'}\noptional: *b\ncodes: {}\nitems: 1").materialize(Config)
+    assert typed.b is typed.optional
+
+
+def test_placeholders_raise() -> None:
+    with pytest.raises(PlaceholderConfigurationError):
+        loads(DOCUMENT + "default: !Placeholder message").materialize(Config)
+
+
+class MutableConfig(MutableConfiguration):
+    a: int
+
+
+class HasMutableSection(Configuration):
+    section: MutableConfig
+
+
+def test_mutable_typed_bases_are_rejected() -> None:
+    with pytest.raises(TypeError, match="MutableConfig is a MutableConfiguration"):
+        loads("a: 1").materialize(MutableConfig)
+    with pytest.raises(TypeError, match="MutableConfig is a MutableConfiguration"):
+        loads("section: {a: 1}").materialize(HasMutableSection)
+
+
+def test_pickles() -> None:
+    typed = loads(DOCUMENT).materialize(Config)
+    other = pickle.loads(pickle.dumps(typed))
+
+    assert type(other) is type(typed)
+    assert other.b.c == "101"
+    assert other == typed
+
+
+def test_lazy_load_configuration(tmp_path: Path) -> None:
+    file = tmp_path / "config.yaml"
+    file.write_text(DOCUMENT)
+
+    assert LazyLoadConfiguration(file).materialize(Config).b.c == "101"
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import typing as typ
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from granular_configuration_language import Configuration, LazyLoadConfiguration
+from granular_configuration_language.yaml.decorators.eager_io import _funcs
+from granular_configuration_language.yaml.file_ops.binary import load_binary_view
+from granular_configuration_language.yaml.file_ops.text import load_text_file
+
+ASSET_DIR = (Path(__file__).parent / "assets" / "test_overrides").resolve()
+FILES = (ASSET_DIR / "base.yaml", ASSET_DIR / "prod.yaml")
+
+
+def build(*files: Path, inject_after: Configuration | None = None) -> Configuration:
+    return LazyLoadConfiguration(*files, inject_after=inject_after, disable_caching=True).config
+
+
+def raw_structure(config: Configuration) -> list[tuple[typ.Any, typ.Any]]:
+    return [
+        (key, raw_structure(value) if isinstance(value, Configuration) else type(value))
+        for key, value in config._raw_items()
+    ]
+
+
+def test_overridden_tags_do_not_start_eager_io() -> None:
+    binary_loader = Mock(wraps=load_binary_view)
+    text_loader = Mock(wraps=load_text_file)
+
+    with patch.object(_funcs, "load_binary_view", binary_loader), patch.object(_funcs, "load_text_file", text_loader):
+        config = build(*FILES)
+
+    # Only `nested.kept` and the aliased `shared.value` survive the merge
+    text_loader.assert_called_once()
+    binary_loader.assert_called_once()
+
+    assert config.binary == "overridden"
+    assert config.nested.kept == {"from_file": True}
+
+
+def test_result_matches_building_without_pruning() -> None:
+    with patch("granular_configuration_language._overrides.prune_overridden", return_value=0):
+        unpruned = build(*FILES)
+
+    config = build(*FILES)
+
+    assert raw_structure(config) == raw_structure(unpruned)
+    assert config.as_dict() == unpruned.as_dict()
+    assert config.tagged == {"from_file": True, "extra": "value"}
+    assert config.nested.sequence == {"mapping": "overridden"}
+    assert config.alias is config.shared  # Aliases construct to the same `Configuration`, which is merged into
+
+
+def test_inject_after_overrides_are_pruned() -> None:
+    binary_loader = Mock(wraps=load_binary_view)
+
+    with patch.object(_funcs, "load_binary_view", binary_loader):
+        config = build(
+            ASSET_DIR / "base.yaml",
+            inject_after=Configuration(
+                prod_only="injected",
+                binary="injected",
+                nested=Configuration(sequence=()),
+                shared=Configuration(value="injected"),
+            ),
+        )
+
+    binary_loader.assert_called_once()
+    assert config.binary == "injected"
+    assert config.reference == "injected"
+    assert config.nested.sequence == ()
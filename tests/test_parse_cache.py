@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+import pickle
+import typing as typ
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from granular_configuration_language import LazyLoadConfiguration
+from granular_configuration_language.exceptions import ErrorWhileLoadingFileOccurred
+from granular_configuration_language.yaml.load import _load_yaml_string
+from granular_configuration_language.yaml.load._backends import YAML_BACKEND_ENV, compose
+from granular_configuration_language.yaml.load._parse_cache import PARSE_CACHE_DIR_ENV
+
+DOCUMENT = """\
+base: &base
+  a: 1
+  b: [1, 2]
+merged:
+  <<: *base
+  a: 2
+alias: *base
+sub: !Sub ${PARSE_CACHE_TEST_VALUE}
+ref: !Ref /merged/a
+"""
+
+
+def compose_fails(config_str: str, version: tuple[int, int] | None) -> None:
+    raise AssertionError("Expected a cache hit")
+
+
+def load(file: Path, cache_dir: Path, value: str = "value", backend: str = "auto") -> dict[str, typ.Any]:
+    with patch.dict(
+        os.environ,
+        values={PARSE_CACHE_DIR_ENV: str(cache_dir), "PARSE_CACHE_TEST_VALUE": value, YAML_BACKEND_ENV: backend},
+    ):
+        return LazyLoadConfiguration(file).config.as_dict()
+
+
+@pytest.fixture
+def file(tmp_path: Path) -> Path:
+    file = tmp_path / "config.yaml"
+    file.write_text(DOCUMENT)
+    return file
+
+
+def test_cache_is_opt_in(file: Path, tmp_path: Path) -> None:
+    with patch.dict(os.environ, values={"PARSE_CACHE_TEST_VALUE": "value"}):
+        os.environ.pop(PARSE_CACHE_DIR_ENV, None)
+        assert LazyLoadConfiguration(file).config["sub"] == "value"
+
+    assert sorted(tmp_path.iterdir()) == [file]
+
+
+def test_second_load_uses_the_cache(file: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    expected = load(file, cache_dir)
+
+    assert len(list(cache_dir.iterdir())) == 1
+
+    with patch.object(_load_yaml_string, "compose", compose_fails):
+        assert load(file, cache_dir) == expected
+
+
+def test_cached_document_is_unchanged(file: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    load(file, cache_dir)
+    config = load(file, cache_dir)
+
+    assert config["base"] == {"a": 1, "b": (1, 2)}
+    assert config["merged"] == {"a": 2, "b": (1, 2)}
+    assert config["alias"] == config["base"]
+    assert config["ref"] == 2
+
+
+def test_tags_are_constructed_fresh(file: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+
+    assert load(file, cache_dir, "first")["sub"] == "first"
+
+    with patch.object(_load_yaml_string, "compose", compose_fails):
+        assert load(file, cache_dir, "second")["sub"] == "second"
+
+
+def test_changed_file_is_parsed_again(file: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    load(file, cache_dir)
+
+    file.write_text("changed: true\n")
+
+    assert load(file, cache_dir) == {"changed": True}
+    assert load(file, cache_dir) == {"changed": True}
+
+
+def test_corrupt_entry_is_a_miss(file: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    load(file, cache_dir)
+
+    (entry,) = cache_dir.iterdir()
+    entry.write_bytes(b"not a pickle")
+
+    assert load(file, cache_dir)["merged"]["a"] == 2
+    assert entry.read_bytes() != b"not a pickle"
+
+
+def test_entry_is_not_unpickled_unless_its_header_matches(file: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    load(file, cache_dir)
+
+    (entry,) = cache_dir.iterdir()
+    entry.write_bytes(pickle.dumps("not a header") + entry.read_bytes().partition(b"\n")[2])
+
+    with patch.object(pickle, "load") as unpickle:
+        assert load(file, cache_dir)["merged"]["a"] == 2
+
+    unpickle.assert_not_called()
+
+
+def test_entries_are_not_shared_across_backends(file: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    load(file, cache_dir, backend="ruamel")
+
+    parse = Mock(wraps=compose)
+    with patch.object(_load_yaml_string, "compose", parse):
+        load(file, cache_dir, backend="ruamel-clib")
+        load(file, cache_dir, backend="ruamel")
+
+    assert parse.call_count == 1
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_yaml_directive_is_honored_from_the_cache(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    file = tmp_path / "config.yaml"
+    file.write_text("%YAML 1.1\n---\na: 010\nb: yes\n")
+
+    assert load(file, cache_dir) == {"a": 8, "b": True}
+
+    with patch.object(_load_yaml_string, "compose", compose_fails):
+        assert load(file, cache_dir) == {"a": 8, "b": True}
+
+
+def test_errors_from_the_cache_name_the_line(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    file = tmp_path / "config.yaml"
+    file.write_text("a: 1\nb:\n  c: 1\n  c: 2\n")
+
+    messages = list[str]()
+    for _ in range(2):
+        with pytest.raises(ErrorWhileLoadingFileOccurred, match="duplicate key") as e:
+            load(file, cache_dir)
+        messages.append(str(e.value))
+
+    assert "line 4, column 3" in messages[1]
+    assert messages[1] == messages[0]
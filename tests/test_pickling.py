@@ -95,3 +95,29 @@ def test_MutableLazyLoadConfiguration_is_pickable() -> None:
         transformed: MutableLazyLoadConfiguration = pickle.loads(serialized)
 
         assert transformed.config.as_dict() == {"a": "text"}
+
+
+# `pickle.dumps(dict(loads("a: !Sub ${/b}\nb: text\nc: !Sub text\n")._raw_items()), protocol=4)`, made with 2.5.0,
+# when `LazyEval` held a lock and pickling replaced its closure with `pickling_error_occur`.
+PICKLED_BEFORE_2_6 = (
+    b"\x80\x04\x95\xb3\x02\x00\x00\x00\x00\x00\x00}\x94(\x8c\x01a\x94\x8c:granular_configuration_language.yaml"
+    b".decorators._lazy_eval\x94\x8c\x10LazyEvalWithRoot\x94\x93\x94)\x81\x94}\x94(\x8c\x03tag\x94\x8c\x04!Sub"
+    b"\x94\x8c\x0f_LazyEval__lock\x94N\x8c\x18_LazyEvalWithRoot__value\x94h\x02\x8c\x14pickling_error_occur\x94"
+    b"\x93\x94\x8c\x1c_LazyEvalWithRoot__lazy_root\x94\x8c,granular_configuration_language.yaml.classes\x94\x8c"
+    b"\x08LazyRoot\x94\x93\x94)\x81\x94N}\x94\x8c\x0f_LazyRoot__root\x94\x8c.granular_configuration_language"
+    b"._configuration\x94\x8c\rConfiguration\x94\x93\x94)\x81\x94N}\x94(\x8c\x14_Configuration__data\x94}\x94("
+    b"h\x01h\x05\x8c\x01b\x94\x8c\x04text\x94\x8c\x01c\x94h\x02\x8c\rLazyEvalBasic\x94\x93\x94)\x81\x94}\x94(h"
+    b"\x07h\x08h\tN\x8c\x15_LazyEvalBasic__value\x94h\x0c\x8c\x11_LazyEval__result\x94\x8c\x04text\x94\x8c\x06"
+    b"result\x94h$ubu\x8c\x1e_Configuration__attribute_name\x94h\x14\x8c\rAttributeName\x94\x93\x94)\x81\x94N}"
+    b"\x94(\x8c\x14_AttributeName__prev\x94N\x8c\x1d_AttributeName__explicit_prev\x94)\x8c\x14_AttributeName__"
+    b"name\x94\x8c\x01$\x94u\x86\x94bu\x86\x94bs\x86\x94bh#h\x1ch%h\x1cubh\x1bh\x1ch\x1dh u."
+)
+
+
+def test_LazyEval_pickled_before_2_6_can_be_unpickled() -> None:
+    raw = pickle.loads(PICKLED_BEFORE_2_6)
+
+    assert isinstance(raw["a"], LazyEval)
+    assert isinstance(raw["c"], LazyEval)
+    assert raw["c"].result == "text"
+    assert raw["a"].result == "text"
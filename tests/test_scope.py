@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import typing as typ
+from pathlib import Path
+from unittest.mock import Mock, patch
+from weakref import WeakValueDictionary
+
+import pytest
+
+from granular_configuration_language import Configuration, LazyLoadConfiguration
+from granular_configuration_language._base_path import read_base_path
+from granular_configuration_language._build import build_configuration
+from granular_configuration_language._locations import Locations
+from granular_configuration_language._scope import reference_path
+from granular_configuration_language.yaml.decorators.eager_io import _funcs
+from granular_configuration_language.yaml.file_ops.binary import load_binary_view
+
+ASSET_DIR = (Path(__file__).parent / "assets" / "test_scope").resolve()
+FILES = (ASSET_DIR / "config.yaml", ASSET_DIR / "override.yaml")
+
+
+def build(*files: Path, base_path: str | None) -> Configuration:
+    return build_configuration(
+        Locations(files), False, inject_before=None, inject_after=None, base_path=read_base_path(base_path)
+    )
+
+
+def keys(config: Configuration) -> dict[str, typ.Any]:
+    return {key: keys(value) if isinstance(value, Configuration) else None for key, value in config._raw_items()}
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    (
+        ("/a/b", ("a", "b")),
+        ("/a~1b/c~0d", ("a/b", "c~d")),
+        ("$.a.b", ("a", "b")),
+        ("$.a[0].b", ("a",)),
+        ("$.a..b", ("a",)),
+        ("$..a", None),
+        ("$['a']", None),
+        ("$", None),
+        ("/a/${ENV}", None),
+    ),
+)
+def test_reference_path(query: str, expected: tuple[str, ...] | None) -> None:
+    assert reference_path(query) == expected
+
+
+def test_only_referenced_subtrees_outside_the_base_path_are_kept() -> None:
+    binary_loader = Mock(wraps=load_binary_view)
+
+    with patch.object(_funcs, "load_binary_view", binary_loader):
+        root = build(*FILES, base_path="app")
+
+    binary_loader.assert_called_once()  # Only `app.binary`
+
+    assert keys(root) == {
+        "app": {"timeout": None, "name": None, "linked": None, "local": None, "binary": None},
+        "linked": {"value": None},
+        "chained": {"value": None},
+        "shared": {"prefix": None},
+    }
+    assert root.app.as_dict() == {
+        "timeout": 30,
+        "name": "svc-override",
+        "linked": "chained",
+        "local": "svc-override",
+        "binary": b"binary data",
+    }
+
+
+def test_result_matches_building_everything() -> None:
+    scoped = build(*FILES, base_path="/app")
+    full = build(*FILES, base_path=None)
+
+    assert "unrelated" in full
+    assert scoped.app == full.app
+
+
+def test_unknown_references_keep_everything() -> None:
+    root = build(ASSET_DIR / "parse_file.yaml", base_path="app")
+
+    assert "unrelated" in root
+    assert root.app.parsed.shared.prefix == "svc"
+
+
+@patch("granular_configuration_language._cache.store", new_callable=WeakValueDictionary)
+def test_shared_configurations_are_scoped_to_every_base_path(store: WeakValueDictionary) -> None:
+    app = LazyLoadConfiguration(*FILES, base_path="app")
+    chained = LazyLoadConfiguration(*FILES, base_path="chained")
+    shared_ref = store[Locations(FILES), False]
+
+    assert app.name == "svc-override"
+    assert chained.value == "chained"
+
+    # Once loaded, the build covers every Base Path, so it is shared
+    unrelated = LazyLoadConfiguration(*FILES, base_path="unrelated")
+    assert not shared_ref.is_loading
+    assert store[Locations(FILES), False] is shared_ref
+    assert tuple(unrelated) == ("binary", "broken", "more")
+
+
+@patch("granular_configuration_language._cache.store", new_callable=WeakValueDictionary)
+def test_loaded_configurations_are_only_shared_within_their_scope(store: WeakValueDictionary) -> None:
+    app = LazyLoadConfiguration(*FILES, base_path="app")
+    shared_ref = store[Locations(FILES), False]
+    assert app.name == "svc-override"
+    assert not shared_ref.is_loading
+
+    # A Base Path inside the loaded one shares the build
+    assert LazyLoadConfiguration(*FILES, base_path="/app").name == "svc-override"
+    assert store[Locations(FILES), False] is shared_ref
+
+    # Outside of it, a new Base Path gets its own load
+    unrelated = LazyLoadConfiguration(*FILES, base_path="unrelated")
+    assert store[Locations(FILES), False] is not shared_ref
+    assert tuple(unrelated) == ("binary", "broken", "more")
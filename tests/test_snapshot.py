@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import importlib.util
+import subprocess
+import sys
+import typing as typ
+from pathlib import Path
+
+import pytest
+
+from granular_configuration_language import (
+    Configuration,
+    LazyLoadConfiguration,
+    MutableConfiguration,
+    MutableLazyLoadConfiguration,
+)
+from granular_configuration_language._snapshot import generate_snapshot
+
+ASSET_DIR = (Path(__file__).parent / "assets" / "test_snapshot").resolve()
+
+
+def import_snapshot(tmp_path: Path, source: str, name: str = "CONFIG") -> typ.Any:
+    module_path = tmp_path / "config_snapshot.py"
+    module_path.write_text(source)
+    spec = importlib.util.spec_from_file_location("config_snapshot", module_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, name)
+
+
+def structure(value: typ.Any) -> typ.Any:
+    if isinstance(value, Configuration):
+        return (type(value), [(key, structure(item)) for key, item in value.items()])
+    elif isinstance(value, list | tuple):
+        return (type(value), [structure(item) for item in value])
+    else:
+        return (type(value), value)
+
+
+def test_snapshot_rebuilds_the_same_configuration(tmp_path: Path) -> None:
+    config = LazyLoadConfiguration(ASSET_DIR / "config.yaml").config
+
+    snapshot = import_snapshot(tmp_path, generate_snapshot(config))
+
+    assert structure(snapshot) == structure(config)
+    assert snapshot.app.greeting == "Hello snapshot"
+    assert snapshot.app.large == float("inf")
+
+
+def test_mutable_snapshot(tmp_path: Path) -> None:
+    config = MutableLazyLoadConfiguration(ASSET_DIR / "config.yaml").config
+
+    snapshot = import_snapshot(tmp_path, generate_snapshot(config, name="SETTINGS"), name="SETTINGS")
+
+    assert structure(snapshot) == structure(config)
+    assert isinstance(snapshot.app, MutableConfiguration)
+    assert isinstance(snapshot.app.sequence, list)
+
+
+def test_values_that_are_not_literals_are_listed() -> None:
+    config = LazyLoadConfiguration(ASSET_DIR / "unsupported.yaml").config
+
+    with pytest.raises(ValueError, match="cannot be written as literals") as exc_info:
+        generate_snapshot(config)
+
+    assert str(exc_info.value).splitlines()[1:] == [
+        "  - $.func: builtin_function_or_method",
+        "  - $.nested.secret: Masked",
+        "  - $.nested.sequence[0]: !Class",
+    ]
+
+
+def test_placeholders_are_listed() -> None:
+    config = LazyLoadConfiguration(ASSET_DIR / "placeholders.yaml").config
+
+    with pytest.raises(ValueError, match="cannot be written as literals") as exc_info:
+        generate_snapshot(config)
+
+    assert str(exc_info.value).splitlines()[1:] == [
+        "  - $.first: !Placeholder",
+        "  - $.nested.second: !Placeholder",
+        "  - $.nested.sequence[0]: !Placeholder",
+        "  - $.nested.ref: !Placeholder",
+    ]
+
+
+@pytest.mark.parametrize("name", ["not-valid", "1st", "class", ""])
+def test_name_must_be_an_identifier(name: str) -> None:
+    with pytest.raises(ValueError, match="not a valid Python identifier"):
+        generate_snapshot(Configuration(), name=name)
+
+
+def test_snapshot_entry_point(tmp_path: Path) -> None:
+    output = tmp_path / "config_snapshot.py"
+
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "granular_configuration_language.snapshot",
+            str(ASSET_DIR / "config.yaml"),
+            "--base-path",
+            "app",
+            "--output",
+            str(output),
+        ]
+    )
+    assert import_snapshot(tmp_path, output.read_text()).name == "snapshot"
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "granular_configuration_language.snapshot",
+            str(ASSET_DIR / "unsupported.yaml"),
+            "--output",
+            str(tmp_path / "unsupported.py"),
+        ],
+        capture_output=True,
+    )
+    assert result.returncode == 1
+    assert b"$.nested.secret: Masked" in result.stderr
+    assert not (tmp_path / "unsupported.py").exists()
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "granular_configuration_language.snapshot",
+            str(tmp_path / "does_not_exist.yaml"),
+            "--name",
+            "not-valid",
+            "--output",
+            str(tmp_path / "invalid.py"),
+        ],
+        capture_output=True,
+    )
+    assert result.returncode == 2  # Refused by argparse
+    assert b"`not-valid` is not a valid Python identifier" in result.stderr
+    assert not (tmp_path / "invalid.py").exists()
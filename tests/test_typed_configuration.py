@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import copy
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from granular_configuration_language import Configuration, LazyLoadConfiguration
 from granular_configuration_language.exceptions import ErrorWhileLoadingFileOccurred
-from granular_configuration_language.proxy import SafeConfigurationProxy
-from granular_configuration_language.yaml import loads
+from granular_configuration_language.proxy import SafeConfigurationProxy, TypedConfigurationView
+from granular_configuration_language.yaml import LazyEval, loads
 
 ASSET_DIR = (Path(__file__).parent / "assets" / "test_typed_configuration").resolve()
 LAZY_DIR = (Path(__file__).parent / "assets" / "test_lazy_config").resolve()
@@ -87,3 +88,61 @@ def test_reloading_an_error_does_not_infinite_loop() -> None:
 
     with pytest.raises(ErrorWhileLoadingFileOccurred):
         config.as_dict()
+
+
+class DefaultedConfig(Config):
+    missing: int = 5
+    items: int  # type: ignore[assignment]  # Used by `Configuration`
+
+
+def test_cache_fields_view() -> None:
+    llc = LazyLoadConfiguration(ASSET_DIR / "config.yaml")
+    typed = llc.as_typed(DefaultedConfig, cache_fields=True)
+
+    assert isinstance(typed, TypedConfigurationView)
+    assert isinstance(typed, SafeConfigurationProxy)
+    assert isinstance(typed, Configuration)
+    assert "_LazyLoadConfiguration__config" not in vars(llc)  # Not loaded
+
+    assert typed.a == 101
+    assert typed.b.c == "test me"
+    assert isinstance(typed.b, TypedConfigurationView)
+    assert typed.missing == 5
+    assert typed["a"] == 101
+    assert callable(typed.items)
+    assert typed.as_dict() == {"a": 101, "b": {"c": "test me"}, "config": "fetchable"}
+
+    with patch.object(Configuration, "__getattr__", side_effect=AssertionError):
+        assert typed.a == 101
+        assert typed.b.c == "test me"
+
+
+def test_cache_fields_view_sections_compile_paths() -> None:
+    typed = LazyLoadConfiguration(ASSET_DIR / "config.yaml").as_typed(Config, cache_fields=True)
+
+    assert typed.b.compile_path("c")() == "test me"
+    assert typed.compile_path("b.c")() == "test me"
+
+
+def test_cache_fields_view_classes_are_cached() -> None:
+    first = LazyLoadConfiguration(ASSET_DIR / "config.yaml").as_typed(Config, cache_fields=True)
+    second = LazyLoadConfiguration(ASSET_DIR / "config.yaml").as_typed(Config, cache_fields=True)
+
+    assert type(first) is type(second)
+    assert type(first).__name__ == "ConfigView"
+
+
+def test_cache_fields_view_only_evaluates_read_fields(tmp_path: Path) -> None:
+    file = tmp_path / "config.yaml"
+    file.write_text("config: !Sub ${/text}\nb:\n  c: !Sub ${/text}\ntext: value\n")
+    llc = LazyLoadConfiguration(file)
+    typed = llc.as_typed(Config, cache_fields=True)
+
+    assert typed.config == "value"
+    assert isinstance(dict(llc.config.b._raw_items())["c"], LazyEval)
+
+
+def test_cache_fields_view_holds_one_reference_to_its_source() -> None:
+    slots = [name for klass in TypedConfigurationView.__mro__ for name in vars(klass).get("__slots__", ())]
+
+    assert slots.count("__llc") == 1
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from granular_configuration_language._utils import write_atomically
+
+
+def test_write_atomically(tmp_path: Path) -> None:
+    file = tmp_path / "file.bin"
+    file.write_bytes(b"old")
+
+    write_atomically(file, b"new")
+
+    assert file.read_bytes() == b"new"
+    assert list(tmp_path.iterdir()) == [file]
+
+
+def test_failed_write_keeps_the_old_file(tmp_path: Path) -> None:
+    file = tmp_path / "file.bin"
+    file.write_bytes(b"old")
+
+    with patch.object(Path, "replace", side_effect=OSError("failed")), pytest.raises(OSError, match="failed"):
+        write_atomically(file, b"new")
+
+    assert file.read_bytes() == b"old"
+    assert list(tmp_path.iterdir()) == [file]  # Temporary file removed
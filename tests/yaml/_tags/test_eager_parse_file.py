@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from granular_configuration_language import Configuration, LazyLoadConfiguration
 from granular_configuration_language.exceptions import ParsingTriedToCreateALoop
 from granular_configuration_language.yaml import loads
+from granular_configuration_language.yaml.file_ops.text import _text
 
 ASSET_DIR = (Path(__file__).parent / "../../assets/" / "test_eager_parse_file").resolve()
 
@@ -60,3 +63,12 @@ def test_failing_when_creating_a_loop_of_many() -> None:
 
     with pytest.raises(ParsingTriedToCreateALoop):
         config.next.next.bad
+
+
+@pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise is not available")
+def test_large_files_get_a_read_ahead_hint() -> None:
+    with patch.object(_text, "READ_AHEAD_THRESHOLD", 1), patch.object(os, "posix_fadvise") as fadvise:
+        assert loads("!EagerParseFile simple.yaml", file_path=ASSET_DIR / "dummy.yaml") == "simple.yaml"
+
+    fadvise.assert_called_once()
+    assert fadvise.call_args.args[1:] == (0, 0, os.POSIX_FADV_SEQUENTIAL)
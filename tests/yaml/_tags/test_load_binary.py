@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import os
+import pickle
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from granular_configuration_language import Configuration, LazyLoadConfiguration
 from granular_configuration_language.yaml import loads
+from granular_configuration_language.yaml.file_ops.binary import (
+    MMAP_THRESHOLD_ENV,
+    load_binary_file,
+    read_binary_data,
+    read_binary_view,
+)
 
 ASSET_DIR = (Path(__file__).parent / "../../assets/" / "test_load_bindary").resolve()
 
@@ -30,3 +39,47 @@ def test_eager_loading_missing_file() -> None:
 def test_loading_missing_file() -> None:
     with pytest.raises(FileNotFoundError):
         loads("!LoadBinary does_not_exist.bin", file_path=ASSET_DIR / "dummy.yaml")
+
+
+@pytest.mark.parametrize("file", ("binary.yaml", "eager.yaml"))
+def test_large_files_are_memory_mapped(file: str) -> None:
+    with patch.dict(os.environ, values={MMAP_THRESHOLD_ENV: "5"}):
+        data = LazyLoadConfiguration(ASSET_DIR / file, disable_caching=True).config.data
+
+    assert isinstance(data, memoryview)
+    assert data.readonly
+    assert data.tobytes() == b"hello"
+
+
+@pytest.mark.parametrize("file", ("binary.yaml", "eager.yaml"))
+def test_small_files_are_not_memory_mapped(file: str) -> None:
+    with patch.dict(os.environ, values={MMAP_THRESHOLD_ENV: "6"}):
+        data = LazyLoadConfiguration(ASSET_DIR / file, disable_caching=True).config.data
+
+    assert data == b"hello"
+    assert isinstance(data, bytes)
+
+
+def test_read_binary_data_is_never_memory_mapped() -> None:
+    with patch.dict(os.environ, values={MMAP_THRESHOLD_ENV: "5"}):
+        assert isinstance(read_binary_view(ASSET_DIR / "data.bin"), memoryview)
+        assert isinstance(read_binary_data(ASSET_DIR / "data.bin"), bytes)
+        assert isinstance(read_binary_data(load_binary_file(ASSET_DIR / "data.bin")), bytes)
+
+
+@pytest.mark.parametrize("file", ("binary.yaml", "eager.yaml"))
+def test_memory_mapped_files_cannot_be_pickled(file: str) -> None:
+    with patch.dict(os.environ, values={MMAP_THRESHOLD_ENV: "5"}):
+        config = LazyLoadConfiguration(ASSET_DIR / file, disable_caching=True).config
+        config.data  # noqa: B018
+
+    with pytest.raises(TypeError, match="memoryview"):
+        pickle.dumps(config)
+
+
+def test_invalid_mmap_threshold() -> None:
+    with (
+        patch.dict(os.environ, values={MMAP_THRESHOLD_ENV: "big"}),
+        pytest.raises(ValueError, match=MMAP_THRESHOLD_ENV),
+    ):
+        loads("!LoadBinary data.bin", file_path=ASSET_DIR / "dummy.yaml")
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import pytest
+from ruamel.yaml.error import MarkedYAMLError, YAMLError
+from ruamel.yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
+
+from granular_configuration_language.yaml import loads
+from granular_configuration_language.yaml.load._backends import (
+    _BACKENDS,
+    YAML_BACKEND_ENV,
+    PyYAMLBackend,
+    RuamelBackend,
+    RuamelClibBackend,
+    _previous_backend,
+    get_backend,
+    read_yaml_version,
+)
+
+AVAILABLE_BACKENDS = [name for name, backend in _BACKENDS.items() if backend.is_available()]
+# The pure-Python parser was only used before backends were added when `ruamel.yaml.clib` is not installed
+C_BACKENDS = [name for name in AVAILABLE_BACKENDS if name != RuamelBackend.name]
+
+DOCUMENT = """\
+%TAG !e! tag:example.com,2000:
+---
+base: &base
+  a: 1
+  b: [yes, 010, 1.5, ~, "quoted", !!str 2]
+merged:
+  <<: *base
+  a: !Sub ${/base/a}
+alias: *base
+tagged: !e!thing value
+empty:
+"""
+
+
+def shape(node: Node | None) -> object:
+    if isinstance(node, ScalarNode):
+        return (node.tag, node.value)
+    elif isinstance(node, SequenceNode):
+        return (node.tag, [shape(child) for child in node.value])
+    elif isinstance(node, MappingNode):
+        return (node.tag, [(shape(key), shape(value)) for key, value in node.value])
+    else:
+        return node
+
+
+@pytest.mark.parametrize("name", AVAILABLE_BACKENDS)
+def test_backends_compose_the_same_nodes(name: str) -> None:
+    assert shape(get_backend(name).compose(DOCUMENT, None)) == shape(RuamelBackend().compose(DOCUMENT, None))
+
+
+@pytest.mark.parametrize("name", AVAILABLE_BACKENDS)
+def test_backends_keep_aliases(name: str) -> None:
+    node = get_backend(name).compose(DOCUMENT, None)
+
+    assert isinstance(node, MappingNode)
+    assert node.value[0][1] is node.value[2][1]
+
+
+@pytest.mark.parametrize("name", AVAILABLE_BACKENDS)
+def test_backends_honor_the_yaml_directive(name: str) -> None:
+    with patch.dict(os.environ, values={YAML_BACKEND_ENV: name}):
+        assert loads("%YAML 1.1\n---\na: 010\nb: yes\n") == {"a": 8, "b": True}
+        assert loads("%YAML 1.2\n---\na: 010\nb: yes\n") == {"a": 10, "b": "yes"}
+
+
+@pytest.mark.parametrize("name", AVAILABLE_BACKENDS)
+def test_backends_raise_ruamel_errors(name: str) -> None:
+    with pytest.raises(MarkedYAMLError):
+        get_backend(name).compose("a: [1, 2\nb: 3\n", None)
+
+
+def compose_or_error(name: str, config_str: str) -> object:
+    try:
+        return shape(get_backend(name).compose(config_str, None))
+    except YAMLError as e:
+        return (type(e), str(e))
+
+
+@pytest.mark.parametrize("name", C_BACKENDS)
+@pytest.mark.parametrize(
+    "config_str",
+    (
+        "a: {b:c}\n",
+        "a: [x, c:d]\n",
+        "a: {b: http://example.com}\n",
+        "a: [{b: c:d}]\n",
+        "a: {'b:c': 1, b: c}\n",
+        "a: b:c\nb: &x c:d\nc: [*x]\n",
+        "a: [1, 2\nb: 3\n",
+        "a: {b: 1\n",
+        "a:\n  - b\n c\n",
+    ),
+)
+def test_backends_match_the_previous_parser(name: str, config_str: str) -> None:
+    # Results and error messages match `ruamel.yaml.clib` (when installed), as used before backends were added
+    assert compose_or_error(name, config_str) == compose_or_error(_previous_backend().name, config_str)
+
+
+def test_read_yaml_version() -> None:
+    assert read_yaml_version("%YAML 1.1\n---\na: 1\n") == (1, 1)
+    assert read_yaml_version("%YAML 1.2 # comment\n---\n") == (1, 2)
+    assert read_yaml_version("# %YAML 1.1\na: 1\n") is None
+    assert read_yaml_version("a: 1\n") is None
+
+
+def test_auto_prefers_a_c_backend() -> None:
+    with patch.object(RuamelClibBackend, "is_available", return_value=True):
+        assert isinstance(get_backend.__wrapped__("auto"), RuamelClibBackend)
+
+    with (
+        patch.object(RuamelClibBackend, "is_available", return_value=False),
+        patch.object(PyYAMLBackend, "is_available", return_value=True),
+    ):
+        assert isinstance(get_backend.__wrapped__("auto"), PyYAMLBackend)
+
+    with (
+        patch.object(RuamelClibBackend, "is_available", return_value=False),
+        patch.object(PyYAMLBackend, "is_available", return_value=False),
+    ):
+        assert isinstance(get_backend.__wrapped__("auto"), RuamelBackend)
+
+
+def test_unavailable_backend_falls_back() -> None:
+    with (
+        patch.object(RuamelClibBackend, "is_available", return_value=True),
+        patch.object(PyYAMLBackend, "is_available", return_value=False),
+    ):
+        assert isinstance(get_backend.__wrapped__("pyyaml"), RuamelClibBackend)
+
+
+def test_unknown_backend_is_an_error() -> None:
+    with pytest.raises(ValueError, match=YAML_BACKEND_ENV):
+        get_backend("libfast")
@@ -3,14 +3,22 @@ from __future__ import annotations
 import copy
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import partial
+from pathlib import Path
+from threading import Event
 from unittest.mock import Mock, patch
+from weakref import ref as ref_to
 
 import pytest
+from ruamel.yaml.constructor import DuplicateKeyError
 
-from granular_configuration_language import Configuration
+from granular_configuration_language import Configuration, MutableConfiguration
 from granular_configuration_language.exceptions import EnvironmentVaribleNotFound
 from granular_configuration_language.yaml import LazyEval, loads
+from granular_configuration_language.yaml.classes import Tag
+from granular_configuration_language.yaml.decorators._lazy_eval import LazyEvalBasic
 from granular_configuration_language.yaml.decorators.interpolate._interpolate import interpolate
 
 
@@ -152,20 +160,68 @@ def test_LazyEval_result_runs_once() -> None:
     lazy_eval: LazyEval[date] = next(config._raw_items())[1]
     assert isinstance(lazy_eval, LazyEval)
 
-    with patch.object(lazy_eval, "_run", new=Mock(side_effect=lazy_eval._run)) as mock:
+    lazy_eval_type = type(lazy_eval)
+    with patch.object(lazy_eval_type, "_run", autospec=True, side_effect=lazy_eval_type._run) as mock:
         # Get the result a multiple times
         result = lazy_eval.result
         result = lazy_eval.result
         result = lazy_eval.result
 
-        # Simulation a two-threads calling before property is cached by removing the cached value
-        del lazy_eval.result
-
         assert lazy_eval.result is result
 
         mock.assert_called_once()
 
 
+def test_LazyEval_result_runs_once_across_threads() -> None:
+    running = Event()
+    release = Event()
+
+    def run() -> object:
+        running.set()
+        release.wait()
+        return object()
+
+    mock = Mock(side_effect=run)
+    lazy_eval = LazyEvalBasic(Tag("!Test"), mock)
+
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(lambda: lazy_eval.result) for _ in range(4)]
+        running.wait()
+        release.set()
+        results = {id(future.result()) for future in futures}
+
+    assert results == {id(lazy_eval.result)}
+    mock.assert_called_once()
+
+
+def test_LazyEval_runs_again_after_an_error() -> None:
+    lazy_eval = LazyEvalBasic(Tag("!Test"), Mock(side_effect=(ValueError("first"), 1)))
+
+    with pytest.raises(ValueError, match="first"):
+        lazy_eval.result  # noqa: B018
+    assert lazy_eval.result == 1
+    assert lazy_eval.result == 1
+
+
+def test_LazyEval_releases_its_inputs_once_evaluated() -> None:
+    payload = Configuration(value=1)
+    watcher = ref_to(payload)
+    lazy_eval = LazyEvalBasic(Tag("!Test"), partial(len, payload))
+    del payload
+
+    assert not hasattr(lazy_eval, "__dict__")
+    assert watcher() is not None
+    assert lazy_eval.result == 1
+    assert watcher() is None
+    assert lazy_eval.result == 1
+
+    config: Configuration = loads("a: 1\nb: !Ref /a")
+    with_root: LazyEval = dict(config._raw_items())["b"]
+    assert config.b == 1
+    assert not hasattr(with_root, "_LazyEvalWithRoot__lazy_root")
+    assert not hasattr(with_root, "_LazyEvalWithRoot__value")
+
+
 def test_LazyEval_keys_throw_errors() -> None:
     with pytest.raises(TypeError, match="keys to mappings"):
         loads("""
@@ -181,3 +237,75 @@ def test_interpolatations_starting_with_slash_without_root_error_with_env_var()
 def test_interpolatations_starting_with_dollar_without_root_error_with_env_var() -> None:
     with patch.dict(os.environ, values={}), pytest.raises(EnvironmentVaribleNotFound, match=re.escape("'$file'")):
         interpolate("${$file}", None)
+
+
+def test_constructor_class_is_built_once_per_mutable_and_tag_set() -> None:
+    from granular_configuration_language.yaml._tags import handlers
+    from granular_configuration_language.yaml.load._load_yaml_string import make_constructor_class
+
+    assert make_constructor_class(False, handlers) is make_constructor_class(False, handlers)
+    assert make_constructor_class(True, handlers) is make_constructor_class(True, handlers)
+    assert make_constructor_class(False, handlers) is not make_constructor_class(True, handlers)
+
+
+def test_state_is_not_shared_between_loads() -> None:
+    first = loads("a: !ParseFile first.yaml", file_path=Path("first_dir/config.yaml"))
+    second = loads("a: !ParseFile second.yaml", file_path=Path("second_dir/config.yaml"), mutable=True)
+
+    with pytest.raises(FileNotFoundError, match="first_dir"):
+        first.a
+
+    with pytest.raises(FileNotFoundError, match="second_dir"):
+        second.a
+
+
+def test_duplicate_keys_are_an_error() -> None:
+    test = """\
+a: 1
+a: 2
+"""
+    with pytest.raises(DuplicateKeyError):
+        loads(test)
+
+
+def test_merge_keys_can_be_overridden() -> None:
+    test = """\
+!Del base: &base
+    a: 1
+    b: 2
+    !Del c: 3
+over:
+    <<: *base
+    b: 3
+"""
+    assert loads(test).as_dict() == {"over": {"a": 1, "b": 3}}
+
+
+def test_sequence_keys_are_tuples() -> None:
+    test = """\
+? [a, b]
+: value
+"""
+    assert loads(test) == {("a", "b"): "value"}
+    assert loads(test, mutable=True) == {("a", "b"): "value"}
+
+
+def test_mappings_use_the_requested_type() -> None:
+    test = """\
+a:
+    b: [1, 2]
+"""
+    immutable = loads(test)
+    mutable = loads(test, mutable=True)
+
+    assert type(immutable) is Configuration
+    assert type(immutable.a) is Configuration
+    assert type(immutable.a.b) is tuple
+    assert type(mutable) is MutableConfiguration
+    assert type(mutable.a) is MutableConfiguration
+    assert type(mutable.a.b) is list
+
+
+def test_lazy_tags_are_not_allowed_as_keys() -> None:
+    with pytest.raises(TypeError, match="Lazy Tags are not allowed as keys to mappings."):
+        loads("!Mask key: value")
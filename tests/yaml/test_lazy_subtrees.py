@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import os
+import typing as typ
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from ruamel.yaml.constructor import ConstructorError
+
+from granular_configuration_language import Configuration, LazyLoadConfiguration, MutableConfiguration
+from granular_configuration_language.yaml import loads
+from granular_configuration_language.yaml.load._lazy_subtrees import LAZY_SUBTREES_ENV, MappingSubtree
+
+DOCUMENT = """\
+a:
+  b:
+    c: 1
+  d: 2
+unread:
+  broken: !NotATag value
+"""
+
+
+@pytest.fixture
+def lazy_subtrees() -> typ.Iterator[None]:
+    with patch.dict(os.environ, values={LAZY_SUBTREES_ENV: "TRUE"}):
+        yield
+
+
+def raw(config: Configuration) -> dict[typ.Any, typ.Any]:
+    return dict(config._raw_items())
+
+
+def test_disabled_by_default() -> None:
+    with patch.dict(os.environ):
+        os.environ.pop(LAZY_SUBTREES_ENV, None)
+        assert isinstance(raw(loads("a: {b: 1}"))["a"], Configuration)
+
+
+def test_nested_mappings_are_constructed_when_read(lazy_subtrees: None) -> None:
+    config = loads(DOCUMENT)
+    assert isinstance(raw(config)["a"], MappingSubtree)
+    assert isinstance(raw(config)["unread"], MappingSubtree)  # The unknown Tag was never constructed
+
+    a = config.a
+    assert isinstance(a, Configuration)
+    assert isinstance(raw(config)["a"], Configuration)  # Replaced once constructed
+    assert isinstance(raw(a)["b"], MappingSubtree)
+    assert a.d == 2
+    assert a.b.c == 1
+
+
+def test_iteration_constructs(lazy_subtrees: None) -> None:
+    config = loads("a: {b: {c: 1}}\nd: 2")
+    assert config.as_dict() == {"a": {"b": {"c": 1}}, "d": 2}
+    assert config == loads("a: {b: {c: 1}}\nd: 2")
+
+
+def test_results_match_eager_construction(lazy_subtrees: None) -> None:
+    document = "a: {b: !Ref /c, e: {f: [1, {g: h}]}}\nc: !Sub ${/a/e/f}"
+    lazy = loads(document)
+    with patch.dict(os.environ, values={LAZY_SUBTREES_ENV: "FALSE"}):
+        eager = loads(document)
+
+    assert lazy.as_dict() == eager.as_dict()
+
+
+def test_errors_are_raised_when_read(lazy_subtrees: None) -> None:
+    config = loads(DOCUMENT)
+    with pytest.raises(ConstructorError, match="NotATag") as e:
+        config.unread  # noqa: B018
+
+    assert "line 6, column 11" in str(e.value)  # Where it is in the document
+
+
+def test_only_merge_conflicts_are_constructed(tmp_path: Path, lazy_subtrees: None) -> None:
+    first = tmp_path / "first.yaml"
+    first.write_text("shared:\n  a: 1\n  nested: {b: 2}\nfirst_only: {c: 3}\n")
+    second = tmp_path / "second.yaml"
+    second.write_text("shared:\n  d: 4\nsecond_only: {e: 5}\n")
+
+    config = LazyLoadConfiguration(first, second).config
+
+    assert isinstance(raw(config)["first_only"], MappingSubtree)
+    assert isinstance(raw(config)["second_only"], MappingSubtree)
+    assert isinstance(raw(config)["shared"], Configuration)
+    assert isinstance(raw(config.shared)["nested"], MappingSubtree)
+    assert config.as_dict() == {
+        "shared": {"a": 1, "nested": {"b": 2}, "d": 4},
+        "first_only": {"c": 3},
+        "second_only": {"e": 5},
+    }
+
+
+def test_overridden_values_stay_pruned(tmp_path: Path, lazy_subtrees: None) -> None:
+    first = tmp_path / "first.yaml"
+    first.write_text("a:\n  b: !NotATag value\n  c: 1\n")
+    second = tmp_path / "second.yaml"
+    second.write_text("a:\n  b: 2\n")
+
+    assert LazyLoadConfiguration(first, second).config.as_dict() == {"a": {"b": 2, "c": 1}}
+
+
+def test_scoped_out_values_stay_dropped(tmp_path: Path, lazy_subtrees: None) -> None:
+    file = tmp_path / "config.yaml"
+    file.write_text("app:\n  settings:\n    a: 1\n  other: !NotATag value\nunused: {b: 2}\n")
+
+    assert LazyLoadConfiguration(file, base_path="/app/settings").config.as_dict() == {"a": 1}
+
+
+def test_inject_after_merges_subtrees(tmp_path: Path, lazy_subtrees: None) -> None:
+    file = tmp_path / "config.yaml"
+    file.write_text("shared: {a: 1}\n")
+
+    config = LazyLoadConfiguration(file, inject_after=loads("shared: {b: 2}\nother: {c: 3}")).config
+
+    assert config.as_dict() == {"shared": {"a": 1, "b": 2}, "other": {"c": 3}}
+
+
+def test_aliases_are_fully_constructed(lazy_subtrees: None) -> None:
+    config = loads("a: &shared {b: 1}\nc: *shared\nd: {e: 2}")
+    assert isinstance(raw(config)["d"], Configuration)
+    assert config.a is config.c
+
+
+def test_mutable_is_fully_constructed(lazy_subtrees: None) -> None:
+    config = loads("a: {b: 1}", mutable=True)
+    assert isinstance(raw(config)["a"], MutableConfiguration)
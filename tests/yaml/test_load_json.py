@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+import typing as typ
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from granular_configuration_language import Configuration, LazyLoadConfiguration, MutableConfiguration
+from granular_configuration_language.exceptions import ErrorWhileLoadingFileOccurred
+from granular_configuration_language.yaml import loads
+from granular_configuration_language.yaml.load import _load_file, load_file
+
+DATA = {
+    "string": "text with \"quotes\", \\ slashes, / and 'single' quotes",
+    "unicode": "Ünïcödé ☃",
+    "escapes": "line\nbreak\ttab\r\b\f\u0001",
+    "looks_like_a_tag": "!Ref /int",
+    "looks_like_yaml": "yes",
+    "int": 42,
+    "negative": -7,
+    "zero": 0,
+    "big": 12345678901234567890123,
+    "float": 1.5,
+    "exponent": 1e300,
+    "negative_exponent": -2.5e-10,
+    "true": True,
+    "false": False,
+    "null": None,
+    "empty_mapping": {},
+    "empty_sequence": [],
+    "nested": {"a": [1, [2, [3, {"b": [4]}]]], "c": {"d": {"e": "f"}}},
+    "": "empty key",
+}
+
+
+def shape(value: typ.Any) -> typ.Any:
+    if isinstance(value, Configuration):
+        return (type(value), [(key, shape(item)) for key, item in value._raw_items()])
+    elif isinstance(value, list | tuple):
+        return (type(value), [shape(item) for item in value])
+    else:
+        return (type(value), value)
+
+
+def write(tmp_path: Path, text: str) -> Path:
+    file = tmp_path / "config.json"
+    file.write_text(text, encoding="utf-8")
+    return file
+
+
+def outcome(file: Path, mutable: bool) -> typ.Any:
+    try:
+        return shape(load_file(file, mutable=mutable))
+    except ErrorWhileLoadingFileOccurred as e:
+        return (type(e.__cause__), str(e.__cause__))
+
+
+def load_both(file: Path, mutable: bool) -> tuple[typ.Any, typ.Any]:
+    # The YAML path is used for any other file extension
+    yaml_file = file.with_suffix(".yaml")
+    yaml_file.write_bytes(file.read_bytes())
+    return outcome(file, mutable), outcome(yaml_file, mutable)
+
+
+def fail_yaml(*args: typ.Any, **kwargs: typ.Any) -> typ.NoReturn:
+    raise AssertionError("Expected the JSON path")
+
+
+@pytest.mark.parametrize("mutable", (False, True), ids=("immutable", "mutable"))
+@pytest.mark.parametrize(
+    "dump_options",
+    (
+        dict(),
+        dict(indent=2),
+        dict(separators=(",", ":")),
+        dict(ensure_ascii=False, indent=4),
+    ),
+    ids=("default", "indented", "compact", "unicode"),
+)
+def test_json_path_matches_yaml_path(tmp_path: Path, mutable: bool, dump_options: dict[str, typ.Any]) -> None:
+    file = write(tmp_path, json.dumps(DATA, **dump_options))
+
+    with patch.object(_load_file, "yaml_composer", fail_yaml):
+        from_json = load_file(file, mutable=mutable)
+
+    from_yaml = loads(file.read_text(encoding="utf-8"), mutable=mutable)
+
+    assert shape(from_json) == shape(from_yaml)
+    assert isinstance(from_json, MutableConfiguration if mutable else Configuration)
+
+
+@pytest.mark.parametrize("mutable", (False, True), ids=("immutable", "mutable"))
+@pytest.mark.parametrize("text", ('[1, [2, {"a": []}]]', '"just a string"', "3.25", "null"))
+def test_top_level_values(tmp_path: Path, mutable: bool, text: str) -> None:
+    from_json, from_yaml = load_both(write(tmp_path, text), mutable)
+
+    assert from_json == from_yaml
+
+
+@pytest.mark.parametrize(
+    "text",
+    (
+        '{"a": NaN, "b": Infinity}',
+        '{"a": "\\ud83d\\ude00"}',
+        '{"a"\n: 1}',
+        '{\t"a": 1}',
+        '{"a": "\u0085 \u2028 \u00a0"}',
+        "",
+    ),
+    ids=("constants", "surrogates", "line_break_before_colon", "tab", "special_characters", "empty"),
+)
+def test_text_yaml_could_read_differently_uses_yaml(tmp_path: Path, text: str) -> None:
+    from_json, from_yaml = load_both(write(tmp_path, text), False)
+
+    assert from_json == from_yaml
+
+
+def test_duplicate_keys_are_an_error(tmp_path: Path) -> None:
+    file = write(tmp_path, '{"a": 1, "a": 2}')
+
+    with pytest.raises(ErrorWhileLoadingFileOccurred, match="duplicate key"):
+        load_file(file, mutable=False)
+
+
+def test_parse_file_uses_the_json_path(tmp_path: Path) -> None:
+    write(tmp_path, json.dumps({"a": [1, 2], "b": {"c": "!Sub ${HOME}"}}))
+    (tmp_path / "root.yaml").write_text("parsed: !ParseFile config.json\n")
+
+    with patch.object(_load_file, "yaml_composer", wraps=_load_file.yaml_composer) as composer:
+        config = LazyLoadConfiguration(tmp_path / "root.yaml", tmp_path / "config.json").config
+        assert config.parsed == {"a": (1, 2), "b": {"c": "!Sub ${HOME}"}}
+
+    assert composer.call_count == 1  # Only `root.yaml`
+    assert config.a == (1, 2)
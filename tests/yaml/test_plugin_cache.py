@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from granular_configuration_language.yaml.decorators import _plugin_cache
+from granular_configuration_language.yaml.decorators._plugin_cache import PLUGIN_CACHE_DIR_ENV, discover_plugins
+from granular_configuration_language.yaml.decorators._tag_loader import load_tags
+
+
+def scan_fails() -> None:
+    raise AssertionError("Expected a cache hit")
+
+
+def discover(cache_dir: Path | None) -> _plugin_cache.PluginDiscovery:
+    with patch.dict(os.environ):
+        os.environ.pop(PLUGIN_CACHE_DIR_ENV, None)
+        if cache_dir is not None:
+            os.environ[PLUGIN_CACHE_DIR_ENV] = str(cache_dir)
+        return discover_plugins()
+
+
+def test_cache_is_opt_in() -> None:
+    discovery = discover(None)
+    assert ("official_extra", "granular_configuration_language.yaml._tags.func_and_class") in discovery.plugins
+    assert discovery.manifest is None
+    assert not discovery.from_cache
+
+
+def test_second_discovery_uses_the_cache(tmp_path: Path) -> None:
+    first = discover(tmp_path)
+    assert not first.from_cache
+    assert first.manifest is not None and first.manifest.parent == tmp_path
+
+    with patch.object(_plugin_cache, "_scan_entry_points", scan_fails):
+        second = discover(tmp_path)
+
+    assert second.from_cache
+    assert second.plugins == first.plugins
+
+
+def test_changed_site_directory_invalidates_the_cache(tmp_path: Path) -> None:
+    site = tmp_path / "site"
+    site.mkdir()
+
+    with patch.object(sys, "path", [*sys.path, str(site)]):
+        assert not discover(tmp_path).from_cache
+        assert discover(tmp_path).from_cache
+
+        (site / "new_distribution.dist-info").mkdir()
+        os.utime(site, ns=(0, 0))  # Modification times may be coarser than the test
+        assert not discover(tmp_path).from_cache
+        assert discover(tmp_path).from_cache
+
+
+def test_working_directory_changes_do_not_invalidate_the_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache_dir = tmp_path / "cache"
+    work = tmp_path / "work"
+    work.mkdir()
+    (work / "local.egg-info").mkdir()  # Even a working directory that holds a distribution
+    monkeypatch.chdir(work)
+
+    with patch.object(sys, "path", ["", *sys.path, str(work)]):
+        assert not discover(cache_dir).from_cache
+
+        (work / "output.txt").write_text("")
+        os.utime(work, ns=(0, 0))  # Modification times may be coarser than the test
+        assert discover(cache_dir).from_cache
+
+
+def test_unreadable_manifest_is_a_miss(tmp_path: Path) -> None:
+    manifest = discover(tmp_path).manifest
+    assert manifest is not None
+
+    manifest.write_text("{")
+    assert not discover(tmp_path).from_cache
+    assert json.loads(manifest.read_text())["plugins"]  # Rewritten
+
+
+def test_disabled_plugins_are_filtered_after_the_cache(tmp_path: Path) -> None:
+    discover(tmp_path)  # Writes the manifest
+    discovery = discover(tmp_path)
+    assert discovery.from_cache
+
+    assert load_tags(discovery=discovery).has_tags("!Func", "!Class")
+    with patch.dict(os.environ, values={"G_CONFIG_DISABLE_PLUGINS": "official_extra"}):
+        assert load_tags(discovery=discovery).does_not_have_tags("!Func", "!Class")
+
+
+def test_available_plugins_shows_discovery(tmp_path: Path) -> None:
+    def run() -> str:
+        return subprocess.check_output(
+            [sys.executable, "-m", "granular_configuration_language.available_plugins", "--discovery"],
+            env=os.environ | {PLUGIN_CACHE_DIR_ENV: str(tmp_path)},
+        ).decode()
+
+    assert run().startswith("Plugins discovered from entry points. Cached to:")
+    assert run().startswith("Plugins read from cache:")
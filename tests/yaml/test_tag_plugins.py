@@ -5,13 +5,19 @@ import os
 import subprocess
 import sys
 import typing as typ
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from granular_configuration_language.exceptions import ErrorWhileLoadingTags
 from granular_configuration_language.yaml._tags import handlers
-from granular_configuration_language.yaml.decorators._tag_loader import load_tags
+from granular_configuration_language.yaml.decorators._tag_loader import (
+    ModuleName,
+    PluginName,
+    get_tags_in_module,
+    load_tags,
+)
 from granular_configuration_language.yaml.decorators._tag_set import TagSet
 from granular_configuration_language.yaml.decorators._tag_tracker import tracker
 from granular_configuration_language.yaml.decorators._viewer import AvailablePlugins, AvailableTags, can_table
@@ -96,6 +102,58 @@ def test_trying_to_override_a_tag_errors() -> None:
         TagSet((tag, tag))
 
 
+def test_plugins_cannot_replace_a_built_in_tag() -> None:
+    ref = handlers.get("!Ref")
+    assert ref is not None
+
+    tags = TagSet((), registry={"!Ref": lambda: (ref,)}, plugins=[lambda: (ref,)])
+    with pytest.raises(ErrorWhileLoadingTags, match="Tag is already defined"):
+        tags.get("!Unknown")  # Imports the plugin first
+
+
+def test_built_in_tags_are_registered_by_module() -> None:
+    from importlib.util import resolve_name
+
+    import granular_configuration_language.yaml._tags as tags
+
+    modules = {path.stem for path in Path(tags.__file__).parent.glob("_*.py") if path.stem != "__init__"}
+    assert {module.removeprefix(".") for module in tags.BUILT_IN_TAGS.values()} == modules
+
+    for module in modules:
+        module_name = ModuleName(resolve_name("." + module, package=tags.__package__))
+        defined = {tc.tag for tc in get_tags_in_module(module_name, PluginName("test"))}
+        assert defined == {tag for tag, name in tags.BUILT_IN_TAGS.items() if name == "." + module}
+
+
+def test_tag_modules_are_imported_on_first_use() -> None:
+    script = """
+import sys
+from granular_configuration_language import LazyLoadConfiguration
+from granular_configuration_language.yaml import loads
+
+def imported():
+    return sorted(name.rpartition(".")[2] for name in sys.modules if ".yaml._tags." in name)
+
+assert imported() == [], imported()
+assert loads("a: !Env '{{HOME:home}}'\\nb: !Ref /a").b
+assert imported() == ["_env", "_ref"], imported()
+assert callable(loads("a: !Func json.dumps").a)
+assert imported() == ["_env", "_ref", "func_and_class"], imported()
+"""
+    subprocess.check_call([sys.executable, "-c", script])
+
+
+def test_unregistered_tags_import_plugins() -> None:
+    tags = load_tags()
+    assert "!Func" not in tags.registered_tags()
+    assert tags.get("!Unknown") is None
+    assert "!Func" in tags.registered_tags()
+
+    tags = load_tags(disable_tags={"!Ref"})
+    assert tags.get("!Ref") is None
+    assert "!Ref" not in tags
+
+
 TAGS_TO_TEST_WITH = ("!Del", "!Func", "!UUID", "!Merge", "!Sub", "!EagerParseFile")
 
 
@@ -382,7 +440,7 @@ def test_available_plugins_help() -> None:
         output
         == """\
 usage: python -m granular_configuration_language.available_plugins
-       [-h] [--long] [{csv,json,table}]
+       [-h] [--long] [--discovery] [{csv,json,table}]
 
 Shows available plugins
 
@@ -393,6 +451,7 @@ options:
   -h, --help        show this help message and exit
   --long, -l        In "table" mode, use long names. "Shortenings" lookup will
                     not print.
+  --discovery       Only print whether plugins were read from the plugin cache
 
 The "table" option requires `tabulate` to be installed. You can use the
 "printing" extra to install the needed dependencies
@@ -447,15 +506,16 @@ def test_available_plugins_help_can_table_false() -> None:
         output
         == """\
 usage: python -m granular_configuration_language.available_plugins
-       [-h] [{csv,json}]
+       [-h] [--discovery] [{csv,json}]
 
 Shows available plugins
 
 positional arguments:
-  {csv,json}  Mode, default={csv}
+  {csv,json}   Mode, default={csv}
 
 options:
-  -h, --help  show this help message and exit
+  -h, --help   show this help message and exit
+  --discovery  Only print whether plugins were read from the plugin cache
 
 The "table" option requires `tabulate` to be installed. You can use the
 "printing" extra to install the needed dependencies
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+import threading
+import typing as typ
+from unittest.mock import patch
+
+import pytest
+from ruamel.yaml import YAML
+from ruamel.yaml.parser import ParserError
+
+from granular_configuration_language import Configuration
+from granular_configuration_language.yaml import loads
+from granular_configuration_language.yaml.load import _yaml_pool
+
+
+def count_yaml_made(func: typ.Callable[[], object]) -> int:
+    made = 0
+    yaml_init = YAML.__init__
+
+    def counting_init(self: YAML, *args: typ.Any, **kwargs: typ.Any) -> None:
+        nonlocal made
+        made += 1
+        yaml_init(self, *args, **kwargs)
+
+    with patch.object(YAML, "__init__", counting_init):
+        func()
+    return made
+
+
+def parse() -> None:
+    config = loads("safe: !ParseEnvSafe TEST_YAML_POOL\ntagged: !ParseEnv TEST_YAML_POOL\n")
+    assert config.safe == {"a": 1}
+    assert config.tagged == Configuration(a=1)
+
+
+def test_instances_are_reused() -> None:
+    with patch.dict(os.environ, values={"TEST_YAML_POOL": "{a: 1}"}):
+        parse()  # Fills this thread's pool
+        assert count_yaml_made(parse) == 0
+
+
+def test_pools_are_per_thread() -> None:
+    made = list[int]()
+
+    def in_thread() -> None:
+        made.append(count_yaml_made(parse))
+
+    with patch.dict(os.environ, values={"TEST_YAML_POOL": "{a: 1}"}):
+        parse()
+        thread = threading.Thread(target=in_thread)
+        thread.start()
+        thread.join()
+
+    assert made[0] > 0
+
+
+def test_idle_instances_are_reset() -> None:
+    assert loads("a: !Ref /b\nb: c").a == "c"
+
+    idle = _yaml_pool._idle.instances
+    assert any(mode == "construct" for mode, _ in idle)
+    for (mode, _), yamls in idle.items():
+        for yaml in yamls:
+            assert not yaml.doc_infos
+            if mode == "construct":
+                assert yaml._StatefulYAML__state is None  # Does not keep the root alive
+
+
+def test_failed_instances_are_not_released() -> None:
+    _yaml_pool._idle.instances.clear()
+    with pytest.raises(ParserError):
+        loads("a: !Ref /b\nb: [")
+
+    assert not any(_yaml_pool._idle.instances.values())